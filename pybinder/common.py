@@ -66,3 +66,756 @@ PY_OPERATORS = {
     'operator>>': 'bits_right',
     'operator<<': 'bits_left'
 }
+
+# Buffer protocol support header
+BUFFER_HEADER = 'pyOCCT_Buffer.hxx'
+
+# NumPy support header of pybind11
+NUMPY_HEADER = 'pybind11/numpy.h'
+
+# String type casters header
+STRINGS_HEADER = 'pyOCCT_Strings.hxx'
+
+# String classes converted to and from Python str by the type casters
+STRING_CASTER_TYPES = ['TCollection_AsciiString', 'TCollection_ExtendedString']
+
+# Polymorphic type hook header for transient classes
+DOWNCAST_HEADER = 'pyOCCT_Downcast.hxx'
+
+# Mutex call guard header for serialized calls
+SERIALIZE_HEADER = 'pyOCCT_Serialize.hxx'
+
+# Submodule import header of the monolithic extension
+MONOLITHIC_HEADER = 'pyOCCT_Monolithic.hxx'
+
+# Registration timing header
+PROFILE_HEADER = 'pyOCCT_Profile.hxx'
+
+# Call counters header
+CALLS_HEADER = 'pyOCCT_Calls.hxx'
+
+# Symbol visibility header
+VISIBILITY_HEADER = 'pyOCCT_Visibility.hxx'
+
+# Build manifest of the extensions
+BUILD_MANIFEST = 'pyOCCT_Build.json'
+
+# Compiler flags hiding the symbols that are not explicitly exported
+VISIBILITY_FLAGS = {
+    'linux': ['-fvisibility=hidden', '-fvisibility-inlines-hidden'],
+    'darwin': ['-fvisibility=hidden', '-fvisibility-inlines-hidden'],
+    'win32': []
+}
+
+# Methods of contiguous arrays by number of dimensions
+BUFFER_METHODS = {
+    1: {'Lower', 'Length', 'Value'},
+    2: {'LowerRow', 'LowerCol', 'ColLength', 'RowLength', 'Value'}
+}
+
+BUFFER_TRAITS_SRC = """#include <cstring>
+#include <pybind11/numpy.h>
+
+// Element types that can be viewed as a block of scalars
+template <typename T, typename Enable = void>
+struct pyOCCT_BufferTraits {
+    static const bool is_bufferable = false;
+};
+
+template <typename T>
+struct pyOCCT_BufferTraits<T, typename std::enable_if<std::is_arithmetic<T>::value && !std::is_same<T, bool>::value>::type> {
+    typedef T scalar_type;
+    static const bool is_bufferable = true;
+    static const py::ssize_t size = 1;
+};
+
+"""
+
+BUFFER_SRC = """template <typename T>
+py::buffer_info pyOCCT_MakeBuffer(const T *, std::vector<py::ssize_t>, std::false_type) {
+    throw py::buffer_error("Array elements do not support the buffer protocol.");
+}
+
+template <typename T>
+py::buffer_info pyOCCT_MakeBuffer(const T *data, std::vector<py::ssize_t> shape, std::true_type) {
+    typedef pyOCCT_BufferTraits<T> traits;
+    typedef typename traits::scalar_type scalar_type;
+
+    // Row-major strides of the elements
+    std::vector<py::ssize_t> strides(shape.size());
+    py::ssize_t stride = sizeof(T);
+    for (size_t i = shape.size(); i-- > 0;) {
+        strides[i] = stride;
+        stride *= shape[i];
+    }
+
+    // Scalars of each element are the last dimension
+    if (traits::size > 1) {
+        shape.push_back(py::ssize_t(traits::size));
+        strides.push_back(sizeof(scalar_type));
+    }
+
+    void *ptr = const_cast<void *>(static_cast<const void *>(data));
+    return py::buffer_info(ptr, sizeof(scalar_type), py::format_descriptor<scalar_type>::format(), static_cast<py::ssize_t>(shape.size()), shape, strides);
+}
+
+// View of contiguous array data without copying
+template <typename T>
+py::buffer_info pyOCCT_Buffer(const T *data, std::vector<py::ssize_t> shape) {
+    return pyOCCT_MakeBuffer(data, shape, std::integral_constant<bool, pyOCCT_BufferTraits<T>::is_bufferable>());
+}
+
+"""
+
+VECTORIZE_SRC = """// Array of elements for vectorized calls with a trailing dimension for the
+// scalars of each element
+template <typename T>
+struct pyOCCT_Vector {
+    typedef pyOCCT_BufferTraits<T> traits;
+    typedef typename traits::scalar_type scalar_type;
+    typedef py::array_t<scalar_type, py::array::c_style | py::array::forcecast> array_type;
+
+    array_type array;
+    py::ssize_t n;
+
+    pyOCCT_Vector(array_type a) : array(a) {
+        static_assert(sizeof(T) == traits::size * sizeof(scalar_type), "Elements must be a contiguous block of scalars.");
+        py::ssize_t ndim = traits::size > 1 ? 2 : 1;
+        if (array.ndim() != ndim && array.ndim() != ndim - 1)
+            throw py::value_error("Array has the wrong number of dimensions.");
+        if (ndim == 2 && array.shape(array.ndim() - 1) != traits::size)
+            throw py::value_error("Array has the wrong number of scalars per element.");
+        n = array.ndim() == ndim ? array.shape(0) : 1;
+    }
+
+    explicit pyOCCT_Vector(py::ssize_t size) : n(size) {
+        std::vector<py::ssize_t> shape {size};
+        if (traits::size > 1)
+            shape.push_back(py::ssize_t(traits::size));
+        array = array_type(shape);
+    }
+
+    py::ssize_t size() const {
+        return n;
+    }
+
+    const T &operator[](py::ssize_t i) const {
+        return reinterpret_cast<const T *>(array.data())[n == 1 ? 0 : i];
+    }
+
+    void set(py::ssize_t i, const T &value) {
+        std::memcpy(array.mutable_data() + i * traits::size, &value, sizeof(T));
+    }
+};
+
+// Call a function for each element of the arrays and return the results as an
+// array. Arrays of a single element are broadcast. The guards are only
+// constructed around the loop (e.g., to release the GIL).
+template <typename... Guards, typename Func, typename... Args>
+py::array pyOCCT_Vectorize(Func f, const pyOCCT_Vector<Args> &... args) {
+    typedef typename std::decay<decltype(f(std::declval<const Args &>()...))>::type R;
+
+    py::ssize_t n = 1;
+    for (py::ssize_t size : {args.size()...}) {
+        if (size != 1 && n != 1 && size != n)
+            throw py::value_error("Arrays have different numbers of elements.");
+        if (size != 1)
+            n = size;
+    }
+
+    pyOCCT_Vector<R> result(n);
+    {
+        typename py::call_guard<Guards...>::type guard{};
+        for (py::ssize_t i = 0; i < n; ++i)
+            result.set(i, f(args[i]...));
+    }
+    return result.array;
+}
+
+"""
+
+STRING_CASTERS_SRC = """namespace pybind11 { namespace detail {
+
+// TCollection_AsciiString to and from str encoded as UTF-8
+template <>
+struct type_caster<TCollection_AsciiString> {
+    PYBIND11_TYPE_CASTER(TCollection_AsciiString, _("str"));
+
+    bool load(handle src, bool) {
+        if (!src || !PyUnicode_Check(src.ptr()))
+            return false;
+        const char *data = PyUnicode_AsUTF8(src.ptr());
+        if (!data) {
+            PyErr_Clear();
+            return false;
+        }
+        value = TCollection_AsciiString(data);
+        return true;
+    }
+
+    static handle cast(const TCollection_AsciiString &src, return_value_policy, handle) {
+        PyObject *result = PyUnicode_DecodeUTF8(src.ToCString(), src.Length(), nullptr);
+        if (!result)
+            throw error_already_set();
+        return result;
+    }
+};
+
+// TCollection_ExtendedString to and from str encoded as UTF-16
+template <>
+struct type_caster<TCollection_ExtendedString> {
+    PYBIND11_TYPE_CASTER(TCollection_ExtendedString, _("str"));
+
+    bool load(handle src, bool) {
+        if (!src || !PyUnicode_Check(src.ptr()))
+            return false;
+        const char *data = PyUnicode_AsUTF8(src.ptr());
+        if (!data) {
+            PyErr_Clear();
+            return false;
+        }
+        value = TCollection_ExtendedString(data, Standard_True);
+        return true;
+    }
+
+    static handle cast(const TCollection_ExtendedString &src, return_value_policy, handle) {
+        // Native byte order so a leading U+FEFF is kept rather than read as a BOM
+        int byteorder = PY_LITTLE_ENDIAN ? -1 : 1;
+        PyObject *result = PyUnicode_DecodeUTF16(reinterpret_cast<const char *>(src.ToExtString()), 2 * src.Length(), nullptr, &byteorder);
+        if (!result)
+            throw error_already_set();
+        return result;
+    }
+};
+
+}}
+
+"""
+
+SHARED_DATA_SRC = """#ifndef __pyOCCT_SharedData__
+#define __pyOCCT_SharedData__
+
+// Get or create data shared by all modules. The lookup and the insertion are
+// done under the lock of the pybind11 internals so concurrent initializations
+// agree on a single instance.
+template <typename T>
+T &pyOCCT_SharedData(const char *name) {
+    py::gil_scoped_acquire gil;
+    return *py::detail::with_internals([&](py::detail::internals &internals) {
+        void *&data = internals.shared_data[name];
+        if (!data)
+            data = new T();
+        return static_cast<T *>(data);
+    });
+}
+
+#endif
+
+"""
+
+DOWNCAST_SRC = """#include <typeinfo>
+#include <unordered_map>
+
+// Bound transient types by their OCCT type descriptor shared by all modules.
+// Each has the cast of an object to the address of the bound type. The first
+// registration of a descriptor is kept.
+struct pyOCCT_TransientType {
+    const std::type_info *type;
+    const void *(*cast)(const Standard_Transient *);
+};
+
+typedef std::unordered_map<const Standard_Type *, pyOCCT_TransientType> pyOCCT_TransientTypes;
+
+inline pyOCCT_TransientTypes &pyOCCT_GetTransientTypes() {
+    static pyOCCT_TransientTypes &types = pyOCCT_SharedData<pyOCCT_TransientTypes>("pyOCCT_TransientTypes");
+    return types;
+}
+
+template <typename T>
+const void *pyOCCT_CastTransient(const Standard_Transient *src) {
+    return dynamic_cast<const T *>(src);
+}
+
+template <typename T>
+void pyOCCT_RegisterTransient() {
+    pyOCCT_GetTransientTypes().emplace(STANDARD_TYPE(T).get(), pyOCCT_TransientType{&typeid(T), &pyOCCT_CastTransient<T>});
+}
+
+namespace pybind11 {
+
+// Return transient objects as their most derived bound type
+template <typename itype>
+struct polymorphic_type_hook<itype, detail::enable_if_t<std::is_base_of<Standard_Transient, itype>::value>> {
+    static const void *get(const itype *src, const std::type_info *&type) {
+        type = nullptr;
+        if (!src)
+            return src;
+        const pyOCCT_TransientTypes &types = pyOCCT_GetTransientTypes();
+        for (opencascade::handle<Standard_Type> t = src->DynamicType(); !t.IsNull(); t = t->Parent()) {
+            auto it = types.find(t.get());
+            if (it != types.end()) {
+                const void *dst = it->second.cast(src);
+                if (dst)
+                    type = it->second.type;
+                return dst ? dst : src;
+            }
+        }
+        return src;
+    }
+};
+
+}
+
+"""
+
+SERIALIZE_SRC = """#include <mutex>
+
+// Mutex shared by all modules
+inline std::recursive_mutex &pyOCCT_Mutex() {
+    static std::recursive_mutex &mutex = pyOCCT_SharedData<std::recursive_mutex>("pyOCCT_Mutex");
+    return mutex;
+}
+
+// Call guard that serializes calls that are not thread safe. It always
+// follows the release of the GIL so a thread never waits for the mutex while
+// holding the GIL.
+struct pyOCCT_Serialize {
+    std::lock_guard<std::recursive_mutex> lock;
+    pyOCCT_Serialize() : lock(pyOCCT_Mutex()) {}
+};
+
+"""
+
+MONOLITHIC_SRC = """// Get a submodule of the monolithic extension, initializing it on first use
+{hidden}py::module pyOCCT_Import(const std::string &name);
+
+"""
+
+VISIBILITY_SRC = """// Symbols of the bindings that are not exported by the extensions
+#if defined(_WIN32) || defined(__CYGWIN__)
+#define PYOCCT_HIDDEN
+#else
+#define PYOCCT_HIDDEN __attribute__((visibility("hidden")))
+#endif
+
+"""
+
+SUBMODULES_SRC = """#include <atomic>
+#include <map>
+#include <mutex>
+#include <tuple>
+
+// Submodules of the extension and their initialization functions
+struct pyOCCT_Submodule {
+    enum State { Uninitialized, Initializing, Initialized };
+
+    py::handle mod;
+    void (*init)(py::module &);
+    std::atomic<int> state;
+
+    pyOCCT_Submodule(py::handle mod, void (*init)(py::module &)) : mod(mod), init(init), state(Uninitialized) {}
+};
+
+static std::map<std::string, pyOCCT_Submodule> &pyOCCT_Submodules() {
+    static std::map<std::string, pyOCCT_Submodule> submodules;
+    return submodules;
+}
+
+py::module pyOCCT_Import(const std::string &name) {
+    pyOCCT_Submodule &sub = pyOCCT_Submodules().at(name);
+    py::module mod = py::reinterpret_borrow<py::module>(sub.mod);
+    if (sub.state.load(std::memory_order_acquire) == pyOCCT_Submodule::Initialized)
+        return mod;
+
+    // Submodules are initialized under a lock that is waited for without
+    // holding the GIL since the thread initializing a submodule may need it
+    static std::recursive_mutex mutex;
+    std::unique_lock<std::recursive_mutex> lock(mutex, std::defer_lock);
+    if (!lock.try_lock()) {
+        py::gil_scoped_release release;
+        lock.lock();
+    }
+
+    // A circular import by the initializing thread gets the partial submodule
+    if (sub.state.load(std::memory_order_acquire) != pyOCCT_Submodule::Uninitialized)
+        return mod;
+    sub.state.store(pyOCCT_Submodule::Initializing, std::memory_order_relaxed);
+    try {
+        sub.init(mod);
+    } catch (...) {
+        sub.state.store(pyOCCT_Submodule::Uninitialized, std::memory_order_relaxed);
+        throw;
+    }
+    sub.state.store(pyOCCT_Submodule::Initialized, std::memory_order_release);
+    return mod;
+}
+
+// Add a submodule that is registered in sys.modules but only initialized on
+// the first access of one of its attributes
+static void pyOCCT_AddSubmodule(py::module &m, const char *name, void (*init)(py::module &)) {
+    py::module mod = m.def_submodule(name);
+    py::module::import("sys").attr("modules")[mod.attr("__name__")] = mod;
+    pyOCCT_Submodules().emplace(std::piecewise_construct, std::forward_as_tuple(name), std::forward_as_tuple(mod, init));
+    std::string key(name);
+    std::string qname = py::str(mod.attr("__name__"));
+    mod.def("__getattr__", [key, qname](const std::string &attr) -> py::object {
+        // Special attributes looked up by the import system don't initialize
+        bool special = attr.size() > 4 && attr.compare(0, 2, "__") == 0 && attr != "__all__";
+        if (!special) {
+            py::dict attrs = pyOCCT_Import(key).attr("__dict__");
+            if (attrs.contains(attr))
+                return attrs[attr.c_str()];
+        }
+        throw py::attribute_error("module '" + qname + "' has no attribute '" + attr + "'");
+    });
+}
+
+"""
+
+PROFILE_SRC = """// Registration time of each binder of the modules. It is only recorded when
+// the extensions are compiled with PYOCCT_PROFILE defined, otherwise the
+// macros expand to nothing.
+#ifdef PYOCCT_PROFILE
+
+#include <chrono>
+
+struct pyOCCT_Profile {
+    py::list entries;
+    py::object allocated_blocks;
+    py::ssize_t blocks;
+    std::chrono::steady_clock::time_point start;
+
+    // The entries are shared with the other half of a split module
+    explicit pyOCCT_Profile(py::module &mod) {
+        if (!py::hasattr(mod, "__init_profile__")) {
+            py::list table;
+            mod.attr("__init_profile__") = table;
+            mod.def("_init_profile", [table]() { return table.attr("copy")(); }, "Get the name, registration time in seconds and number of allocated memory blocks of each binder.");
+        }
+        entries = mod.attr("__init_profile__");
+        allocated_blocks = py::module::import("sys").attr("getallocatedblocks");
+        reset();
+    }
+
+    void reset() {
+        blocks = allocated_blocks().cast<py::ssize_t>();
+        start = std::chrono::steady_clock::now();
+    }
+
+    // Record the time since the previous binder and start timing the next
+    void mark(const char *name) {
+        std::chrono::duration<double> elapsed = std::chrono::steady_clock::now() - start;
+        py::ssize_t allocated = allocated_blocks().cast<py::ssize_t>() - blocks;
+        entries.append(py::make_tuple(name, elapsed.count(), allocated));
+        reset();
+    }
+};
+
+#define PYOCCT_PROFILE_START(mod) pyOCCT_Profile pyOCCT_profile(mod)
+#define PYOCCT_PROFILE_MARK(name) pyOCCT_profile.mark(name)
+
+#else
+
+#define PYOCCT_PROFILE_START(mod)
+#define PYOCCT_PROFILE_MARK(name)
+
+#endif
+
+"""
+
+CALLS_SRC = """#include <atomic>
+#include <chrono>
+#include <deque>
+#include <initializer_list>
+
+// Number of calls of a binding and, if the extensions are compiled with
+// PYOCCT_CALL_TIMER defined, the time spent in them
+struct pyOCCT_CallStat {
+    const char *name;
+    std::atomic<unsigned long long> calls;
+    std::atomic<unsigned long long> nanoseconds;
+
+    explicit pyOCCT_CallStat(const char *name) : name(name), calls(0), nanoseconds(0) {}
+};
+
+// Call statistics of the module identified by the tag type
+template <typename Tag>
+std::deque<pyOCCT_CallStat> &pyOCCT_CallTable() {
+    static std::deque<pyOCCT_CallStat> table;
+    return table;
+}
+
+// Call guard counting the calls of the binding at an index of the table
+template <typename Tag, std::size_t N>
+struct pyOCCT_CallCounter {
+    pyOCCT_CallStat &stat;
+#ifdef PYOCCT_CALL_TIMER
+    std::chrono::steady_clock::time_point start;
+#endif
+
+    pyOCCT_CallCounter() : stat(pyOCCT_CallTable<Tag>()[N]) {
+        stat.calls.fetch_add(1, std::memory_order_relaxed);
+#ifdef PYOCCT_CALL_TIMER
+        start = std::chrono::steady_clock::now();
+#endif
+    }
+
+#ifdef PYOCCT_CALL_TIMER
+    ~pyOCCT_CallCounter() {
+        auto elapsed = std::chrono::steady_clock::now() - start;
+        stat.nanoseconds.fetch_add(std::chrono::duration_cast<std::chrono::nanoseconds>(elapsed).count(), std::memory_order_relaxed);
+    }
+#endif
+};
+
+// Fill the table with the names of the bindings and add the functions that
+// query and reset it
+template <typename Tag>
+void pyOCCT_BindCallStats(py::module &mod, std::initializer_list<const char *> names) {
+    std::deque<pyOCCT_CallStat> &table = pyOCCT_CallTable<Tag>();
+    for (const char *name : names)
+        table.emplace_back(name);
+
+    mod.def("_call_stats", []() {
+        py::list stats;
+        for (pyOCCT_CallStat &stat : pyOCCT_CallTable<Tag>()) {
+            unsigned long long calls = stat.calls.load(std::memory_order_relaxed);
+            if (calls)
+                stats.append(py::make_tuple(stat.name, calls, stat.nanoseconds.load(std::memory_order_relaxed) * 1e-9));
+        }
+        return stats;
+    }, "Get the name, number of calls and time in seconds spent in each called binding.");
+
+    mod.def("_reset_call_stats", []() {
+        for (pyOCCT_CallStat &stat : pyOCCT_CallTable<Tag>()) {
+            stat.calls.store(0, std::memory_order_relaxed);
+            stat.nanoseconds.store(0, std::memory_order_relaxed);
+        }
+    }, "Reset the call statistics.");
+}
+
+"""
+
+ARRAY_SRC = """// Contiguous elements of an array passed for a C array parameter or field
+template <typename T>
+struct pyOCCT_Array {
+    typedef pyOCCT_BufferTraits<T> traits;
+    typedef typename traits::scalar_type scalar_type;
+    typedef py::array_t<scalar_type, py::array::c_style | py::array::forcecast> array_type;
+    typedef py::array mutable_array_type;
+
+    // Shape of the scalars of a C array. The extent of the first dimension is
+    // unknown (0) for arrays of unknown bound, which must not be empty.
+    static std::vector<py::ssize_t> scalar_shape(std::vector<py::ssize_t> shape) {
+        static_assert(sizeof(T) == traits::size * sizeof(scalar_type), "Elements must be a contiguous block of scalars.");
+        if (traits::size > 1)
+            shape.push_back(py::ssize_t(traits::size));
+        return shape;
+    }
+
+    static void check_shape(const py::array &array, std::vector<py::ssize_t> shape) {
+        shape = scalar_shape(shape);
+        if (array.ndim() != static_cast<py::ssize_t>(shape.size()))
+            throw py::value_error("Array has the wrong number of dimensions.");
+        for (size_t i = 0; i < shape.size(); ++i) {
+            if (shape[i] && array.shape(i) != shape[i])
+                throw py::value_error("Array has the wrong shape.");
+        }
+        if (!shape[0] && !array.shape(0))
+            throw py::value_error("Array must not be empty.");
+    }
+
+    static const T *data(const array_type &array, std::vector<py::ssize_t> shape) {
+        check_shape(array, shape);
+        return reinterpret_cast<const T *>(array.data());
+    }
+
+    // Elements of an array that receives the output of a non-const parameter.
+    // It is used in place so it must already be writeable, C contiguous, and
+    // of the scalar type.
+    static T *mutable_data(mutable_array_type &array, std::vector<py::ssize_t> shape) {
+        if (!py::isinstance<py::array_t<scalar_type>>(array))
+            throw py::type_error("Array has the wrong data type.");
+        if (!(array.flags() & py::array::c_style))
+            throw py::value_error("Array must be C contiguous.");
+        if (!array.writeable())
+            throw py::value_error("Array must be writeable.");
+        check_shape(array, shape);
+        return reinterpret_cast<T *>(array.mutable_data());
+    }
+
+    // Array viewing the C array member of an object that it keeps alive
+    static array_type view(const void *ptr, std::vector<py::ssize_t> shape, py::handle base, bool writeable) {
+        array_type result(scalar_shape(shape), static_cast<const scalar_type *>(ptr), base);
+        if (!writeable)
+            result.attr("flags").attr("writeable") = false;
+        return result;
+    }
+
+    // Copy the elements of an array into a C array member
+    static void assign(void *ptr, const array_type &array, std::vector<py::ssize_t> shape) {
+        py::ssize_t n = 1;
+        for (py::ssize_t extent : shape)
+            n *= extent;
+        std::memcpy(ptr, data(array, shape), n * sizeof(T));
+    }
+};
+
+"""
+
+BULK_SRC = """// Copy the elements of a container to a list in one call
+template <typename C, typename T, typename... Extra>
+void pyOCCT_BindToList(py::object obj, const Extra &... extra) {
+    py::class_<C> cls = obj;
+    cls.def("to_list", [](const C &self) {
+        py::list items;
+        for (const T &item : self)
+            items.append(py::cast(item));
+        return items;
+    }, "Copy the elements to a list.", extra...);
+}
+
+// Copy the elements of a container to an array in one call
+template <typename C, typename T, typename... Extra>
+void pyOCCT_BindToNumpy(py::object obj, const Extra &... extra) {
+    py::class_<C> cls = obj;
+    cls.def("to_numpy", [](const C &self) {
+        py::ssize_t n = 0;
+        for (auto it = self.begin(); it != self.end(); ++it)
+            ++n;
+        pyOCCT_Vector<T> result(n);
+        py::ssize_t i = 0;
+        for (const T &item : self)
+            result.set(i++, item);
+        return result.array;
+    }, "Copy the elements to an array.", extra...);
+}
+
+// Construct a container from the elements of an array
+template <typename C, typename T, typename Add, typename... Extra>
+void pyOCCT_BindFromNumpy(py::object obj, Add add, const Extra &... extra) {
+    py::class_<C> cls = obj;
+    cls.def(py::init([add](typename pyOCCT_Vector<T>::array_type array) {
+        pyOCCT_Vector<T> items(array);
+        C *self = new C();
+        for (py::ssize_t i = 0; i < items.size(); ++i)
+            add(*self, items[i]);
+        return self;
+    }), py::arg("items"), extra...);
+}
+
+// Construct a container from the elements of a Python sequence
+template <typename C, typename T, typename Add, typename... Extra>
+void pyOCCT_BindFromList(py::object obj, Add add, const Extra &... extra) {
+    py::class_<C> cls = obj;
+    cls.def(py::init([add](py::iterable items) {
+        C *self = new C();
+        for (py::handle item : items)
+            add(*self, item.cast<T>());
+        return self;
+    }), py::arg("items"), extra...);
+}
+
+"""
+
+DOCS_LOADER_SRC = '''"""
+Docstrings of the lean {package} modules loaded on demand from a compressed
+index instead of being compiled into the extensions.
+"""
+import gzip
+import importlib
+import json
+import os
+
+_index = None
+
+
+def index():
+    """
+    :return: The docstrings by module and qualified name.
+    :rtype: dict
+    """
+    global _index
+    if _index is None:
+        fname = os.path.join(os.path.dirname(__file__), '_docs.json.gz')
+        with gzip.open(fname, 'rt', encoding='utf-8') as fin:
+            _index = json.load(fin)
+    return _index
+
+
+def get(name):
+    """
+    Get a docstring by its qualified name.
+    :param str name: The qualified name (e.g., "gp.gp_Pnt.Distance").
+    :return: The docstring or *None* if not found.
+    :rtype: str or None
+    """
+    mod_name, _, key = name.partition('.')
+    return index().get(mod_name, dict()).get(key)
+
+
+def load(*mod_names):
+    """
+    Attach the docstrings to the classes of the modules. The docstrings of
+    functions are read-only and are available through get().
+    :param str mod_names: The module names. If none are given all modules
+        in the index are used.
+    :return: None.
+    """
+    docs = index()
+    for mod_name in mod_names or docs:
+        mod = importlib.import_module('{package}.' + mod_name)
+        for key, doc in docs.get(mod_name, dict()).items():
+            obj = mod
+            for part in key.split('.'):
+                obj = getattr(obj, part, None)
+            if isinstance(obj, type):
+                try:
+                    obj.__doc__ = doc
+                except (AttributeError, TypeError):
+                    pass
+'''
+
+PACKAGE_INIT_SRC = '''"""
+Python bindings to the OpenCASCADE geometry kernel. The extension modules are
+imported on first access so importing the package itself is cheap.
+"""
+import importlib
+
+__all__ = [{modules}]
+{dependencies}
+
+def __getattr__(name):
+    if name in __all__:
+        return importlib.import_module('.' + name, __name__)
+    raise AttributeError(
+        'module {{!r}} has no attribute {{!r}}'.format(__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+'''
+
+PACKAGE_DEPENDENCIES_SRC = '''
+# Modules imported by each module when it is initialized
+_dependencies = {{{table}}}
+
+
+def dependencies(name):
+    """
+    Get the modules imported by a module, directly or through the modules it
+    imports.
+    :param str name: The module name.
+    :return: The module names.
+    :rtype: list(str)
+    """
+    found = set()
+    stack = [name]
+    while stack:
+        for dep in _dependencies.get(stack.pop(), []):
+            if dep not in found:
+                found.add(dep)
+                stack.append(dep)
+    found.discard(name)
+    return sorted(found)
+'''
@@ -17,18 +17,33 @@
 # You should have received a copy of the GNU Lesser General Public
 # License along with this library; if not, write to the Free Software
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301 USA
+import gzip
+import json
 import os
 import re
 import sys
 import warnings
 from collections import OrderedDict
 from ctypes import c_uint
+from fnmatch import fnmatchcase
+from string import ascii_lowercase
 
 from clang.cindex import (AccessSpecifier, Index, TranslationUnit,
                           CursorKind, TypeKind, Cursor)
 
 from pybinder import clangext
-from pybinder.common import SRC_PREFIX, PY_OPERATORS
+from pybinder.common import (SRC_PREFIX, PY_OPERATORS, BUFFER_HEADER,
+                             BUFFER_METHODS, BUFFER_TRAITS_SRC, BUFFER_SRC,
+                             VECTORIZE_SRC, ARRAY_SRC, BULK_SRC,
+                             DOCS_LOADER_SRC, STRINGS_HEADER,
+                             STRING_CASTER_TYPES, STRING_CASTERS_SRC,
+                             DOWNCAST_HEADER, DOWNCAST_SRC, SERIALIZE_HEADER,
+                             SERIALIZE_SRC, SHARED_DATA_SRC, MONOLITHIC_HEADER,
+                             MONOLITHIC_SRC, SUBMODULES_SRC, VISIBILITY_HEADER,
+                             VISIBILITY_SRC, VISIBILITY_FLAGS, BUILD_MANIFEST,
+                             PACKAGE_INIT_SRC, PACKAGE_DEPENDENCIES_SRC,
+                             PROFILE_HEADER, PROFILE_SRC, CALLS_HEADER,
+                             CALLS_SRC, NUMPY_HEADER)
 
 # Patches for libclang
 clangext.monkeypatch_cursor('get_specialization',
@@ -108,6 +123,7 @@ class Generator(object):
     nodelete = set()
     nested_classes = set()
     downcast_classes = set()
+    downcast_hook = False
     skipped = set()
     immutable = set()
     split = set()
@@ -126,6 +142,39 @@ class Generator(object):
     return_policies = dict()
     before_module = dict()
 
+    explicit_templates = False
+    template_instances = OrderedDict()
+    register_templates = False
+    template_owners = OrderedDict()
+    noconvert = set()
+    implicit_types = set()
+    release_gil = set()
+    free_threaded = False
+    serialize = set()
+    monolithic = False
+    hidden_visibility = False
+    package_init = False
+    package_dependencies = False
+    init_profile = False
+    call_counters = False
+    usage = set()
+    buffers = set()
+    vectorize = set()
+    bulk = set()
+    collect = set()
+    lazy_imports = False
+    string_casters = False
+    current_module = None
+    reduce_imports = False
+    lean = set()
+    no_signatures = set()
+    docs_index = OrderedDict()
+    pickle = dict()
+    excluded_pickle = set()
+    hashes = dict()
+    excluded_hash = set()
+    std_hashes = set()
+
     _mods = OrderedDict()
 
     def __init__(self, available_mods, occt_include_dir, *includes):
@@ -199,6 +248,9 @@ class Generator(object):
                     if line.startswith('#'):
                         continue
 
+                    # Types with implicit conversions registered manually
+                    self.implicit_types.update(implicit_targets(line))
+
                     # Include directory
                     if line.startswith('+include'):
                         line = line.replace('+include', '')
@@ -263,6 +315,20 @@ class Generator(object):
                         self.excluded_functions.add(line)
                         continue
 
+                    # Excluded pickle support
+                    if line.startswith('-pickle'):
+                        line = line.replace('-pickle', '')
+                        line = line.strip()
+                        self.excluded_pickle.add(line)
+                        continue
+
+                    # Excluded hash support
+                    if line.startswith('-hash'):
+                        line = line.replace('-hash', '')
+                        line = line.strip()
+                        self.excluded_hash.add(line)
+                        continue
+
                     # Excluded enums
                     if line.startswith('-enum'):
                         line = line.replace('-enum', '')
@@ -379,13 +445,140 @@ class Generator(object):
                         qname, mod = line.split('-->', 1)
                         qname = qname.strip()
                         mod = mod.strip()
-                        txt = 'py::call_guard<Import{}>()'.format(mod)
+                        txt = 'Import{}'.format(mod)
                         if qname in self.call_guards:
                             self.call_guards[qname].append(txt)
                         else:
                             self.call_guards[qname] = [txt]
                         continue
 
+                    # Release the GIL
+                    if line.startswith('+release_gil'):
+                        line = line.replace('+release_gil', '')
+                        line = line.strip()
+                        self.release_gil.add(line)
+                        continue
+
+                    # Free-threaded Python support
+                    if line.startswith('+free_threaded'):
+                        Generator.free_threaded = True
+                        continue
+
+                    # Single extension with the modules as submodules
+                    if line.startswith('+monolithic'):
+                        Generator.monolithic = True
+                        continue
+
+                    # Counters of the calls of each binding
+                    if line.startswith('+call_counters'):
+                        Generator.call_counters = True
+                        continue
+
+                    # Timing of the registration of each binder
+                    if line.startswith('+init_profile'):
+                        Generator.init_profile = True
+                        continue
+
+                    # Package __init__.py importing the modules on demand
+                    if line.startswith('+package_init'):
+                        Generator.package_init = True
+                        continue
+
+                    if line.startswith('+package_dependencies'):
+                        Generator.package_init = True
+                        Generator.package_dependencies = True
+                        continue
+
+                    # Export only the module initialization functions
+                    if line.startswith('+hidden_visibility'):
+                        Generator.hidden_visibility = True
+                        continue
+
+                    # Serialized calls
+                    if line.startswith('+serialize'):
+                        line = line.replace('+serialize', '')
+                        line = line.strip()
+                        self.serialize.add(line)
+                        continue
+
+                    # Buffer protocol
+                    if line.startswith('+buffer'):
+                        line = line.replace('+buffer', '')
+                        line = line.strip()
+                        self.buffers.add(line)
+                        continue
+
+                    # Vectorized overloads
+                    if line.startswith('+vectorize'):
+                        line = line.replace('+vectorize', '')
+                        line = line.strip()
+                        self.vectorize.add(line)
+                        continue
+
+                    # Lazy imports
+                    if line.startswith('+lazy_imports'):
+                        Generator.lazy_imports = True
+                        continue
+
+                    # String classes converted to and from str
+                    if line.startswith('+string_casters'):
+                        Generator.string_casters = True
+                        self.immutable.update(STRING_CASTER_TYPES)
+                        continue
+
+                    # Pickle serializers
+                    if line.startswith('+pickle'):
+                        line = line.replace('+pickle', '')
+                        line = line.strip()
+                        qname, funcs = line.split('-->', 1)
+                        getstate, setstate = funcs.split(',')
+                        self.pickle[qname.strip()] = (getstate.strip(),
+                                                      setstate.strip())
+                        continue
+
+                    # Hash and equality functions
+                    if line.startswith('+hash'):
+                        line = line.replace('+hash', '')
+                        line = line.strip()
+                        qname, funcs = line.split('-->', 1)
+                        hash_, eq = funcs.split(',')
+                        self.hashes[qname.strip()] = (hash_.strip(),
+                                                      eq.strip())
+                        continue
+
+                    # Lean modules
+                    if line.startswith('+lean'):
+                        line = line.replace('+lean', '')
+                        line = line.strip()
+                        self.lean.add(line)
+                        continue
+
+                    # Disable function signatures in docstrings
+                    if line.startswith('+no_signatures'):
+                        line = line.replace('+no_signatures', '')
+                        line = line.strip()
+                        self.no_signatures.add(line)
+                        continue
+
+                    # Transitive reduction of imports
+                    if line.startswith('+reduce_imports'):
+                        Generator.reduce_imports = True
+                        continue
+
+                    # Bulk conversions
+                    if line.startswith('+bulk'):
+                        line = line.replace('+bulk', '')
+                        line = line.strip()
+                        self.bulk.add(line)
+                        continue
+
+                    # Draining explorers into a list
+                    if line.startswith('+collect'):
+                        line = line.replace('+collect', '')
+                        line = line.strip()
+                        self.collect.add(line)
+                        continue
+
                     # Keep alive
                     if line.startswith('+keep_alive'):
                         line = line.replace('+keep_alive', '')
@@ -401,6 +594,11 @@ class Generator(object):
                         self.nested_classes.add(line)
                         continue
 
+                    # Polymorphic type hook
+                    if line.startswith('+downcast_hook'):
+                        Generator.downcast_hook = True
+                        continue
+
                     if line.startswith('+downcast'):
                         line = line.replace('+downcast', '')
                         line = line.strip()
@@ -454,6 +652,23 @@ class Generator(object):
                         self.split.add(line)
                         continue
 
+                    # Explicit instantiation of class template binders
+                    if line.startswith('+explicit_templates'):
+                        Generator.explicit_templates = True
+                        continue
+
+                    # Bind template specializations once across modules
+                    if line.startswith('+template_registry'):
+                        Generator.register_templates = True
+                        continue
+
+                    # Overloads that only match without conversions
+                    if line.startswith('+noconvert'):
+                        line = line.replace('+noconvert', '')
+                        line = line.strip()
+                        self.noconvert.add(line)
+                        continue
+
                     # Replace text in file
                     if line.startswith('+patch'):
                         line = line.replace('+patch', '')
@@ -483,6 +698,24 @@ class Generator(object):
                     i = line_number + 1
                     raise RuntimeError(f"Error in config at line {i}: {e}")
 
+    def process_usage(self, fn):
+        """
+        Process a usage profile with the qualified names of the classes,
+        methods, and functions to bind (e.g., "gp_Pnt::Distance"). Only these
+        and the declarations they need are bound. Names may use shell-style
+        wildcards and only the first column of each line is read so the
+        output of the call counters can be used. Fields are always bound with
+        their classes.
+        :param str fn: The file.
+        :return: None.
+        """
+        with open(fn, 'r') as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith('#'):
+                    continue
+                self.usage.add(line.split()[0])
+
     def parse(self, file_):
         """
         Parse the main include file.
@@ -587,6 +820,19 @@ class Generator(object):
                 macro = MacroForHandle(macro, type1, type2)
                 available_macros[type1] = macro
 
+        # Gather the types with a std::hash specialization
+        for binder in self.tu_binder.get_children_of_kind(
+                CursorKind.NAMESPACE):
+            if binder.spelling != 'std':
+                continue
+            for item in binder.get_children_of_kind(CursorKind.STRUCT_DECL):
+                if item.spelling != 'hash' or not item.is_definition:
+                    continue
+                if item.type.type.get_num_template_arguments() != 1:
+                    continue
+                type_ = item.type.type.get_template_argument_type(0)
+                self.std_hashes.add(type_.get_canonical().spelling)
+
         # What to bind
         to_bind = []
         if self.bind_enums:
@@ -660,6 +906,12 @@ class Generator(object):
                 logger.write(msg)
                 continue
 
+            # Skip string classes converted by type casters
+            if self.string_casters and qname in STRING_CASTER_TYPES:
+                msg = '\tUsing str for {}.\n'.format(qname)
+                logger.write(msg)
+                continue
+
             # Check for anon/untagged enum
             if not qname and binder.is_enum:
                 qname = binder.type.spelling
@@ -746,6 +998,117 @@ class Generator(object):
             logger.write(txt)
         logger.write('done.\n\n')
 
+        if self.usage:
+            self.prune_usage()
+
+    def usage_closure(self, usage):
+        """
+        Find the declarations needed to bind the used classes, methods, and
+        functions by following the type references of the base classes,
+        fields, and signatures. Classes that are only needed by other
+        declarations are bound without their unused methods.
+        :param collections.Iterable(str) usage: The qualified names which may
+            use shell-style wildcards.
+        :return: The keys of the needed declarations (see usage_key()) and the
+            qualified names of the unused methods and constructors as they are
+            excluded.
+        :rtype: tuple(set(str), set(str))
+        """
+        # Declarations by key and canonical spelling of classes and typedefs
+        decls = OrderedDict()
+        for mod in self.modules:
+            for binder in mod.enums + mod.funcs + mod.types + mod.templates:
+                keys = [usage_key(binder)]
+                if binder.is_class or binder.is_typedef:
+                    keys.append(binder.type.get_canonical().spelling)
+                for key in keys:
+                    binders = decls.setdefault(key, [])
+                    if binder not in binders:
+                        binders.append(binder)
+
+        # Used declarations and the classes of the used members
+        full = {key for key in decls if match_qname(key, usage)}
+        owners = set()
+        for pattern in usage:
+            parts = pattern.split('::')
+            for i in range(1, len(parts)):
+                owners.add('::'.join(parts[:i]))
+        stack = [key for key in decls if key in full or
+                 match_qname(key, owners)]
+
+        kept = set()
+        unused = set()
+        while stack:
+            key = stack.pop()
+            if key in kept:
+                continue
+            kept.add(key)
+
+            refs = set()
+            for binder in decls[key]:
+                if binder.is_function:
+                    for arg in binder.parameters:
+                        refs.update(type_declarations(arg.type))
+                    refs.update(type_declarations(binder.rtype))
+                elif binder.is_typedef:
+                    type_ = binder.type.get_canonical()
+                    refs.update(type_declarations(type_))
+                    if type_.is_record:
+                        template = type_.get_declaration().get_specialization()
+                        if template.is_class_template:
+                            refs.add(template.qualified_name)
+                elif binder.is_class:
+                    classes = [(binder, key in full)]
+                    while classes:
+                        cls, is_full = classes.pop()
+                        for base in cls.bases:
+                            refs.update(type_declarations(base.type))
+                        for item in cls.fields:
+                            refs.update(type_declarations(item.type))
+                        for item in cls.ctors + cls.methods:
+                            qname = item.qualified_name
+                            if not is_full and not match_qname(qname, usage):
+                                if item.is_static_method:
+                                    qname += '_'
+                                unused.add(qname)
+                                continue
+                            for arg in item.parameters:
+                                refs.update(type_declarations(arg.type))
+                            refs.update(type_declarations(item.rtype))
+                        for item in cls.nested_classes:
+                            classes.append((item, is_full))
+
+            for ref in refs:
+                if ref in decls and ref not in kept:
+                    stack.append(ref)
+
+        return kept, unused
+
+    def prune_usage(self):
+        """
+        Prune the declarations and members that are not needed by the usage
+        profile.
+        :return: None.
+        """
+        logger.write('Pruning unused declarations...\n')
+        kept, unused = self.usage_closure(self.usage)
+        for mod in self.modules:
+            for name in ('enums', 'funcs', 'types', 'templates'):
+                binders = []
+                for binder in getattr(mod, name):
+                    if usage_key(binder) in kept:
+                        binders.append(binder)
+                    else:
+                        msg = '\tPruning unused {}\n'.format(usage_key(binder))
+                        logger.write(msg)
+                setattr(mod, name, binders)
+
+        for qname in sorted(unused):
+            msg = '\tPruning unused member {}\n'.format(qname)
+            logger.write(msg)
+        self.excluded_functions.update(unused)
+        logger.write('done.\n\n')
+
     def build_includes(self):
         """
         Build include files for the modules.
@@ -807,141 +1170,823 @@ class Generator(object):
         :param str path: Path to write sub-folders.
         :return:
         """
+        # Defer imports only needed for argument and return types. This is
+        # done after the template registry since re-exported templates don't
+        # need their owner to be imported eagerly.
+        if self.lazy_imports:
+            logger.write('Building lazy imports...\n')
+            for mod in self.modules:
+                mod.build_lazy_imports()
+            logger.write('done.\n\n')
+
+        if self.reduce_imports:
+            self.reduce_module_imports()
+
         logger.write('Binding types...\n')
         for mod in self.modules:
             mod.bind(path)
         logger.write('done.\n\n')
 
-    def bind_templates(self, path):
+        if self.docs_index:
+            self.bind_docs(path)
+
+        if self.explicit_templates:
+            self.bind_template_instances(path)
+
+        if self.monolithic:
+            self.bind_monolithic(path)
+
+        if self.hidden_visibility:
+            self.bind_manifest(path)
+
+        # The monolithic extension is the package itself
+        if self.package_init and not self.monolithic:
+            self.bind_package_init(path)
+
+    def bind_monolithic(self, path):
         """
-        Bind the library.
-        :param str path: Path to write sub-folders.
-        :return:
+        Write the source of the single extension that adds each module as a
+        submodule. The submodules are initialized on first use by the
+        functions defined in the source files of the modules, which are
+        compiled separately and linked into the extension.
+        :param str path: Path to write the file.
+        :return: None.
         """
-        logger.write('Binding templates...\n')
+        logger.write('Binding monolithic extension...\n')
+        if not os.path.isdir(path):
+            os.makedirs(path)
+
+        src = []
+        for inc in common_includes():
+            src.append('#include <{}>\n'.format(inc))
+        src.append('\n')
+        src.append(SUBMODULES_SRC)
+
+        # Initialization functions of the modules
+        src.append('// Functions of the submodules\n')
         for mod in self.modules:
-            mod.bind_templates(path)
+            src.append('{}void init_{}(py::module &);\n'.format(hidden(),
+                                                              mod.name))
+        src.append('\n')
+
+        if self.free_threaded:
+            src.append(
+                'PYBIND11_MODULE({}, m, py::mod_gil_not_used()) {{\n\n'.format(
+                    self.package_name))
+        else:
+            src.append('PYBIND11_MODULE({}, m) {{\n\n'.format(
+                self.package_name))
+        for mod in self.modules:
+            src.append('pyOCCT_AddSubmodule(m, \"{0}\", &init_{0});\n'.format(
+                mod.name))
+        src.append('\n}\n')
+
+        fname = '/'.join([path, self.package_name + '.cxx'])
+        fout = open(fname, 'w')
+        fout.write(SRC_PREFIX)
+        fout.writelines(src)
+        fout.close()
         logger.write('done.\n\n')
 
-    def is_module(self, name):
+    def bind_manifest(self, path):
         """
-        Check if the name is an available module.
-        :param str name: The name.
-        :return: *True* if an available module, *False* otherwise.
-        :rtype: bool
+        Write the linker export files of each extension and a manifest with
+        their sources and the flags that hide all symbols but the module
+        initialization function.
+        :param str path: Path to write the files.
+        :return: None.
         """
-        return name in self._mods
+        logger.write('Binding build manifest...\n')
+        exports_path = '/'.join([path, 'exports'])
+        if not os.path.isdir(exports_path):
+            os.makedirs(exports_path)
+
+        # The extensions and their sources
+        if self.monolithic:
+            sources = [self.package_name + '.cxx']
+            for mod in self.modules:
+                for fname in mod.sources:
+                    if fname not in sources:
+                        sources.append(fname)
+            extensions = [(self.package_name, sources)]
+        else:
+            extensions = [(mod.name, mod.sources) for mod in self.modules]
+
+        manifest = {
+            'package': self.package_name,
+            'compile_flags': VISIBILITY_FLAGS,
+            'extensions': []
+        }
+        for name, sources in extensions:
+            symbol = 'PyInit_' + name
+
+            # Version script of GNU ld and exported symbols of the macOS linker
+            version_script = 'exports/{}.map'.format(name)
+            fout = open('/'.join([path, version_script]), 'w')
+            fout.write('{\n')
+            fout.write('\tglobal: {};\n'.format(symbol))
+            fout.write('\tlocal: *;\n')
+            fout.write('};\n')
+            fout.close()
 
-    def check_circular(self):
+            symbols_list = 'exports/{}.exp'.format(name)
+            fout = open('/'.join([path, symbols_list]), 'w')
+            fout.write('_{}\n'.format(symbol))
+            fout.close()
+
+            manifest['extensions'].append({
+                'name': name,
+                'sources': sources,
+                'export': symbol,
+                'link_flags': {
+                    'linux': ['-Wl,--version-script=' + version_script],
+                    'darwin': ['-Wl,-exported_symbols_list,' + symbols_list],
+                    'win32': []
+                }
+            })
+
+        fname = '/'.join([path, BUILD_MANIFEST])
+        with open(fname, 'w') as fout:
+            json.dump(manifest, fout, indent=4, sort_keys=True)
+            fout.write('\n')
+        logger.write('done.\n\n')
+
+    def bind_package_init(self, path):
         """
-        Check for circular imports.
+        Write the __init__.py of the package that imports the modules on
+        first access and optionally lists the modules each one imports.
+        :param str path: Path to write the file.
         :return: None.
         """
-        logger.write('Finding circular imports...\n')
-        mods = self.modules
-        for i, mod1 in enumerate(mods):
-            for mod2 in mods[i + 1:-1]:
-                if mod1.is_circular(mod2):
-                    name1, name2 = mod1.name, mod2.name
-                    msg = '\tFound circular import: {} <--> {}\n'.format(name1,
-                                                                         name2)
-                    logger.write(msg)
+        logger.write('Binding package init...\n')
+        if not os.path.isdir(path):
+            os.makedirs(path)
 
-    @classmethod
-    def get_module(cls, name):
-        """
-        Get a module by name or return a new one.
-        :param str name: Module name.
-        :return: The existing module or new one.
-        :rtype: binder.core.Module
-        """
-        if name not in Generator.available_mods:
-            return None
+        modules = sorted(mod.name for mod in self.modules)
+        modules_src = ''.join(['\n    {!r},'.format(name) for name in modules])
 
-        try:
-            return cls._mods[name]
-        except KeyError:
-            mod = Module(name)
-            cls._mods[name] = mod
-            return mod
+        dependencies_src = ''
+        if self.package_dependencies:
+            table = []
+            for mod in sorted(self.modules, key=lambda m: m.name):
+                imports = sorted(set(mod.imports) - {mod.name})
+                table.append('\n    {!r}: {!r},'.format(mod.name, imports))
+            dependencies_src = PACKAGE_DEPENDENCIES_SRC.format(
+                table=''.join(table) + '\n')
 
+        fname = '/'.join([path, '__init__.py'])
+        fout = open(fname, 'w')
+        fout.write(PACKAGE_INIT_SRC.format(modules=modules_src + '\n',
+                                           dependencies=dependencies_src))
+        fout.close()
+        logger.write('done.\n\n')
 
-class Module(object):
-    """
-    Module class containing binders.
-    :param str name: Module name.
-    :ivar str name: Module name.
-    :ivar list(str) includes: List of relevant include files for this module.
-    :ivar list(binder.core.CursorBinder) enums: List of binders around
-        enumerations.
-    :ivar list(binder.core.CursorBinder) funcs: List of binders around
-        functions.
-    :ivar list(binder.core.CursorBinder) classes: List of binders around
-        classes.
-    :ivar list(binder.core.CursorBinder) typedefs: List of binders around
-        typedefs.
-    :ivar list(binder.core.CursorBinder) templates: List of binders around
-        class templates.
-    :ivar list(binder.core.Module) imports: List of other modules to import.
-    :ivar list(binder.core.CursorBinder) sorted_binders: List of binders after
-        sorting.
-    """
+    def bind_docs(self, path):
+        """
+        Write the docstrings of the lean modules to a compressed index and
+        the Python module that loads them on demand.
+        :param str path: Path to write the files.
+        :return: None.
+        """
+        logger.write('Binding docs...\n')
+        fname = '/'.join([path, '_docs.json.gz'])
+        with gzip.open(fname, 'wt', encoding='utf-8') as fout:
+            json.dump(self.docs_index, fout, sort_keys=True)
 
-    def __init__(self, name):
-        self.name = name
+        fname = '/'.join([path, '_docs.py'])
+        fout = open(fname, 'w')
+        fout.write(DOCS_LOADER_SRC.format(package=self.package_name))
+        fout.close()
+        logger.write('done.\n\n')
 
-        self.enums = []
-        self.funcs = []
-        self.types = []
-        self.templates = []
+    def reduce_module_imports(self):
+        """
+        Remove the imports of each module that are already imported by
+        another of its eager imports (i.e., a transitive reduction of the
+        import graph). Only eager imports are followed since guarded imports
+        don't run when the module is initialized, and a path may not go back
+        through the module itself since it is only partially initialized.
+        Edges are removed one at a time so every module that was reachable,
+        including the modules of base classes, stays reachable and is
+        imported before the module registers its types.
+        :return: None.
+        """
+        logger.write('Reducing imports...\n')
+        graph = OrderedDict()
+        for mod in self.modules:
+            graph[mod.name] = mod.eager_imports
 
-        self.sorted_binders = []
+        for mod in self.modules:
+            imports = graph[mod.name]
+            for other in list(imports):
+                for name in imports:
+                    if name == other:
+                        continue
+                    if other in self._reachable(graph, name, mod.name):
+                        imports.remove(other)
+                        msg = '\tRemoved import: {} --> {} (via {})\n'.format(
+                            mod.name, other, name)
+                        logger.write(msg)
+                        break
+
+            # Also drop guarded imports that are always imported eagerly
+            reachable = set()
+            for name in imports:
+                reachable.update(self._reachable(graph, name, mod.name))
+            for other in list(mod.lazy_imports):
+                if other in reachable:
+                    mod.lazy_imports.remove(other)
+                    msg = '\tRemoved lazy import: {} --> {}\n'.format(
+                        mod.name, other)
+                    logger.write(msg)
 
-        self.includes = []
-        self.imports = []
+            mod.imports = [name for name in mod.imports if
+                           name in imports or name not in mod.eager_imports]
+        logger.write('done.\n\n')
 
-    def __repr__(self):
-        return 'Module: {}'.format(self.name)
+    @staticmethod
+    def _reachable(graph, start, excluded):
+        """
+        Find the modules imported by a module when it is initialized.
+        :param dict graph: The eager imports of each module.
+        :param str start: The module name.
+        :param str excluded: A module name whose imports are not followed.
+        :return: The module names including the start.
+        :rtype: set(str)
+        """
+        visited = set()
+        stack = [start]
+        while stack:
+            name = stack.pop()
+            if name in visited:
+                continue
+            visited.add(name)
+            if name == excluded:
+                continue
+            stack.extend(graph.get(name, []))
+        return visited
 
-    def sort_binders(self):
+    def bind_template_instances(self, path):
         """
-        Sort class binders so they are ordered based on their base
-        classes.
+        Write a source file for each class template binder that explicitly
+        instantiates all of its specializations used by the modules. The
+        modules only declare these specializations so they are compiled once.
+        :param str path: Path to write the source files.
         :return: None.
         """
-        # Sort enums based on their file location. Sometimes multiple enums are
-        # defined in a single file, so group them together.
-        file2enum = {}
-        for enum in self.enums:
-            if enum.filename in file2enum:
-                master = file2enum[enum.filename]
-                master.grouped_binders.append(enum)
-                enum.skip = True
-            else:
-                file2enum[enum.filename] = enum
-                self.sorted_binders.append(enum)
+        logger.write('Binding template instances...\n')
+        path = '/'.join([path, 'instances'])
+        if not os.path.isdir(path):
+            os.makedirs(path)
 
-        # Sort functions by their name. They may be overloaded so group them
-        # together.
-        spelling2func = {}
-        for func in self.funcs:
-            if func.spelling in spelling2func:
-                master = spelling2func[func.spelling]
-                master.grouped_binders.append(func)
-                func.skip = True
-            else:
-                spelling2func[func.spelling] = func
-                self.sorted_binders.append(func)
+        for bind_name, instances in self.template_instances.items():
+            if bind_name not in self.available_templates:
+                continue
 
-        # Bind types
-        self.sorted_binders += self.types
+            # Include files for all the specializations
+            includes = common_includes()
+            for incs in instances.values():
+                for inc in incs:
+                    if inc not in includes:
+                        includes.append(inc)
+            includes.append(bind_name + '.hxx')
 
-        # binders1 = list(self.classes)
-        # canonical2original = {}
-        # # Use canonical for typedefs
-        # for binder in self.typedefs:
-        #     ut = binder.underlying_typedef_type
-        #     binders1.append(ut.get_canonical().get_declaration())
+            fname = '/'.join([path, bind_name + '.cxx'])
+            fout = open(fname, 'w')
+            fout.write(SRC_PREFIX)
+            for inc in includes:
+                fout.write('#include <{}>\n'.format(inc))
+            fout.write('\n')
+            for spelling in instances:
+                msg = '\tInstantiating {}.\n'.format(spelling)
+                logger.write(msg)
+                fout.write(template_instance(bind_name, spelling))
+            fout.close()
+        logger.write('done.\n\n')
+
+    def bind_templates(self, path):
+        """
+        Bind the library.
+        :param str path: Path to write sub-folders.
+        :return:
+        """
+        if self.register_templates:
+            self.build_template_registry()
+
+        logger.write('Binding templates...\n')
+        for mod in self.modules:
+            mod.bind_templates(path)
+        logger.write('done.\n\n')
+
+        if self.buffers or self.vectorize or self.bulk or self.has_arrays:
+            self.bind_buffer_traits(path)
+
+        if self.string_casters:
+            self.bind_string_casters(path)
+
+        if self.downcast_hook:
+            self.bind_downcast_hook(path)
+
+        if self.serialize:
+            self.bind_serialize_guard(path)
+
+        if self.monolithic:
+            self.bind_monolithic_header(path)
+
+        if self.hidden_visibility:
+            self.bind_visibility_header(path)
+
+        if self.init_profile:
+            self.bind_profile_header(path)
+
+        if self.call_counters:
+            self.bind_calls_header(path)
+
+    @property
+    def has_arrays(self):
+        """
+        :return: Check if any binder passes C arrays as NumPy arrays.
+        :rtype: bool
+        """
+        for mod in self.modules:
+            for binder in mod.funcs + mod.types:
+                if binder.has_arrays:
+                    return True
+        return False
+
+    def bind_string_casters(self, path):
+        """
+        Write the header with the type casters that convert the OCCT string
+        classes to and from Python str. It is included by every source file
+        so the casters are used consistently.
+        :param str path: Path to write the header.
+        :return: None.
+        """
+        logger.write('Binding string casters...\n')
+        if not os.path.isdir(path):
+            os.makedirs(path)
+
+        src = [
+            '#ifndef __pyOCCT_Strings__\n',
+            '#define __pyOCCT_Strings__\n\n',
+            '#include <pyOCCT_Common.hxx>\n'
+        ]
+        for name in STRING_CASTER_TYPES:
+            src.append('#include <{}.hxx>\n'.format(name))
+        src.append('\n')
+        src.append(STRING_CASTERS_SRC)
+        src.append('#endif')
+
+        fname = '/'.join([path, STRINGS_HEADER])
+        fout = open(fname, 'w')
+        fout.write(SRC_PREFIX)
+        fout.writelines(src)
+        fout.close()
+        logger.write('done.\n\n')
+
+    def bind_downcast_hook(self, path):
+        """
+        Write the header with the polymorphic type hook that returns transient
+        objects as their most derived bound type. The bound types are found by
+        walking the OCCT type descriptors from the dynamic type of the object
+        so unbound types come back as their nearest bound base. It is included
+        by every source file so the hook is used consistently.
+        :param str path: Path to write the header.
+        :return: None.
+        """
+        logger.write('Binding downcast hook...\n')
+        if not os.path.isdir(path):
+            os.makedirs(path)
+
+        src = [
+            '#ifndef __pyOCCT_Downcast__\n',
+            '#define __pyOCCT_Downcast__\n\n',
+            '#include <pyOCCT_Common.hxx>\n',
+            '#include <Standard_Transient.hxx>\n',
+            '#include <Standard_Type.hxx>\n\n'
+        ]
+        src.append(SHARED_DATA_SRC)
+        src.append(DOWNCAST_SRC)
+        src.append('#endif')
+
+        fname = '/'.join([path, DOWNCAST_HEADER])
+        fout = open(fname, 'w')
+        fout.write(SRC_PREFIX)
+        fout.writelines(src)
+        fout.close()
+        logger.write('done.\n\n')
+
+    def bind_serialize_guard(self, path):
+        """
+        Write the header with the call guard that serializes the configured
+        calls behind a mutex shared by all modules. It is included by every
+        source file.
+        :param str path: Path to write the header.
+        :return: None.
+        """
+        logger.write('Binding serialize guard...\n')
+        if not os.path.isdir(path):
+            os.makedirs(path)
+
+        src = [
+            '#ifndef __pyOCCT_Serialize__\n',
+            '#define __pyOCCT_Serialize__\n\n',
+            '#include <pyOCCT_Common.hxx>\n\n'
+        ]
+        src.append(SHARED_DATA_SRC)
+        src.append(SERIALIZE_SRC)
+        src.append('#endif')
+
+        fname = '/'.join([path, SERIALIZE_HEADER])
+        fout = open(fname, 'w')
+        fout.write(SRC_PREFIX)
+        fout.writelines(src)
+        fout.close()
+        logger.write('done.\n\n')
+
+    def bind_calls_header(self, path):
+        """
+        Write the header with the call guard that counts the calls of each
+        binding. It is included by every source file. Every function, method,
+        and constructor binding is counted, including the vectorized, pickle,
+        hash, iterator, and bulk conversion bindings. Fields are not counted.
+        They are bound with their class, which is needed by some counted
+        binding.
+        :param str path: Path to write the header.
+        :return: None.
+        """
+        logger.write('Binding call counters...\n')
+        if not os.path.isdir(path):
+            os.makedirs(path)
+
+        src = [
+            '#ifndef __pyOCCT_Calls__\n',
+            '#define __pyOCCT_Calls__\n\n',
+            '#include <pyOCCT_Common.hxx>\n\n'
+        ]
+        src.append(CALLS_SRC)
+        src.append('#endif')
+
+        fname = '/'.join([path, CALLS_HEADER])
+        fout = open(fname, 'w')
+        fout.write(SRC_PREFIX)
+        fout.writelines(src)
+        fout.close()
+        logger.write('done.\n\n')
+
+    def bind_profile_header(self, path):
+        """
+        Write the header with the macros that time the registration of each
+        binder. It is included by every source file.
+        :param str path: Path to write the header.
+        :return: None.
+        """
+        logger.write('Binding profile header...\n')
+        if not os.path.isdir(path):
+            os.makedirs(path)
+
+        src = [
+            '#ifndef __pyOCCT_Profile__\n',
+            '#define __pyOCCT_Profile__\n\n',
+            '#include <pyOCCT_Common.hxx>\n\n'
+        ]
+        src.append(PROFILE_SRC)
+        src.append('#endif')
+
+        fname = '/'.join([path, PROFILE_HEADER])
+        fout = open(fname, 'w')
+        fout.write(SRC_PREFIX)
+        fout.writelines(src)
+        fout.close()
+        logger.write('done.\n\n')
+
+    def bind_visibility_header(self, path):
+        """
+        Write the header that defines the annotation of hidden declarations.
+        It is included by every source file.
+        :param str path: Path to write the header.
+        :return: None.
+        """
+        logger.write('Binding visibility header...\n')
+        if not os.path.isdir(path):
+            os.makedirs(path)
+
+        src = [
+            '#ifndef __pyOCCT_Visibility__\n',
+            '#define __pyOCCT_Visibility__\n\n',
+            '#include <pyOCCT_Common.hxx>\n\n'
+        ]
+        src.append(VISIBILITY_SRC)
+        src.append('#endif')
+
+        fname = '/'.join([path, VISIBILITY_HEADER])
+        fout = open(fname, 'w')
+        fout.write(SRC_PREFIX)
+        fout.writelines(src)
+        fout.close()
+        logger.write('done.\n\n')
+
+    def bind_monolithic_header(self, path):
+        """
+        Write the header that declares the import of the submodules of the
+        monolithic extension. It is included by every source file.
+        :param str path: Path to write the header.
+        :return: None.
+        """
+        logger.write('Binding monolithic header...\n')
+        if not os.path.isdir(path):
+            os.makedirs(path)
+
+        src = [
+            '#ifndef __pyOCCT_Monolithic__\n',
+            '#define __pyOCCT_Monolithic__\n\n',
+            '#include <pyOCCT_Common.hxx>\n\n'
+        ]
+        src.append(MONOLITHIC_SRC.format(hidden=hidden()))
+        src.append('#endif')
+
+        fname = '/'.join([path, MONOLITHIC_HEADER])
+        fout = open(fname, 'w')
+        fout.write(SRC_PREFIX)
+        fout.writelines(src)
+        fout.close()
+        logger.write('done.\n\n')
+
+    def bind_buffer_traits(self, path):
+        """
+        Write the header that describes the element types of the arrays
+        exposed through the buffer protocol, passed to vectorized overloads or
+        for C arrays, or copied by bulk conversions. Arithmetic types are a single scalar and
+        classes that are a contiguous block of a single arithmetic type (e.g.,
+        gp_XYZ) are a row of scalars. Other classes registered as a NumPy
+        dtype are their own scalar type.
+        :param str path: Path to write the header.
+        :return: None.
+        """
+        logger.write('Binding buffer traits...\n')
+        if not os.path.isdir(path):
+            os.makedirs(path)
+
+        includes = common_includes()
+        traits = []
+        for mod in self.modules:
+            for binder in mod.types:
+                if not binder.is_class or binder.is_excluded:
+                    continue
+                layout = binder.buffer_layout
+                # Structured arrays of a NumPy dtype
+                if layout is None and binder.dtype_fields:
+                    layout = binder.qualified_name, 1
+                if layout is None:
+                    continue
+                msg = '\tBuffer traits for {}: {}[{}].\n'.format(
+                    binder.qualified_name, *layout)
+                logger.write(msg)
+                if binder.filename not in includes:
+                    includes.append(binder.filename)
+                traits.append((binder.qualified_name,) + layout)
+
+        src = [
+            '#ifndef __pyOCCT_Buffer__\n',
+            '#define __pyOCCT_Buffer__\n\n'
+        ]
+        for inc in includes:
+            src.append('#include <{}>\n'.format(inc))
+        src.append('\n')
+
+        src.append(BUFFER_TRAITS_SRC)
+        for qname, scalar, size in traits:
+            src.append(
+                'template <>\n'
+                'struct pyOCCT_BufferTraits<{}> {{\n'
+                '    typedef {} scalar_type;\n'
+                '    static const bool is_bufferable = true;\n'
+                '    static const py::ssize_t size = {};\n'
+                '}};\n\n'.format(qname, scalar, size))
+        src.append(BUFFER_SRC)
+        src.append(VECTORIZE_SRC)
+        src.append(ARRAY_SRC)
+        src.append(BULK_SRC)
+        src.append('#endif')
+
+        fname = '/'.join([path, BUFFER_HEADER])
+        fout = open(fname, 'w')
+        fout.write(SRC_PREFIX)
+        fout.writelines(src)
+        fout.close()
+        logger.write('done.\n\n')
+
+    def build_template_registry(self):
+        """
+        Assign each class template specialization bound by a typedef to a
+        single owning module. Typedefs in other modules re-export the type
+        from the owner if they already depend on it or bind it as module local
+        otherwise. Class template binders that are not used by any module are
+        not generated.
+        :return: None.
+        """
+        logger.write('Building template registry...\n')
+
+        # Group typedefs by their canonical specialization
+        users = OrderedDict()
+        for mod in self.modules:
+            for binder in mod.types:
+                if not binder.is_typedef or binder.is_excluded:
+                    continue
+                alias = binder.alias
+                if alias is not None and binder.module_name == alias.module_name:
+                    continue
+                type_ = binder.type.get_canonical()
+                if not type_.is_record or type_.spelling.startswith('std::vector'):
+                    continue
+                decl = type_.get_declaration()
+                if not decl.get_specialization().is_class_template:
+                    continue
+                users.setdefault(type_.spelling, []).append(binder)
+
+        used_templates = set()
+        for spelling, binders in users.items():
+            # The owner is the module most of the other modules depend on
+            mods = [self.get_module(b.module_name) for b in binders]
+            ndeps = [sum(other.is_dependent(mod) for other in mods if other is not mod)
+                     for mod in mods]
+            owner = binders[ndeps.index(max(ndeps))]
+            owner.alias = None
+            Generator.template_owners[spelling] = owner
+            msg = '\tOwner of {}: {}\n'.format(spelling, owner.module_name)
+            logger.write(msg)
+
+            decl = owner.type.get_canonical().get_declaration()
+            used_templates.add('bind_{}'.format(decl.spelling))
+
+            # Re-export from the owner if it is already imported. Otherwise
+            # the type is bound as module local since only the owner may
+            # register it globally.
+            owner_mod = self.get_module(owner.module_name)
+            for binder, mod in zip(binders, mods):
+                if binder is owner:
+                    continue
+                binder.alias = owner
+                if mod is not owner_mod and mod.is_dependent(owner_mod):
+                    binder.owner = owner
+                    msg = '\tRe-exporting {} from {}\n'.format(
+                        binder.qualified_name, owner.module_name)
+                    logger.write(msg)
+
+        # Prune class templates that are not used
+        for mod in self.modules:
+            templates = []
+            for binder in mod.templates:
+                if 'bind_{}'.format(binder.python_name) in used_templates:
+                    templates.append(binder)
+                else:
+                    msg = '\tPruning class template {}\n'.format(
+                        binder.qualified_name)
+                    logger.write(msg)
+            mod.templates = templates
+
+        logger.write('done.\n\n')
+
+    def is_module(self, name):
+        """
+        Check if the name is an available module.
+        :param str name: The name.
+        :return: *True* if an available module, *False* otherwise.
+        :rtype: bool
+        """
+        return name in self._mods
+
+    def check_circular(self):
+        """
+        Check for circular imports.
+        :return: None.
+        """
+        logger.write('Finding circular imports...\n')
+        mods = self.modules
+        for i, mod1 in enumerate(mods):
+            for mod2 in mods[i + 1:-1]:
+                if mod1.is_circular(mod2):
+                    name1, name2 = mod1.name, mod2.name
+                    msg = '\tFound circular import: {} <--> {}\n'.format(name1,
+                                                                         name2)
+                    logger.write(msg)
+
+    @classmethod
+    def get_module(cls, name):
+        """
+        Get a module by name or return a new one.
+        :param str name: Module name.
+        :return: The existing module or new one.
+        :rtype: binder.core.Module
+        """
+        if name not in Generator.available_mods:
+            return None
+
+        try:
+            return cls._mods[name]
+        except KeyError:
+            mod = Module(name)
+            cls._mods[name] = mod
+            return mod
+
+
+class Module(object):
+    """
+    Module class containing binders.
+    :param str name: Module name.
+    :ivar str name: Module name.
+    :ivar list(str) includes: List of relevant include files for this module.
+    :ivar list(binder.core.CursorBinder) enums: List of binders around
+        enumerations.
+    :ivar list(binder.core.CursorBinder) funcs: List of binders around
+        functions.
+    :ivar list(binder.core.CursorBinder) classes: List of binders around
+        classes.
+    :ivar list(binder.core.CursorBinder) typedefs: List of binders around
+        typedefs.
+    :ivar list(binder.core.CursorBinder) templates: List of binders around
+        class templates.
+    :ivar list(binder.core.Module) imports: List of other modules to import.
+    :ivar list(str) lazy_imports: List of other modules to import on first
+        use.
+    :ivar list(binder.core.CursorBinder) sorted_binders: List of binders after
+        sorting.
+    """
+
+    def __init__(self, name):
+        self.name = name
+
+        self.enums = []
+        self.funcs = []
+        self.types = []
+        self.templates = []
+
+        self.sorted_binders = []
+
+        self.includes = []
+        self.imports = []
+        self.lazy_imports = []
+        self.instances = set()
+        self.call_stats = []
+
+    def __repr__(self):
+        return 'Module: {}'.format(self.name)
+
+    @property
+    def sources(self):
+        """
+        :return: The source files of the module relative to the output path.
+            Explicit template instances are included since their symbols are
+            hidden in each extension.
+        :rtype: list(str)
+        """
+        sources = [self.name + '.cxx']
+        if self.name in Generator.split:
+            sources.append(self.name + '_2.cxx')
+        for bind_name in sorted(self.instances):
+            if bind_name in Generator.available_templates:
+                sources.append('instances/{}.cxx'.format(bind_name))
+        return sources
+
+    def sort_binders(self):
+        """
+        Sort class binders so they are ordered based on their base
+        classes.
+        :return: None.
+        """
+        # Sort enums based on their file location. Sometimes multiple enums are
+        # defined in a single file, so group them together.
+        file2enum = {}
+        for enum in self.enums:
+            if enum.filename in file2enum:
+                master = file2enum[enum.filename]
+                master.grouped_binders.append(enum)
+                enum.skip = True
+            else:
+                file2enum[enum.filename] = enum
+                self.sorted_binders.append(enum)
+
+        # Sort functions by their name. They may be overloaded so group them
+        # together.
+        spelling2func = {}
+        for func in self.funcs:
+            if func.spelling in spelling2func:
+                master = spelling2func[func.spelling]
+                master.grouped_binders.append(func)
+                func.skip = True
+            else:
+                spelling2func[func.spelling] = func
+                self.sorted_binders.append(func)
+
+        # Bind types
+        self.sorted_binders += self.types
+
+        # binders1 = list(self.classes)
+        # canonical2original = {}
+        # # Use canonical for typedefs
+        # for binder in self.typedefs:
+        #     ut = binder.underlying_typedef_type
+        #     binders1.append(ut.get_canonical().get_declaration())
         #     canonical2original[binders1[-1]] = binder
         #
         # binders2 = [b.qualified_name for b in binders1]
@@ -984,7 +2029,7 @@ class Module(object):
         Build list of include files for the module.
         :return: None.
         """
-        self.includes = ['pyOCCT_Common.hxx']
+        self.includes = common_includes()
 
         # Excluded headers per module
         minus_headers = set()
@@ -1013,6 +2058,79 @@ class Module(object):
                             f not in Generator.excluded_headers):
                         self.includes.append(f)
 
+    @property
+    def is_lean(self):
+        """
+        :return: *True* if the module is generated without docstrings and
+            commented out code, *False* otherwise.
+        :rtype: bool
+        """
+        return match_qname(self.name, Generator.lean)
+
+    def build_docs(self):
+        """
+        Build the docstrings of the module by their qualified Python name.
+        :return: The docstrings.
+        :rtype: collections.OrderedDict
+        """
+        index = OrderedDict()
+        for binder in self.sorted_binders:
+            for binder_ in [binder] + binder.grouped_binders:
+                if binder_.is_excluded:
+                    continue
+                if binder_.is_enum or binder_.is_function:
+                    add_docs(index, binder_.python_name, binder_.docstring)
+                elif binder_.is_class:
+                    name = Generator.python_names.get(binder_.qualified_name,
+                                                      binder_.python_name)
+                    class_docs(index, binder_, name)
+                elif binder_.is_typedef and binder_.owner is None and (
+                        binder_.alias is None or
+                        binder_.alias.module_name != binder_.module_name):
+                    type_ = binder_.type.get_canonical()
+                    if not type_.is_record:
+                        continue
+                    decl = type_.get_declaration()
+                    template = decl.get_specialization()
+                    if template.is_class_template:
+                        decl = template
+                    class_docs(index, decl, binder_.python_name)
+        return index
+
+    @property
+    def eager_imports(self):
+        """
+        :return: List of other modules imported when the module is
+            initialized.
+        :rtype: list(str)
+        """
+        guarded = Generator.import_guards.get(self.name, set())
+        return [name for name in self.imports if
+                name not in guarded and name not in self.lazy_imports and
+                name != self.name]
+
+    def build_lazy_imports(self):
+        """
+        Find the imports that are only needed for argument and return types.
+        These are imported by a call guard the first time a function
+        returning one of their types is called. Imports needed for base
+        classes, fields, default values, and template arguments stay eager
+        since their types must be registered when the module is initialized.
+        :return: None.
+        """
+        eager = set()
+        for binder in self.sorted_binders:
+            for binder_ in [binder] + binder.grouped_binders:
+                eager.update(binder_.eager_modules)
+
+        self.lazy_imports = []
+        for mod_name in self.imports:
+            if mod_name in eager:
+                continue
+            msg = '\tLazy import: {} --> {}\n'.format(self.name, mod_name)
+            logger.write(msg)
+            self.lazy_imports.append(mod_name)
+
     def is_dependent(self, other):
         """
         Check to see if the this module is dependent on the other module based on their imports.
@@ -1073,6 +2191,11 @@ class Module(object):
         # Check if module is split
         is_split = self.name in Generator.split
 
+        # Check if module is lean
+        is_lean = self.is_lean
+        if is_lean:
+            Generator.docs_index[self.name] = self.build_docs()
+
         fout = open(fname, 'w')
 
         # File header
@@ -1081,15 +2204,20 @@ class Module(object):
         # Generate binding source and headers
         binders = self.sorted_binders
         extra_headers = []
+        Generator.current_module = self
         for binder in binders:
             headers = binder.bind(path)
             if headers:
                 extra_headers += headers
+        Generator.current_module = None
 
-        # Write include files
+        # Write include files. Import guards remember their import.
         used_includes = set()
         inc_src = []
-        for inc in self.includes + extra_headers:
+        includes = self.includes + extra_headers
+        if self.lazy_imports or Generator.import_guards.get(self.name):
+            includes.append('atomic')
+        for inc in includes:
             if inc in used_includes:
                 continue
             used_includes.add(inc)
@@ -1098,15 +2226,39 @@ class Module(object):
             inc_src.append(line)
         fout.write('\n')
 
-        # Write opaque types
-        has_opaque = False
+        # Write opaque types and declarations of template instances
+        opaque_src = []
         for binder in binders:
             for opaque in binder.opaque:
-                has_opaque = True
                 fout.write(opaque)
-        if has_opaque:
+                opaque_src.append(opaque)
+        if opaque_src:
             fout.write('\n')
 
+        # Import guards
+        guarded = sorted(Generator.import_guards.get(self.name, []))
+        for mod_name in self.lazy_imports:
+            if mod_name not in guarded:
+                guarded.append(mod_name)
+        guard_src = []
+        for mod_name in guarded:
+            guard_src += [
+                'struct Import{}{{\n'.format(mod_name),
+                '\tImport{}() {{\n'.format(mod_name),
+                '\t\tstatic std::atomic<bool> imported(false);\n',
+                '\t\tif (!imported.load(std::memory_order_acquire)) {\n',
+                '\t\t\t{};\n'.format(import_module(mod_name)),
+                '\t\t\timported.store(true, std::memory_order_release);\n',
+                '\t\t}\n',
+                '\t}\n',
+                '};\n\n'
+            ]
+
+        # Tag of the call statistics table of the module
+        if self.call_stats:
+            guard_src.append('struct pyOCCT_Calls_{};\n\n'.format(self.name))
+        fout.writelines(guard_src)
+
         # Write manual text before module
         before_mod_src = []
         if self.name in Generator.before_module:
@@ -1118,31 +2270,54 @@ class Module(object):
         # Write split function signature
         if is_split:
             fout.write('// Functions for split modules\n')
-            fout.write('void bind_{}_2(py::module&);\n\n'.format(self.name))
+            fout.write('{}void bind_{}_2(py::module&);\n\n'.format(
+                hidden(), self.name))
 
         # Initialize
-        fout.write('PYBIND11_MODULE({}, mod) {{\n\n'.format(self.name))
+        if Generator.monolithic:
+            fout.write('{}void init_{}(py::module &mod) {{\n\n'.format(
+                hidden(), self.name))
+        elif Generator.free_threaded:
+            fout.write(
+                'PYBIND11_MODULE({}, mod, py::mod_gil_not_used()) {{\n\n'.format(
+                    self.name))
+        else:
+            fout.write('PYBIND11_MODULE({}, mod) {{\n\n'.format(self.name))
+
+        # Options
+        options_src = []
+        if match_qname(self.name, Generator.no_signatures):
+            options_src = [
+                'py::options options;\n',
+                'options.disable_function_signatures();\n\n'
+            ]
+        fout.writelines(options_src)
+
+        # Create the mutex of serialized calls while the GIL is held
+        if Generator.serialize:
+            fout.write('pyOCCT_Mutex();\n\n')
+
+        # Start timing the registration with the imports
+        if Generator.init_profile:
+            fout.write('PYOCCT_PROFILE_START(mod);\n\n')
 
         # Import other modules
-        has_guards = self.name in Generator.import_guards
-        guarded = set()
-        if has_guards:
-            guarded = Generator.import_guards[self.name]
         for mod_name in self.imports:
             if mod_name in guarded:
                 continue
             if mod_name != self.name:
-                fout.write('py::module::import(\"{}.{}\");\n'.format(
-                    Generator.package_name, mod_name))
+                fout.write('{};\n'.format(import_module(mod_name)))
         fout.write('\n')
+        if Generator.init_profile:
+            fout.write('PYOCCT_PROFILE_MARK(\"(imports)\");\n\n')
 
-        # Import guards
-        for mod_name in guarded:
-            fout.write('struct Import{}{{\n'.format(mod_name))
-            fout.write(
-                '\tImport{}() {{ py::module::import(\"{}.{}\"); }}\n'.format(
-                    mod_name, Generator.package_name, mod_name))
-            fout.write('};\n\n')
+        # Call statistics of the bindings
+        if self.call_stats:
+            fout.write('pyOCCT_BindCallStats<pyOCCT_Calls_{}>(mod, {{\n'.format(
+                self.name))
+            names = ['\t\"{}\"'.format(name) for name in self.call_stats]
+            fout.write(',\n'.join(names))
+            fout.write('\n});\n\n')
 
         # If the module is split in two, only bind half and save the rest for another file
         split_binders = []
@@ -1151,14 +2326,16 @@ class Module(object):
             binders, split_binders = binders[:indx], binders[indx:]
 
         # Main bind loop
-        src = []
-        for binder in binders:
-            src.extend(binder.src)
+        src = binders_src(binders)
 
         # Patch the file
         # TODO: Line Number is off
         patch_src(self.name, src)
 
+        # Remove dead code
+        if is_lean:
+            src = strip_dead_code(src)
+
         # Write it out
         for line in src:
             fout.write(line)
@@ -1185,25 +2362,39 @@ class Module(object):
             fout.writelines(inc_src)
             fout.write('\n')
 
+            # Duplicate opaque types and declarations of template instances
+            if opaque_src:
+                fout.writelines(opaque_src)
+                fout.write('\n')
+
+            # Duplicate import guards
+            fout.writelines(guard_src)
+
             # Duplicate text before module
             if before_mod_src:
                 fout.writelines(before_mod_src)
                 fout.write('\n\n')
 
             # Function signature
-            line = 'void bind_{}_2(py::module &mod)\n'.format(self.name)
+            line = '{}void bind_{}_2(py::module &mod)\n'.format(hidden(),
+                                                                self.name)
             fout.write(line)
             fout.write('{\n\n')
+            fout.writelines(options_src)
+            if Generator.init_profile:
+                fout.write('PYOCCT_PROFILE_START(mod);\n\n')
 
             # Main bind loop
-            src = []
-            for binder in split_binders:
-                src.extend(binder.src)
+            src = binders_src(split_binders)
 
             # Patch the split file
             # TODO: Line Number is off
             patch_src(self.name, src)
 
+            # Remove dead code
+            if is_lean:
+                src = strip_dead_code(src)
+
             # Write it out
             for line in src:
                 fout.write(line)
@@ -1242,6 +2433,7 @@ class CursorBinder(object):
         self.src = []
         self.opaque = []
         self.macro = None
+        self.owner = None
 
         # Filename
         try:
@@ -1627,6 +2819,59 @@ class CursorBinder(object):
 
         return 'begin' in method_names and 'end' in method_names
 
+    @property
+    def explorer_item(self):
+        """
+        :return: The name of the method returning the current item if the
+            type is an OCCT style explorer with More(), Next(), and Current(),
+            Value(), or Key() methods, or *None* otherwise.
+        :rtype: str or None
+        """
+        methods = {}
+        for f in self.methods:
+            if (not f.is_public or f.is_static_method or f.is_excluded or
+                    f.parameters):
+                continue
+            methods[f.spelling] = f
+
+        more = methods.get('More')
+        if (more is None or not more.is_const_method or
+                more.rtype.get_canonical().kind != TypeKind.BOOL):
+            return None
+        if 'Next' not in methods:
+            return None
+
+        for name in ['Current', 'Value', 'Key']:
+            f = methods.get(name)
+            if (f is not None and f.is_const_method and
+                    f.rtype.kind != TypeKind.VOID):
+                return name
+        return None
+
+    @property
+    def has_arrays(self):
+        """
+        :return: Check if the function or the public members of the class
+            pass C arrays as NumPy arrays.
+        :rtype: bool
+        """
+        if self.is_function:
+            items = [self]
+        elif self.is_class:
+            for item in self.fields:
+                if (item.is_public and item.type.is_array_like and
+                        array_layout(item.type) is not None):
+                    return True
+            items = [f for f in self.ctors + self.methods if f.is_public]
+        else:
+            return False
+
+        for item in items:
+            if (True in [arg.type.is_array_like for arg in item.parameters] and
+                    array_signature(item) is not None):
+                return True
+        return False
+
     @property
     def qualified_name(self):
         """
@@ -1700,12 +2945,26 @@ class CursorBinder(object):
         """
         return CursorBinder(self.cursor.semantic_parent)
 
+    @property
+    def docstring(self):
+        """
+        :return: The docstring or *None* if there is no comment.
+        :rtype: str or None
+        """
+        if self.cursor.brief_comment is None:
+            return None
+        return self.cursor.brief_comment.replace('\n', ' ')
+
     @property
     def docs(self):
         """
-        :return: The docstring.
+        :return: The docstring. It is empty for lean modules since their
+            docstrings are written to a separate index.
         :rtype: str
         """
+        mod = Generator.current_module
+        if mod is not None and mod.is_lean:
+            return ''
         docs = str(self.cursor.brief_comment)
         docs = docs.replace('\n', ' ')
         docs = docs.replace('\"', '\'')
@@ -1859,6 +3118,50 @@ class CursorBinder(object):
             return ''
         return txt.split('=')[-1]
 
+    @property
+    def bindable_default_value(self):
+        """
+        :return: The default value of a parameter if it can be evaluated in
+            the binding scope and converted to Python when the binding is
+            registered, otherwise an empty string.
+        :rtype: str
+        """
+        default_value = self.default_value
+        if not default_value:
+            return ''
+
+        type_ = self.type
+        if type_.is_lvalue:
+            type_ = type_.get_pointee()
+
+        # Null pointers to classes
+        if type_.is_pointer:
+            if default_value not in ['0', '0L', 'NULL', 'nullptr']:
+                return ''
+            if not type_.get_pointee().get_canonical().is_record:
+                return ''
+            return 'nullptr'
+
+        # Only arithmetic types don't need a registered type for conversion
+        if not type_.is_arithmetic:
+            return ''
+
+        # Class members must be qualified to be found in the binding scope
+        for item in self.dfs():
+            if item.kind == CursorKind.MEMBER_REF_EXPR:
+                return ''
+            if item.kind != CursorKind.DECL_REF_EXPR:
+                continue
+            ref = CursorBinder(item.cursor.referenced)
+            parent = ref.parent
+            if ref.is_enum_constant and not parent.cursor.is_scoped_enum():
+                parent = parent.parent
+            if parent.is_class or parent.is_class_template:
+                if parent.spelling + '::' not in default_value:
+                    return ''
+
+        return default_value
+
     @property
     def enum_constants(self):
         """
@@ -1915,6 +3218,22 @@ class CursorBinder(object):
                 return True
         return False
 
+    @property
+    def uses_python_objects(self):
+        """
+        :return: Check to see if the function takes or returns Python objects
+            and so cannot run without the GIL.
+        :rtype: bool
+        """
+        types = [a.type.spelling for a in self.parameters]
+        if not self.is_constructor:
+            types.append(self.rtype.spelling)
+        for spelling in types:
+            for name in ['py::', 'pybind11::', 'PyObject']:
+                if name in spelling:
+                    return True
+        return False
+
     @property
     def needs_default_ctor(self):
         """
@@ -1929,6 +3248,161 @@ class CursorBinder(object):
                 return False
         return True
 
+    @property
+    def buffer_dimensions(self):
+        """
+        :return: The number of dimensions if the class is a contiguous array
+            configured for the buffer protocol, or zero otherwise.
+        :rtype: int
+        """
+        if not self.is_class and not self.is_class_template:
+            return 0
+        if not match_qname(self.qualified_spelling, Generator.buffers):
+            return 0
+
+        names = set([m.spelling for m in self.methods if m.is_public])
+        if names.issuperset(BUFFER_METHODS[2]):
+            return 2
+        if names.issuperset(BUFFER_METHODS[1]):
+            return 1
+        return 0
+
+    @property
+    def is_vectorized(self):
+        """
+        :return: *True* if the function or any method of the class is
+            configured for a vectorized overload, *False* otherwise.
+        :rtype: bool
+        """
+        if self.is_function:
+            return match_qname(self.qualified_name, Generator.vectorize)
+        if self.is_class or self.is_class_template:
+            for item in self.methods:
+                if match_qname(item.qualified_name, Generator.vectorize):
+                    return True
+        return False
+
+    @property
+    def eager_modules(self):
+        """
+        :return: Names of the modules whose types must be registered when
+            the binder is initialized. These are the modules of base classes,
+            fields, parameters with default values, and typedefs including
+            their template arguments.
+        :rtype: set(str)
+        """
+        mods = set()
+        if self.is_typedef:
+            if self.owner is not None:
+                return mods
+            type_ = self.type.get_canonical()
+            mods.update(type_modules(type_))
+            decl = type_.get_declaration()
+            if type_.is_record and decl.is_class:
+                mods.update(decl.eager_modules)
+        elif self.is_class:
+            for base in self.bases:
+                mods.update(type_modules(base.type))
+            for item in self.fields:
+                mods.update(type_modules(item.type))
+            for item in self.ctors + self.methods:
+                mods.update(item.eager_modules)
+            for item in self.nested_classes:
+                mods.update(item.eager_modules)
+        elif self.is_function or self.is_cxx_method or self.is_constructor:
+            for arg in self.parameters:
+                if arg.default_value:
+                    mods.update(type_modules(arg.type))
+        return mods
+
+    @property
+    def bulk_element(self):
+        """
+        :return: The element type if the typedef is a specialization of an
+            iterable class template configured for bulk conversions, or *None*
+            otherwise. The element type is the "TheItemType" parameter or the
+            first parameter if there is none (e.g., the keys of a map).
+        :rtype: binder.core.TypeBinder or None
+        """
+        if not self.is_typedef:
+            return None
+        type_ = self.type.get_canonical()
+        if not type_.is_record:
+            return None
+        template = type_.get_declaration().get_specialization()
+        if not template.is_class_template:
+            return None
+        if not match_qname(template.qualified_spelling, Generator.bulk):
+            return None
+        if not template.is_maybe_iterable:
+            return None
+
+        index = 0
+        for i, param in enumerate(template.template_parameters):
+            if param.spelling == 'TheItemType':
+                index = i
+        return TypeBinder(type_.type.get_template_argument_type(index))
+
+    @property
+    def dtype_fields(self):
+        """
+        :return: The names of the fields if the class is trivially copyable
+            with only public arithmetic fields and can be registered as a
+            NumPy dtype, or an empty list otherwise.
+        :rtype: list(str)
+        """
+        if (not self.is_class or not self.is_definition or self.bases or
+                self.is_excluded):
+            return []
+        if self.dtors:
+            return []
+        for item in self.ctors:
+            if item.is_copy_ctor or item.is_move_ctor:
+                return []
+        for item in self.methods:
+            if item.is_virtual_method:
+                return []
+
+        names = []
+        for item in self.fields:
+            type_ = item.type.get_canonical()
+            if (not item.is_public or not type_.is_arithmetic or
+                    type_.is_const_qualified):
+                return []
+            names.append(item.spelling)
+        return names
+
+    @property
+    def buffer_layout(self):
+        """
+        :return: The scalar type and number of scalars if the class is a
+            contiguous block of a single arithmetic type, or *None* otherwise.
+        :rtype: tuple(str, int) or None
+        """
+        if not self.is_class or not self.is_definition or self.bases:
+            return None
+        for item in self.methods + self.dtors:
+            if item.is_virtual_method:
+                return None
+
+        scalar, size = None, 0
+        for item in self.fields:
+            type_ = item.type.get_canonical()
+            if type_.is_arithmetic and type_.kind != TypeKind.BOOL:
+                layout = type_.spelling.replace('const ', ''), 1
+            elif type_.is_record:
+                layout = type_.get_declaration().get_definition().buffer_layout
+            else:
+                return None
+            if layout is None or scalar not in (None, layout[0]):
+                return None
+            scalar = layout[0]
+            size += layout[1]
+
+        if scalar is None:
+            return None
+        return scalar, size
+
     def get_definition(self):
         """
         If the binder is a reference to a declaration or a declaration of
@@ -2033,6 +3507,17 @@ class CursorBinder(object):
         if f not in includes:
             includes.append(f)
 
+        # NumPy dtype registration
+        if self.is_class and self.dtype_fields and NUMPY_HEADER not in includes:
+            includes.append(NUMPY_HEADER)
+
+        # Buffer protocol, vectorized overload, C array, and bulk conversion
+        # support
+        if BUFFER_HEADER not in includes and (
+                self.buffer_dimensions or self.is_vectorized or
+                self.has_arrays or self.bulk_element is not None):
+            includes.append(BUFFER_HEADER)
+
         # Replace any .lxx or .gxx with .hxx
         for inc in includes:
             if '.lxx' in inc:
@@ -2107,6 +3592,14 @@ class TypeBinder(object):
     :ivar clang.cindex.Type type: The underlying type.
     """
 
+    arithmetic_kinds = {TypeKind.BOOL, TypeKind.CHAR_U, TypeKind.UCHAR,
+                        TypeKind.CHAR16, TypeKind.CHAR32, TypeKind.USHORT,
+                        TypeKind.UINT, TypeKind.ULONG, TypeKind.ULONGLONG,
+                        TypeKind.CHAR_S, TypeKind.SCHAR, TypeKind.WCHAR,
+                        TypeKind.SHORT, TypeKind.INT, TypeKind.LONG,
+                        TypeKind.LONGLONG, TypeKind.FLOAT, TypeKind.DOUBLE,
+                        TypeKind.LONGDOUBLE}
+
     def __init__(self, type_):
         self.type = type_
 
@@ -2163,6 +3656,10 @@ class TypeBinder(object):
                              TypeKind.VARIABLEARRAY,
                              TypeKind.DEPENDENTSIZEDARRAY]
 
+    @property
+    def is_arithmetic(self):
+        return self.get_canonical().kind in self.arithmetic_kinds
+
     @property
     def is_const_qualified(self):
         return self.type.is_const_qualified()
@@ -2229,7 +3726,7 @@ def bind_function(binder):
     src = ['// FUNCTION: {}\n'.format(binder.python_name.upper())]
 
     # Get list of binders if function is overloaded
-    binders = [binder] + binder.grouped_binders
+    binders = sort_overloads([binder] + binder.grouped_binders)
 
     # Generate source
     for binder_ in binders:
@@ -2310,6 +3807,8 @@ def bind_class_template(binder, path):
     ]
 
     # Include files
+    if Generator.hidden_visibility:
+        src.append('#include <{}>\n'.format(VISIBILITY_HEADER))
     for inc in binder.includes:
         src.append('#include <{}>\n'.format(inc))
     src.append('\n')
@@ -2333,8 +3832,8 @@ def bind_class_template(binder, path):
 
     # Bind function
     src.append(
-        'void {}(py::module &mod, std::string const &name, py::module_local const &local){{\n\n'.format(
-            bind_name))
+        '{}void {}(py::module &mod, std::string const &name, py::module_local const &local){{\n\n'.format(
+            hidden(), bind_name))
 
     # Generate source
     src += generate_class_template(binder)
@@ -2443,25 +3942,45 @@ def generate_function(binder):
 
     # Variable names and default values
     args = []
+    noconvert = match_qname(qname, Generator.noconvert)
     for arg in binder.parameters:
         default_value = arg.default_value
         if default_value:
             default_value = '=' + default_value
+        if noconvert and conversion_rank(arg.type) < 3:
+            default_value = '.noconvert()' + default_value
         args.append('py::arg(\"{}\"){}'.format(arg.spelling, default_value))
     if args:
         args = ', ' + ', '.join(args)
     else:
         args = ''
 
+    # Call guards
+    guards = call_guards(binder)
+    cguards = call_guard_arg(guards)
+
     # Source
     interface = '({} (*) ({}))'.format(rtype, signature)
-    src = ['mod.def(\"{}\", {} &{}, \"{}\"{});\n\n'.format(fname, interface,
-                                                           qname, docs,
-                                                           args)]
+    src = ['mod.def(\"{}\", {} &{}, \"{}\"{}{});\n\n'.format(fname, interface,
+                                                             qname, docs,
+                                                             args, cguards)]
 
-    # TODO How to handle arrays
+    # C arrays are passed as NumPy arrays if possible
     if True in is_array_like:
-        src[0] = ' '.join(['//', src[0]])
+        array_sig = array_signature(binder)
+        if array_sig is None:
+            src[0] = ' '.join(['//', src[0]])
+        else:
+            params, call_args = array_sig
+            src = ['mod.def(\"{}\", []({}) -> {} {{ return {}({}); }}, \"{}\"{}{});\n\n'.format(
+                fname, ', '.join(params), rtype, qname, ', '.join(call_args),
+                docs, args, cguards)]
+
+    # Vectorized overload
+    if match_qname(qname, Generator.vectorize):
+        for line in generate_vectorized(binder, 'mod', '', fname, docs,
+                                        guards):
+            src += [line, '\n']
 
     return src
 
@@ -2584,16 +4103,20 @@ def generate_class(binder):
     elif binder.alias is not None:
         local = ', py::module_local()'
 
+    # Buffer protocol
+    ndim = binder.buffer_dimensions
+    buffer = ', py::buffer_protocol()' if ndim else ''
+
     # Source
     tname = 'typename ' + qname if '::' in qname else qname
-    src.append('py::class_<{}{}{}> {}({}, {}, \"{}\"{}{});\n'.format(
-        tname, holder, bases, cls, parent, name_, docs, multi_base,
+    src.append('py::class_<{}{}{}> {}({}, {}, \"{}\"{}{}{});\n'.format(
+        tname, holder, bases, cls, parent, name_, docs, multi_base, buffer,
         local))
 
     # Constructors
     src_ctor = []
     if not binder.is_abstract:
-        for item in binder.ctors:
+        for item in sort_overloads(binder.ctors):
             if item.is_public:
                 item.parent_name = cls
                 src_ctor += generate_ctor(item)
@@ -2601,11 +4124,13 @@ def generate_class(binder):
         # Check for default constructor
         if not src_ctor and binder.needs_default_ctor \
                 and qname not in Generator.excluded_functions:
-            src_ctor = ['{}.def(py::init<>());\n'.format(cls)]
-
             # If it has virtual methods tag it as abstract
             if binder.has_unimplemented_methods:
-                src_ctor[0] = '// abstract virtual methods // ' + src_ctor[0]
+                src_ctor = ['// abstract virtual methods // {}.def(py::init<>());\n'.format(cls)]
+            else:
+                cguards = call_guard_arg(call_counter(
+                    '::'.join([qname, binder.spelling])))
+                src_ctor = ['{}.def(py::init<>(){});\n'.format(cls, cguards)]
 
     if src_ctor:
         src_ctor.insert(0, '\n// Constructors\n')
@@ -2621,9 +4146,17 @@ def generate_class(binder):
         src_fields.insert(0, '\n// Fields\n')
         src += src_fields
 
+    # NumPy dtype for structured arrays. It is registered once for all
+    # modules so module local copies don't register it again.
+    dtype_fields = binder.dtype_fields
+    if dtype_fields and not binder.is_nested and binder.alias is None:
+        src.append('\n// NumPy dtype\n')
+        src.append('PYBIND11_NUMPY_DTYPE({}, {});\n'.format(
+            qname, ', '.join(dtype_fields)))
+
     # Methods
     src_methods = []
-    for item in binder.methods:
+    for item in sort_overloads(binder.methods):
         if item.is_public:
             item.parent_name = cls
             # TODO: Determine macro fn's eg  'vtkTypeMacro'
@@ -2632,12 +4165,45 @@ def generate_class(binder):
         src_methods.insert(0, '\n// Methods\n')
         src += src_methods
 
+    # Buffer of the array data starting at the lower bound
+    if ndim == 1:
+        src.append('\n// Buffer\n')
+        src.append(
+            '{}.def_buffer([]({} &self) -> py::buffer_info {{ return pyOCCT_Buffer(self.Length() ? &self.Value(self.Lower()) : nullptr, {{self.Length()}}); }});\n'.format(
+                cls, tname))
+    elif ndim == 2:
+        src.append('\n// Buffer\n')
+        src.append(
+            '{}.def_buffer([]({} &self) -> py::buffer_info {{ return pyOCCT_Buffer(self.ColLength() && self.RowLength() ? &self.Value(self.LowerRow(), self.LowerCol()) : nullptr, {{self.ColLength(), self.RowLength()}}); }});\n'.format(
+                cls, tname))
+
+    # Pickle support
+    src_pickle = generate_pickle(binder, cls, tname)
+    if src_pickle:
+        src_pickle.insert(0, '\n// Pickle\n')
+        src += src_pickle
+
+    # Downcasting of handles
+    src_downcast = generate_downcast(binder, cls, tname)
+    if src_downcast:
+        src_downcast.insert(0, '\n// Downcasting\n')
+        src += src_downcast
+
+    # Hash and equality
+    src_hash = generate_hash(binder, cls, tname)
+    if src_hash:
+        src_hash.insert(0, '\n// Hash\n')
+        src += src_hash
+
     # Check for an iterable type and add __iter__
     if binder.is_maybe_iterable:
         msg = '\tAdding __iter__ to {}\n'.format(qname)
         logger.write(msg)
         src += '{}.def(\"__iter__\", [](const {} &self) {{ return py::make_iterator(self.begin(), self.end()); }}, py::keep_alive<0, 1>());\n'.format(
             cls, qname)
+    # Check for an explorer and add the iterator protocol
+    elif binder.explorer_item is not None:
+        src += generate_explorer(binder, cls, tname)
 
     # Enums
     src_enums = []
@@ -2677,6 +4243,52 @@ def generate_class(binder):
     return src
 
 
+def generate_explorer(binder, cls, tname):
+    """
+    Generate the iterator protocol for an OCCT style explorer (e.g.,
+    TopExp_Explorer) so that each step advances and fetches the item in a
+    single call. The explorer is consumed by the iteration. If configured,
+    a collect() method drains the remaining items into a list. Both import
+    the module of a lazily imported item type.
+    :param binder.core.CursorBinder binder: The class binder.
+    :param str cls: The class variable name.
+    :param str tname: The class type name.
+    :return: Binder source as a list of lines.
+    :rtype: list(str)
+    """
+    qname = binder.qualified_name
+    item = binder.explorer_item
+
+    msg = '\tAdding __next__ to {}\n'.format(qname)
+    logger.write(msg)
+
+    # Import the modules of a lazily imported item type
+    imports = []
+    mod = Generator.current_module
+    if mod is not None and mod.lazy_imports:
+        for f in binder.methods:
+            if f.spelling == item and not f.parameters:
+                mods = type_modules(f.rtype)
+                imports = ['Import{}'.format(mod_name) for mod_name in
+                           mod.lazy_imports if mod_name in mods]
+                break
+
+    src = ['\n// Iterator\n',
+           '{}.def(\"__iter__\", [](py::object self) {{ return self; }});\n'.format(
+               cls),
+           '{}.def(\"__next__\", []({} &self) {{ if (!self.More()) throw py::stop_iteration(); auto item = self.{}(); self.Next(); return item; }}{});\n'.format(
+               cls, tname, item,
+               call_guard_arg(call_counter(qname + '::__next__') + imports))]
+
+    if match_qname(qname, Generator.collect):
+        src.append(
+            '{}.def(\"collect\", []({} &self) {{ py::list items; for (; self.More(); self.Next()) items.append(self.{}()); return items; }}{});\n'.format(
+                cls, tname, item,
+                call_guard_arg(call_counter(qname + '::collect') + imports)))
+
+    return src
+
+
 def generate_ctor(binder):
     """
     Generate source for class constructor.
@@ -2688,20 +4300,42 @@ def generate_ctor(binder):
 
     sig = function_signature(binder)
     nargs, ndefaults, args_name, args_type, defaults, is_array_like = sig
+    first_default = bindable_defaults(binder, nargs, ndefaults)
+    guards = call_guards(binder)
+    cguards = call_guard_arg(guards)
+
+    # C arrays are passed as NumPy arrays if possible
+    if True in is_array_like:
+        array_sig = array_signature(binder)
+        if array_sig is None:
+            params, call_args = args_type, args_name
+        else:
+            params, call_args = array_sig
+        py_args = py_arguments(binder, args_name, first_default)
+        src = '{}.def(py::init([]({}) {{ return new {}({}); }}){}{});\n'.format(
+            binder.parent_name, ', '.join(params),
+            binder.parent.qualified_name, ', '.join(call_args), py_args,
+            cguards)
+        if (array_sig is None or binder.parent.is_class_template or
+                binder.is_excluded):
+            src = ' '.join(['//', src])
+        return [src]
 
     for i in range(nargs - ndefaults, nargs + 1):
+        # Truncated signatures covered by default values
+        if first_default <= i < nargs:
+            continue
+
         names = args_name[0:i]
         types = args_type[0:i]
 
         signature = ', '.join(types)
 
-        py_args = []
-        for name in names:
-            py_args.append(', py::arg(\"{}\")'.format(name))
-        py_args = ''.join(py_args)
+        py_args = py_arguments(binder, names, first_default)
 
-        src = '{}.def(py::init<{}>(){});\n'.format(binder.parent_name,
-                                                   signature, py_args)
+        src = '{}.def(py::init<{}>(){}{});\n'.format(binder.parent_name,
+                                                     signature, py_args,
+                                                     cguards)
         # Comment if excluded
         if binder.is_excluded or binder.is_move_ctor:
             src = ' '.join(['//', src])
@@ -2732,8 +4366,27 @@ def generate_field(binder):
         '{}.def_{}(\"{}\", &{}, \"{}\");\n'.format(prefix, type_, name, qname,
                                                    docs)]
 
+    # C arrays are viewed as NumPy arrays if possible
     if binder.type.is_array_like:
-        src[0] = ' '.join(['//', src[0]])
+        layout = array_layout(binder.type)
+        if (layout is None or 0 in layout[1] or
+                binder.parent.is_class_template):
+            src[0] = ' '.join(['//', src[0]])
+            return src
+
+        element, dims, is_const = layout
+        parent = binder.parent.qualified_name
+        dims = ', '.join([str(d) for d in dims])
+        getter = '[](py::object self) {{ return pyOCCT_Array<{}>::view(self.cast<{} &>().{}, {{{}}}, self, {}); }}'.format(
+            element, parent, name, dims, 'false' if is_const else 'true')
+        if is_const:
+            src = ['{}.def_property_readonly(\"{}\", {}, \"{}\");\n'.format(
+                prefix, name, getter, docs)]
+        else:
+            setter = '[]({} &self, pyOCCT_Array<{}>::array_type array) {{ pyOCCT_Array<{}>::assign(self.{}, array, {{{}}}); }}'.format(
+                parent, element, element, name, dims)
+            src = ['{}.def_property(\"{}\", {}, {}, \"{}\");\n'.format(
+                prefix, name, getter, setter, docs)]
 
     return src
 
@@ -2799,22 +4452,46 @@ def generate_method(binder):
         keep_alive = ', py::keep_alive<{}>()'.format(Generator.keep_alive[qname])
 
     # Call guards
-    cguards = ''
-    if qname in Generator.call_guards:
-        cguards = ', ' + ', '.join(Generator.call_guards[qname])
+    guards = call_guards(binder)
+    cguards = call_guard_arg(guards)
 
     needs_inout = binder.needs_inout_method
+    first_default = bindable_defaults(binder, nargs, ndefaults)
+
+    # C arrays are passed as NumPy arrays if possible
+    array_sig = None
+    if True in is_array_like and not needs_inout:
+        array_sig = array_signature(binder)
+    if array_sig is not None:
+        params, call_args = array_sig
+        if is_static:
+            call = qname
+        else:
+            parts = qname.split('::')
+            params.insert(0, '::'.join(parts[:-1]) + ' &self')
+            call = 'self.' + binder.spelling
+        py_args = py_arguments(binder, args_name, first_default)
+        src = '{}.def{}(\"{}\", []({}) -> {} {{ return {}({}); }}, {}\"{}\"{}{}{}{});\n'.format(
+            prefix, is_static, fname, ', '.join(params), rtype, call,
+            ', '.join(call_args), is_operator, docs, py_args, return_policy,
+            keep_alive, cguards)
+        return [src]
 
     for i in range(nargs - ndefaults, nargs + 1):
+        # Truncated signatures covered by default values
+        if not needs_inout and first_default <= i < nargs:
+            continue
+
         if needs_inout:
             txt = generate_immutable_inout_method(binder, qname)
             py_args = []
             for name in args_name:
                 py_args.append(', py::arg(\"{}\")'.format(name))
             py_args = ''.join(py_args)
-            src = '{}.def{}(\"{}\", {}, \"{}\"{});\n'.format(prefix, is_static,
-                                                             fname, txt,
-                                                             docs, py_args)
+            src = '{}.def{}(\"{}\", {}, \"{}\"{}{});\n'.format(prefix, is_static,
+                                                               fname, txt,
+                                                               docs, py_args,
+                                                               cguards)
             if True in is_array_like:
                 src = ' '.join(['//', src])
             return [src]
@@ -2824,60 +4501,375 @@ def generate_method(binder):
 
             signature = ', '.join(types)
 
-            py_args = []
-            for name in names:
-                py_args.append(', py::arg(\"{}\")'.format(name))
-            py_args = ''.join(py_args)
+            py_args = py_arguments(binder, names, first_default)
+
+            src = '{}.def{}(\"{}\", ({} ({})({}){}) &{}, {}\"{}\"{}{}{}{});\n'.format(
+                prefix, is_static,
+                fname, rtype, ptr,
+                signature, is_const,
+                qname, is_operator,
+                docs, py_args, return_policy, keep_alive, cguards)
+        else:
+            arg_list = []
+            args_spelling = []
+            for j in range(0, i):
+                arg_list.append(args_type[j])
+                args_spelling.append(args_name[j])
+
+            if is_static:
+                signature = ''
+            else:
+                parts = qname.split('::')
+                parent_spelling = '::'.join(parts[:-1])
+                signature = parent_spelling + ' &self'
+
+            k = 0
+            call_args = []
+            for arg_type_spelling in arg_list:
+                if not signature:
+                    signature += '{} {}'.format(arg_type_spelling,
+                                                'a' + str(k))
+                else:
+                    signature += ', {} {}'.format(arg_type_spelling,
+                                                  'a' + str(k))
+                call_args.append('a' + str(k))
+                k += 1
+            call = ', '.join(call_args)
+
+            if not is_static:
+                qname_ = 'self.' + fname
+            else:
+                qname_ = qname
+
+            src = '{}.def{}(\"{}\", []({}) -> {} {{ return {}({}); }}{});\n'.format(
+                prefix, is_static, fname, signature, rtype, qname_, call,
+                cguards)
+
+        # TODO How to handle arrays?
+        if True in is_array_like:
+            src = ' '.join(['//', src])
+
+        methods.append(src)
+
+    # Vectorized overload
+    if match_qname(qname, Generator.vectorize) and not binder.is_excluded:
+        methods += generate_vectorized(binder, prefix, is_static, fname, docs,
+                                       guards)
+
+    return methods
+
+
+def generate_pickle(binder, cls, tname):
+    """
+    Generate pickle support for a class. Classes with a configured
+    serializer use it. Otherwise aggregates are pickled by their public
+    fields and other classes by the constructor whose parameters all have a
+    corresponding getter (e.g., gp_Pnt(theXp, theYp, theZp) and X(), Y(),
+    Z()).
+    :param binder.core.CursorBinder binder: The class binder.
+    :param str cls: The class variable name.
+    :param str tname: The class type name.
+    :return: Binder source as a list of lines.
+    :rtype: list(str)
+    """
+    qname = binder.qualified_name
+    if qname in Generator.excluded_pickle:
+        return []
+
+    # Configured serializer
+    if qname in Generator.pickle:
+        getstate, setstate = Generator.pickle[qname]
+        cguards = call_guard_arg(call_counter(qname + '::pickle'))
+        return ['{}.def(py::pickle(&{}, &{}){});\n'.format(cls, getstate,
+                                                           setstate, cguards)]
+
+    state = pickle_state(binder)
+    if state is None:
+        return []
+    getters, types, setstate = state
+
+    msg = '\tAdding pickle support for {}\n'.format(qname)
+    logger.write(msg)
+
+    args = []
+    for i, type_ in enumerate(types):
+        args.append('t[{}].cast<{}>()'.format(i, type_))
+    getstate = '[]({} const &self) {{ return py::make_tuple({}); }}'.format(
+        tname, ', '.join(['self.' + g for g in getters]))
+    setstate = '[](py::tuple t) {{ if (t.size() != {}) throw std::runtime_error(\"Invalid state.\"); {} }}'.format(
+        len(types), setstate.format(tname, *args))
+    cguards = call_guard_arg(call_counter(qname + '::pickle'))
+    return ['{}.def(py::pickle({}, {}){});\n'.format(cls, getstate, setstate,
+                                                    cguards)]
+
+
+def pickle_state(binder):
+    """
+    Get the pickle state of a class from its fields or its constructor and
+    getters.
+    :param binder.core.CursorBinder binder: The class binder.
+    :return: The getter expressions, their types, and the source format of
+        the object from the state, or *None* if the class can't be pickled
+        this way.
+    :rtype: tuple(list(str), list(str), str) or None
+    """
+    qname = binder.qualified_name
+    if (qname in Generator.excluded_pickle or binder.is_class_template or
+            binder.is_abstract or binder.is_excluded or binder.is_transient or
+            binder.needs_nodelete or qname in Generator.nodelete):
+        return None
+    return pickle_fields(binder) or pickle_ctor(binder)
+
+
+def is_picklable(type_):
+    """
+    Check if the values of a type can be pickled as part of a state.
+    :param binder.core.TypeBinder type_: The type.
+    :return: *True* if arithmetic, an enumeration, or a class with pickle
+        support, *False* otherwise.
+    :rtype: bool
+    """
+    type_ = type_.get_canonical()
+    if type_.is_arithmetic or type_.kind == TypeKind.ENUM:
+        return True
+    if not type_.is_record:
+        return False
+    decl = type_.get_declaration().get_definition()
+    if decl.qualified_name in Generator.pickle:
+        return True
+    return pickle_state(decl) is not None
+
+
+def pickle_fields(binder):
+    """
+    Get the pickle state of an aggregate whose fields are all public.
+    :param binder.core.CursorBinder binder: The class binder.
+    :return: The getter expressions, their types, and the source format of
+        the object from the state, or *None* if not an aggregate.
+    :rtype: tuple(list(str), list(str), str) or None
+    """
+    fields = binder.fields
+    if not fields or binder.bases:
+        return None
+    if not binder.needs_default_ctor:
+        default_ctors = [c for c in binder.ctors if c.is_default_ctor and
+                         c.is_public and not c.is_excluded]
+        if not default_ctors:
+            return None
+
+    getters, types, body = [], [], []
+    for i, item in enumerate(fields):
+        type_ = item.type
+        if (not item.is_public or item.is_excluded or type_.is_pointer_like or
+                type_.is_array_like or type_.is_const_qualified or
+                not is_picklable(type_)):
+            return None
+        getters.append(item.spelling)
+        types.append(type_.spelling)
+        body.append('obj.{} = {{{}}};'.format(item.spelling, i + 1))
+
+    setstate = '{{0}} obj; {} return obj;'.format(' '.join(body))
+    return getters, types, setstate
+
+
+def pickle_ctor(binder):
+    """
+    Get the pickle state of a class from the public constructor with the most
+    parameters that all have a getter of the same type. Getters are public
+    const methods without parameters named like the parameter without a
+    "the" prefix and optional lowercase suffix (e.g., "theXp" and "X"). The
+    class is not pickled if a parameter matches several getters, a getter
+    matches several parameters, or several constructors match.
+    :param binder.core.CursorBinder binder: The class binder.
+    :return: The getter expressions, their types, and the source format of
+        the object from the state, or *None* if there is no such
+        constructor.
+    :rtype: tuple(list(str), list(str), str) or None
+    """
+    getters = {}
+    for item in binder.methods:
+        if (item.is_public and item.is_const_method and
+                not item.is_static_method and not item.parameters and
+                not item.is_excluded):
+            getters.setdefault(item.spelling.lower(), []).append(item)
+
+    # Constructors whose parameters all match a getter
+    matches = []
+    for ctor in binder.ctors:
+        params = ctor.parameters
+        if (not ctor.is_public or ctor.is_excluded or ctor.is_copy_ctor or
+                ctor.is_move_ctor or not params):
+            continue
+
+        names, types, is_ambiguous = [], [], False
+        for param in params:
+            type_ = value_type(param.type)
+            if type_ is None or not is_picklable(param.type):
+                break
+            name = re.sub(r'^(the|a)(?=[A-Z])', '', param.spelling)
+            candidates = []
+            for key in (name.lower(), name.rstrip(ascii_lowercase).lower()):
+                candidates = [g for g in getters.get(key, [])
+                              if value_type(g.rtype) == type_]
+                if candidates:
+                    break
+            if not candidates:
+                break
+            if len(candidates) > 1:
+                is_ambiguous = True
+            names.append(candidates[0].spelling + '()')
+            types.append(type_)
+        else:
+            if len(set(names)) < len(names):
+                is_ambiguous = True
+            matches.append((len(params), is_ambiguous, names, types))
+
+    if not matches:
+        return None
+    size = max([m[0] for m in matches])
+    matches = [m for m in matches if m[0] == size]
+    if len(matches) > 1 or matches[0][1]:
+        msg = '\tNot pickling ambiguous constructor state: {}\n'.format(
+            binder.qualified_name)
+        logger.write(msg)
+        return None
+
+    _, _, names, types = matches[0]
+    args = ', '.join(['{{{}}}'.format(i + 1) for i in range(len(types))])
+    return names, types, 'return {{0}}({});'.format(args)
+
+
+def generate_downcast(binder, cls, tname):
+    """
+    Generate a static DownCast for a transient class listed in the
+    configuration and, if the polymorphic type hook is used, register the
+    class with it. Only classes declaring their own RTTI are registered since
+    others share the type descriptor of their base.
+    :param binder.core.CursorBinder binder: The class binder.
+    :param str cls: The class variable name.
+    :param str tname: The class type name.
+    :return: Binder source as a list of lines.
+    :rtype: list(str)
+    """
+    if (not binder.is_transient or binder.is_class_template or
+            binder.is_excluded):
+        return []
 
-            src = '{}.def{}(\"{}\", ({} ({})({}){}) &{}, {}\"{}\"{}{}{}{});\n'.format(
-                prefix, is_static,
-                fname, rtype, ptr,
-                signature, is_const,
-                qname, is_operator,
-                docs, py_args, return_policy, keep_alive, cguards)
+    src = []
+    if match_qname(binder.qualified_name, Generator.downcast_classes):
+        src.append(
+            '{}.def_static(\"DownCast\", [](const opencascade::handle<Standard_Transient> &theObject) {{ return opencascade::handle<{}>::DownCast(theObject); }}, py::arg(\"theObject\"));\n'.format(
+                cls, tname))
+    if Generator.downcast_hook:
+        names = set([item.spelling for item in binder.methods])
+        if 'get_type_descriptor' in names and 'DynamicType' in names:
+            src.append('pyOCCT_RegisterTransient<{}>();\n'.format(tname))
         else:
-            arg_list = []
-            args_spelling = []
-            for j in range(0, i):
-                arg_list.append(args_type[j])
-                args_spelling.append(args_name[j])
+            msg = '\tNot registering transient without its own RTTI: {}\n'.format(
+                binder.qualified_name)
+            logger.write(msg)
+    return src
 
-            if is_static:
-                signature = ''
-            else:
-                parts = qname.split('::')
-                parent_spelling = '::'.join(parts[:-1])
-                signature = parent_spelling + ' &self'
 
-            k = 0
-            call_args = []
-            for arg_type_spelling in arg_list:
-                if not signature:
-                    signature += '{} {}'.format(arg_type_spelling,
-                                                'a' + str(k))
-                else:
-                    signature += ', {} {}'.format(arg_type_spelling,
-                                                  'a' + str(k))
-                call_args.append('a' + str(k))
-                k += 1
-            call = ', '.join(call_args)
+def generate_hash(binder, cls, tname):
+    """
+    Generate __hash__ and __eq__ for a class. Classes with configured hash
+    and equality functions use them. Otherwise the hash is taken from a
+    std::hash specialization or a HashCode() method, and equality from
+    operator==, IsSame(), or IsEqual(), in that order. Nothing is generated
+    unless both are found since Python requires equal objects to have equal
+    hashes.
+    :param binder.core.CursorBinder binder: The class binder.
+    :param str cls: The class variable name.
+    :param str tname: The class type name.
+    :return: Binder source as a list of lines.
+    :rtype: list(str)
+    """
+    qname = binder.qualified_name
+    if (qname in Generator.excluded_hash or binder.is_class_template or
+            binder.is_excluded):
+        return []
 
-            if not is_static:
-                qname_ = 'self.' + fname
-            else:
-                qname_ = qname
+    # Configured functions
+    if qname in Generator.hashes:
+        hash_, eq = Generator.hashes[qname]
+        return ['{}.def(\"__eq__\", &{}, py::is_operator(){});\n'.format(
+                    cls, eq, call_guard_arg(call_counter(qname + '::__eq__'))),
+                '{}.def(\"__hash__\", &{}{});\n'.format(
+                    cls, hash_, call_guard_arg(call_counter(qname + '::__hash__')))]
 
-            src = '{}.def{}(\"{}\", []({}) -> {} {{ return {}({}); }}{});\n'.format(
-                prefix, is_static, fname, signature, rtype, qname_, call,
-                cguards)
+    spelling = binder.type.get_canonical().spelling
+    candidates = {}
+    for item in binder.methods:
+        if (item.is_public and item.is_const_method and
+                not item.is_static_method and not item.is_excluded):
+            candidates.setdefault(item.spelling, []).append(item)
+
+    # Hash
+    hash_ = None
+    if spelling in Generator.std_hashes:
+        hash_ = 'std::hash<{}>()(self)'.format(tname)
+    for item in candidates.get('HashCode', []):
+        if hash_ is not None:
+            break
+        params = item.parameters
+        if not params:
+            hash_ = 'self.HashCode()'
+        elif len(params) == 1 and params[0].type.is_arithmetic:
+            # Hash codes in [1, upper] before OCCT 7.8
+            upper = value_type(params[0].type)
+            hash_ = 'self.HashCode(std::numeric_limits<{}>::max())'.format(
+                upper)
+
+    # Equality
+    eq = None
+    for name in ['operator==', 'IsSame', 'IsEqual']:
+        for item in candidates.get(name, []):
+            params = item.parameters
+            if (len(params) == 1 and
+                    item.rtype.get_canonical().kind == TypeKind.BOOL and
+                    value_type(params[0].type) == spelling):
+                eq = name
+                break
+        if eq is not None:
+            break
 
-        # TODO How to handle arrays?
-        if True in is_array_like:
-            src = ' '.join(['//', src])
+    if hash_ is None or eq is None:
+        return []
 
-        methods.append(src)
+    msg = '\tAdding __hash__ to {}\n'.format(qname)
+    logger.write(msg)
 
-    return methods
+    src = []
+    # Operators are bound as __eq__ with the other methods
+    if eq != 'operator==':
+        src.append(
+            '{}.def(\"__eq__\", []({} const &self, {} const &other) {{ return self.{}(other); }}, py::is_operator(){});\n'.format(
+                cls, tname, tname, eq,
+                call_guard_arg(call_counter(qname + '::__eq__'))))
+    src.append('{}.def(\"__hash__\", []({} const &self) {{ return {}; }}{});\n'.format(
+        cls, tname, hash_, call_guard_arg(call_counter(qname + '::__hash__'))))
+    return src
+
+
+def value_type(type_):
+    """
+    Get the spelling of a parameter or return type passed by value or const
+    reference without the qualifiers.
+    :param binder.core.TypeBinder type_: The type.
+    :return: The spelling or *None* if the type is a pointer or non-const
+        reference.
+    :rtype: str or None
+    """
+    if type_.is_lvalue:
+        type_ = type_.get_pointee()
+        if not type_.is_const_qualified:
+            return None
+    elif type_.is_pointer_like or type_.is_array_like:
+        return None
+    if type_.kind == TypeKind.VOID:
+        return None
+    return type_.get_canonical().spelling.replace('const ', '')
 
 
 def generate_typedef2(binder):
@@ -2898,6 +4890,16 @@ def generate_typedef2(binder):
         ]
         return src, None, []
 
+    # Re-export a template specialization bound by its owning module
+    owner = binder.owner
+    if owner is not None:
+        src = [
+            '{}.attr(\"{}\") = {}.attr(\"{}\");\n'.format(
+                binder.parent_name, binder.python_name,
+                import_module(owner.module_name), owner.python_name)
+        ]
+        return src, None, []
+
     # Bind class
     type_ = binder.type.get_canonical()
     decl = type_.get_declaration()
@@ -2913,11 +4915,25 @@ def generate_typedef2(binder):
             extra = ['PYBIND11_MAKE_OPAQUE({})\n'.format(txt[0])]
             return src, [], extra
         else:
+            bind_name = 'bind_{}'.format(decl.spelling)
             src = ['bind_{}({}, \"{}\"{});\n'.format(type_.spelling,
                                                      binder.parent_name,
                                                      binder.python_name,
                                                      local)]
-            return src, ['bind_{}'.format(decl.spelling)], []
+            src += generate_bulk(binder, type_.spelling)
+
+            # Declare the specialization and instantiate it in its own unit
+            extra = []
+            if Generator.explicit_templates and not binder.is_excluded:
+                instances = Generator.template_instances.setdefault(
+                    bind_name, OrderedDict())
+                instances.setdefault(type_.spelling, list(binder.includes))
+                mod = Generator.current_module
+                if mod is not None:
+                    mod.instances.add(bind_name)
+                extra.append('extern {}'.format(
+                    template_instance(bind_name, type_.spelling)))
+            return src, [bind_name], extra
 
     elif type_.is_record and decl.is_class:
         decl.python_name = binder.spelling
@@ -2929,6 +4945,84 @@ def generate_typedef2(binder):
     return [], [], []
 
 
+def generate_bulk(binder, spelling):
+    """
+    Generate the bulk conversions of a class template specialization based on
+    its element type. All elements are copied to a list in one call, to an
+    array if they are arithmetic or a contiguous block of scalars, and the
+    container can be constructed from either if it has an Append or Add
+    method taking only an element.
+    :param binder.core.CursorBinder binder: The typedef binder.
+    :param str spelling: The specialization spelling.
+    :return: Binder source as a list of lines.
+    :rtype: list(str)
+    """
+    element = binder.bulk_element
+    if element is None or binder.is_excluded:
+        return []
+
+    template = binder.type.get_canonical().get_declaration().get_specialization()
+    if (template.is_transient or template.needs_nodelete or
+            template.qualified_name in Generator.nodelete):
+        msg = '\tNo bulk conversions for holder type: {}\n'.format(spelling)
+        logger.write(msg)
+        return []
+
+    # Method to add an element taking only the element
+    tparams = template.template_parameters
+    names = [p.spelling for p in tparams]
+    tparam = tparams[names.index('TheItemType') if 'TheItemType' in names else 0]
+    item_type = value_type(tparam.type)
+    add = None
+    for name in ('Append', 'Add'):
+        for item in template.methods:
+            params = item.parameters
+            if (item.is_public and item.spelling == name and
+                    len(params) == 1 and
+                    value_type(params[0].type) == item_type):
+                add = name
+                break
+        if add is not None:
+            break
+
+    item = element.get_canonical().spelling
+    obj = '{}.attr(\"{}\")'.format(binder.parent_name, binder.python_name)
+    targs = '<{}, {}>'.format(spelling, item)
+    if add is not None:
+        add = '[]({} &self, const {} &item) {{ self.{}(item); }}'.format(
+            spelling, item, add)
+    is_numeric = vectorized_type(element) is not None
+
+    # The constructors from arrays and lists share a counter
+    qname = binder.qualified_name
+    src = ['pyOCCT_BindToList{}({}{});\n'.format(
+        targs, obj, call_guard_arg(call_counter(qname + '::to_list')))]
+    if is_numeric:
+        src.append('pyOCCT_BindToNumpy{}({}{});\n'.format(
+            targs, obj, call_guard_arg(call_counter(qname + '::to_numpy'))))
+    if add is not None:
+        cguards = call_guard_arg(call_counter('::'.join([qname, binder.spelling])))
+        if is_numeric:
+            src.append('pyOCCT_BindFromNumpy{}({}, {}{});\n'.format(
+                targs, obj, add, cguards))
+        src.append('pyOCCT_BindFromList{}({}, {}{});\n'.format(
+            targs, obj, add, cguards))
+    return src
+
+
+def template_instance(bind_name, spelling):
+    """
+    Generate the explicit instantiation of a class template binder.
+    :param str bind_name: The name of the template binder function.
+    :param str spelling: The spelling of the template specialization.
+    :return: The instantiation text.
+    :rtype: str
+    """
+    args = spelling[spelling.find('<'):]
+    return 'template void {}{}(py::module &, std::string const &, py::module_local const &);\n'.format(
+        bind_name, args)
+
+
 def patch_typenames(binder, src):
     """
     Hack to correct spelling of some types that miss the template parameters
@@ -2988,6 +5082,680 @@ def function_signature(binder):
     return nargs, ndefaults, args_name, args_type, defaults, is_array
 
 
+def method_name(binder):
+    """
+    Get the Python name of a class member function.
+    :param binder.core.CursorBinder binder: The binder.
+    :return: The name.
+    :rtype: str
+    """
+    if binder.is_constructor:
+        return '__init__'
+    fname = binder.spelling
+    if binder.is_operator:
+        return PY_OPERATORS[fname]
+    if binder.is_static_method:
+        fname += '_'
+    return fname
+
+
+def add_docs(index, name, docs):
+    """
+    Add a docstring to the index. The distinct docstrings of overloads are
+    joined by new lines.
+    :param dict index: The docstrings by qualified Python name.
+    :param str name: The qualified Python name.
+    :param str docs: The docstring or *None*.
+    :return: None.
+    """
+    if not docs:
+        return
+    if name not in index:
+        index[name] = docs
+    elif docs not in index[name].split('\n'):
+        index[name] += '\n' + docs
+
+
+def class_docs(index, binder, name):
+    """
+    Add the docstrings of a class and its public members to the index.
+    :param dict index: The docstrings by qualified Python name.
+    :param binder.core.CursorBinder binder: The class or class template
+        binder.
+    :param str name: The Python name of the class.
+    :return: None.
+    """
+    add_docs(index, name, binder.docstring)
+    for item in binder.ctors + binder.methods:
+        if not item.is_public or item.is_excluded:
+            continue
+        # Skip functions that are commented out
+        if item.is_pure_virtual_method:
+            continue
+        if (True in [arg.type.is_array_like for arg in item.parameters] and
+                array_signature(item) is None):
+            continue
+        key = '.'.join([name, method_name(item)])
+        add_docs(index, key, item.docstring)
+    for item in binder.fields + binder.enums:
+        if item.is_public and not item.is_excluded:
+            key = '.'.join([name, item.python_name])
+            add_docs(index, key, item.docstring)
+    for item in binder.nested_classes:
+        if item.is_public and item.qualified_name in Generator.nested_classes:
+            class_docs(index, item, '.'.join([name, item.python_name]))
+
+
+def strip_dead_code(src):
+    """
+    Remove the bindings that are commented out (e.g., excluded or
+    unsupported declarations) from the source. Only the blocks of excluded
+    declarations are removed, which are commented out by lines of just "/*"
+    and "*/" so any other comments and the code after them are kept.
+    :param list(str) src: The source lines.
+    :return: The source lines without dead code.
+    :rtype: list(str)
+    """
+    src_out = []
+    in_block = False
+    for line in src:
+        txt = line.strip()
+        if in_block:
+            in_block = txt != '*/'
+            continue
+        if txt == '/*':
+            in_block = True
+            continue
+        if txt.startswith('//') and txt.endswith(';'):
+            continue
+        src_out.append(line)
+    return src_out
+
+
+def common_includes():
+    """
+    Get the headers included first by every generated source file.
+    :return: List of include files.
+    :rtype: list(str)
+    """
+    includes = ['pyOCCT_Common.hxx']
+    if Generator.hidden_visibility:
+        includes.append(VISIBILITY_HEADER)
+    if Generator.string_casters:
+        includes.append(STRINGS_HEADER)
+    if Generator.downcast_hook:
+        includes.append(DOWNCAST_HEADER)
+    if Generator.serialize:
+        includes.append(SERIALIZE_HEADER)
+    if Generator.monolithic:
+        includes.append(MONOLITHIC_HEADER)
+    if Generator.init_profile:
+        includes.append(PROFILE_HEADER)
+    if Generator.call_counters:
+        includes.append(CALLS_HEADER)
+    return includes
+
+
+def binders_src(binders):
+    """
+    Get the source of the binders of a module. If registration is profiled
+    each binder is followed by a mark that records its time.
+    :param list(binder.core.CursorBinder) binders: The binders.
+    :return: Binder source as a list of lines.
+    :rtype: list(str)
+    """
+    src = []
+    for binder in binders:
+        src.extend(binder.src)
+        if Generator.init_profile and binder.src:
+            name = binder.python_name or '(anonymous)'
+            src.append('PYOCCT_PROFILE_MARK(\"{}\");\n\n'.format(name))
+    return src
+
+
+def hidden():
+    """
+    Get the prefix of the declarations that are hidden from the symbol table
+    of the extensions.
+    :return: The prefix.
+    :rtype: str
+    """
+    if Generator.hidden_visibility:
+        return 'PYOCCT_HIDDEN '
+    return ''
+
+
+def import_module(mod_name):
+    """
+    Get the expression that imports one of the modules. The submodules of a
+    monolithic extension are imported through the extension so they are
+    initialized on first use.
+    :param str mod_name: The module name.
+    :return: The import expression.
+    :rtype: str
+    """
+    if Generator.monolithic:
+        return 'pyOCCT_Import(\"{}\")'.format(mod_name)
+    return 'py::module::import(\"{}.{}\")'.format(Generator.package_name,
+                                                 mod_name)
+
+
+def match_qname(qname, patterns):
+    """
+    Check if a qualified name matches any of the patterns.
+    :param str qname: The qualified name.
+    :param collections.Iterable(str) patterns: The patterns which may use
+        shell-style wildcards (e.g., "BRepAlgoAPI_*::Build").
+    :return: *True* if matched, *False* otherwise.
+    :rtype: bool
+    """
+    for pattern in patterns:
+        if fnmatchcase(qname, pattern):
+            return True
+    return False
+
+
+def call_guards(binder):
+    """
+    Get the call guards of a function binder. The import guards from the
+    configuration and for lazily imported return types are constructed
+    before the GIL is released, and the mutex of serialized calls is locked
+    after. Serialized calls always release the GIL.
+    :param binder.core.CursorBinder binder: The binder.
+    :return: The call guards in the order they are constructed.
+    :rtype: list(str)
+    """
+    qname = binder.qualified_name
+    guards = call_counter(qname) + Generator.call_guards.get(qname, [])
+    mod = Generator.current_module
+
+    # Import the modules of lazily imported return types
+    if mod is not None and mod.lazy_imports:
+        mods = type_modules(binder.rtype)
+        if binder.needs_inout_method:
+            for arg in binder.parameters:
+                mods.update(type_modules(arg.type))
+        for mod_name in mod.lazy_imports:
+            guard = 'Import{}'.format(mod_name)
+            if mod_name in mods and guard not in guards:
+                guards.append(guard)
+
+    # Serialize calls of the configured functions or class members. The GIL
+    # is always released first so a thread never waits for the mutex while
+    # holding it.
+    parent = binder.parent
+    serialize = match_qname(qname, Generator.serialize) or (
+        parent.is_class and
+        match_qname(parent.qualified_name, Generator.serialize))
+
+    if serialize or match_qname(qname, Generator.release_gil):
+        if binder.uses_python_objects:
+            msg = '\tNot releasing GIL for Python objects: {}\n'.format(qname)
+            logger.write(msg)
+            if serialize:
+                msg = '\tNot serializing with the GIL held: {}\n'.format(qname)
+                logger.write(msg)
+                serialize = False
+        else:
+            guards.append('py::gil_scoped_release')
+
+    if serialize:
+        guards.append('pyOCCT_Serialize')
+
+    return guards
+
+
+def call_counter(name):
+    """
+    Get the guard counting the calls of a binding in the table of the current
+    module. Templates are bound by several modules so they are not counted.
+    :param str name: The name of the binding in the table (e.g.,
+        "gp_Pnt::Distance" or "gp_Pnt::__hash__").
+    :return: The call counter guard or an empty list if calls are not counted.
+    :rtype: list(str)
+    """
+    mod = Generator.current_module
+    if not Generator.call_counters or mod is None:
+        return []
+    guard = 'pyOCCT_CallCounter<pyOCCT_Calls_{}, {}>'.format(
+        mod.name, len(mod.call_stats))
+    mod.call_stats.append(name)
+    return [guard]
+
+
+def call_guard_arg(guards):
+    """
+    Generate the call guard argument of a binding.
+    :param list(str) guards: The call guards.
+    :return: The call guard argument or an empty string if not needed.
+    :rtype: str
+    """
+    if not guards:
+        return ''
+    return ', py::call_guard<{}>()'.format(', '.join(guards))
+
+
+def vectorized_type(type_):
+    """
+    Get the element type of an array that can replace a parameter or return
+    type in a vectorized overload.
+    :param binder.core.TypeBinder type_: The type.
+    :return: The element type spelling and *True* if it is arithmetic, or
+        *None* if the type cannot be vectorized.
+    :rtype: tuple(str, bool) or None
+    """
+    if type_.is_lvalue:
+        type_ = type_.get_pointee()
+        if not type_.is_const_qualified:
+            return None
+    elif type_.is_pointer_like:
+        return None
+
+    canonical = type_.get_canonical()
+    if canonical.is_arithmetic and canonical.kind != TypeKind.BOOL:
+        is_arithmetic = True
+    elif canonical.is_record:
+        definition = canonical.get_declaration().get_definition()
+        if definition.buffer_layout is None and not definition.dtype_fields:
+            return None
+        is_arithmetic = False
+    else:
+        return None
+
+    spelling = type_.spelling.replace('const ', '')
+    return spelling, is_arithmetic
+
+
+def array_layout(type_):
+    """
+    Get the layout of a C array whose elements can be passed as a NumPy array.
+    :param binder.core.TypeBinder type_: The array type.
+    :return: The element type spelling, the extent of each dimension (0 if
+        unknown), and *True* if the elements are const, or *None* if the
+        elements can't be passed this way.
+    :rtype: tuple(str, list(int), bool) or None
+    """
+    dims = []
+    while type_.is_array_like:
+        if type_.kind == TypeKind.CONSTANTARRAY:
+            dims.append(type_.type.element_count)
+        elif type_.kind == TypeKind.INCOMPLETEARRAY and not dims:
+            dims.append(0)
+        else:
+            return None
+        type_ = TypeBinder(type_.type.element_type)
+
+    element = vectorized_type(type_)
+    if element is None:
+        return None
+    return element[0], dims, type_.is_const_qualified
+
+
+def array_signature(binder):
+    """
+    Generate the parameters and call arguments of a lambda that passes NumPy
+    arrays for the C array parameters of a function. Arrays for const
+    elements are converted if needed. Arrays for non-const elements are
+    used in place so they must be writeable, contiguous, and of the element
+    type already.
+    :param binder.core.CursorBinder binder: The function, method, or
+        constructor binder.
+    :return: The parameters and call arguments, or *None* if a C array
+        parameter can't be passed this way.
+    :rtype: tuple(list(str), list(str)) or None
+    """
+    params, args = [], []
+    for i, arg in enumerate(binder.parameters):
+        name = 'a' + str(i)
+        type_ = arg.type
+        if not type_.is_array_like:
+            params.append('{} {}'.format(type_.spelling, name))
+            args.append(name)
+            continue
+
+        layout = array_layout(type_)
+        if layout is None or arg.default_value:
+            return None
+        element, dims, is_const = layout
+        params.append('pyOCCT_Array<{}>::{} {}'.format(
+            element, 'array_type' if is_const else 'mutable_array_type', name))
+        data = 'pyOCCT_Array<{}>::{}({}, {{{}}})'.format(
+            element, 'data' if is_const else 'mutable_data', name,
+            ', '.join([str(d) for d in dims]))
+        # Pointer to the rows of a multidimensional array
+        if len(dims) > 1:
+            row = TypeBinder(type_.type.element_type).spelling
+            data = 'reinterpret_cast<{}>({})'.format(
+                row.replace(' [', ' (*)[', 1), data)
+        args.append(data)
+    return params, args
+
+
+def generate_vectorized(binder, prefix, is_static, fname, docs, guards):
+    """
+    Generate an overload of a function that calls it for each element of
+    NumPy arrays and returns the results as an array. The arithmetic
+    parameters are vectorized or, if there are none, the parameters that are
+    a contiguous block of scalars (e.g., gp_Pnt). Arrays of a single element
+    are broadcast. The call guards of the scalar overload are used, except
+    that the GIL is only released, and calls serialized, around the loop
+    since the arrays are Python objects.
+    :param binder.core.CursorBinder binder: The function or method binder.
+    :param str prefix: The binding parent.
+    :param str is_static: Suffix of the static definition if applicable.
+    :param str fname: The Python name.
+    :param str docs: The docstring.
+    :param list(str) guards: The call guards of the scalar overload.
+    :return: Binder source as a list of lines.
+    :rtype: list(str)
+    """
+    qname = binder.qualified_name
+
+    # Return type
+    if vectorized_type(binder.rtype) is None:
+        msg = '\tNot vectorizing unsupported return type: {}\n'.format(qname)
+        logger.write(msg)
+        return []
+
+    # Parameters
+    params = binder.parameters
+    elements = [vectorized_type(arg.type) for arg in params]
+    is_vectorized = [e is not None and e[1] for e in elements]
+    if True not in is_vectorized:
+        is_vectorized = [e is not None for e in elements]
+    if True not in is_vectorized:
+        msg = '\tNot vectorizing without array parameters: {}\n'.format(qname)
+        logger.write(msg)
+        return []
+    for arg in params:
+        if arg.type.is_lvalue and not arg.type.get_pointee().is_const_qualified:
+            msg = '\tNot vectorizing output parameters: {}\n'.format(qname)
+            logger.write(msg)
+            return []
+
+    signature, inner, vectors, names, py_args = [], [], [], [], []
+    if binder.is_cxx_method and not binder.is_static_method:
+        parent = binder.parent.qualified_name
+        if '::' in parent:
+            parent = 'typename ' + parent
+        if binder.is_const_method:
+            parent = 'const ' + parent
+        signature.append('{} &self'.format(parent))
+        call = 'self.' + binder.spelling
+    else:
+        call = qname
+
+    for arg, element, vectorized in zip(params, elements, is_vectorized):
+        name = arg.spelling
+        if vectorized:
+            vector = 'pyOCCT_Vector<{}>'.format(element[0])
+            signature.append('{}::array_type {}'.format(vector, name))
+            inner.append('const {} &{}'.format(element[0], name))
+            vectors.append('{}({})'.format(vector, name))
+        else:
+            signature.append('{} {}'.format(arg.type.spelling, name))
+        names.append(name)
+        py_args.append(', py::arg(\"{}\")'.format(name))
+
+    msg = '\tVectorizing {}.\n'.format(qname)
+    logger.write(msg)
+
+    loop_guards = [g for g in guards if g in ('py::gil_scoped_release',
+                                              'pyOCCT_Serialize')]
+    cguards = call_guard_arg([g for g in guards if g not in loop_guards])
+    vectorize = 'pyOCCT_Vectorize'
+    if loop_guards:
+        vectorize += '<{}>'.format(', '.join(loop_guards))
+
+    src = '{}.def{}(\"{}\", []({}) {{ return {}([&]({}) {{ return {}({}); }}, {}); }}, \"{}\"{}{});\n'.format(
+        prefix, is_static, fname, ', '.join(signature), vectorize,
+        ', '.join(inner), call, ', '.join(names), ', '.join(vectors), docs,
+        ''.join(py_args), cguards)
+    return [src]
+
+
+def type_modules(type_):
+    """
+    Get the modules of the enums and classes a type refers to, including
+    their template arguments (e.g., "opencascade::handle<Geom_Curve>").
+    :param binder.core.TypeBinder type_: The type.
+    :return: The module names.
+    :rtype: set(str)
+    """
+    mods = set()
+    type_ = type_.get_canonical()
+    while type_.is_pointer_like or type_.is_array_like:
+        if type_.is_array_like:
+            type_ = TypeBinder(type_.type.element_type).get_canonical()
+        else:
+            type_ = type_.get_pointee().get_canonical()
+    if type_.kind == TypeKind.ENUM:
+        mods.add(type_.get_declaration().module_name)
+        return mods
+    if not type_.is_record:
+        return mods
+
+    # String classes are converted to str
+    decl = type_.get_declaration()
+    if Generator.string_casters and decl.qualified_name in STRING_CASTER_TYPES:
+        return mods
+
+    mods.add(decl.module_name)
+    for i in range(type_.type.get_num_template_arguments()):
+        arg = type_.type.get_template_argument_type(i)
+        if arg.kind != TypeKind.INVALID:
+            mods.update(type_modules(TypeBinder(arg)))
+    return mods
+
+
+def usage_key(binder):
+    """
+    Get the key of a declaration in the usage profile.
+    :param binder.core.CursorBinder binder: The binder.
+    :return: The qualified name or the type spelling of untagged enums.
+    :rtype: str
+    """
+    return binder.qualified_name or binder.type.spelling
+
+
+def type_declarations(type_):
+    """
+    Get the declarations a type refers to, including its template arguments
+    (e.g., "opencascade::handle<Geom_Curve>").
+    :param binder.core.TypeBinder type_: The type.
+    :return: The qualified names of the enums and classes and the canonical
+        spellings of class template specializations.
+    :rtype: set(str)
+    """
+    names = set()
+    type_ = type_.get_canonical()
+    while type_.is_pointer_like or type_.is_array_like:
+        if type_.is_array_like:
+            type_ = TypeBinder(type_.type.element_type).get_canonical()
+        else:
+            type_ = type_.get_pointee().get_canonical()
+    if type_.kind == TypeKind.ENUM:
+        names.add(type_.get_declaration().qualified_name)
+        return names
+    if not type_.is_record:
+        return names
+
+    names.add(type_.get_declaration().qualified_name)
+    names.add(type_.spelling)
+    for i in range(type_.type.get_num_template_arguments()):
+        arg = type_.type.get_template_argument_type(i)
+        if arg.kind != TypeKind.INVALID:
+            names.update(type_declarations(TypeBinder(arg)))
+    return names
+
+
+def conversion_rank(type_):
+    """
+    Rank how specific a parameter type is when pybind11 tries to match it.
+    Python bools are also integers and integers are also accepted as floats so
+    they are ranked in that order.
+    :param binder.core.TypeBinder type_: The parameter type.
+    :return: 0 for bool, 1 for other integer and enum types, 2 for floating
+        point types, 3 for handles and classes, and 4 for types with
+        registered implicit conversions.
+    :rtype: int
+    """
+    if type_.is_pointer_like:
+        type_ = type_.get_pointee()
+    canonical = type_.get_canonical()
+    category = conversion_category(type_)
+    if category == 'bool':
+        return 0
+    if category == 'int' or canonical.kind == TypeKind.ENUM:
+        return 1
+    if category == 'float':
+        return 2
+    spelling = canonical.spelling.replace('const ', '').replace(' ', '')
+    if spelling in Generator.implicit_types:
+        return 4
+    return 3
+
+
+def implicit_targets(line):
+    """
+    Find the target types of the implicit conversions registered in a line of
+    the configuration file (e.g., "py::implicitly_convertible<int, A<B, C>>()").
+    The template arguments are split at the top level so they may contain
+    template arguments themselves. Spaces are removed from the types.
+    :param str line: The line.
+    :return: The target types.
+    :rtype: list(str)
+    """
+    targets = []
+    key = 'implicitly_convertible<'
+    start = line.find(key)
+    while start >= 0:
+        args, brackets, arg_start = [], [], start + len(key)
+        for i in range(arg_start, len(line)):
+            c = line[i]
+            if c in '<([':
+                brackets.append(c)
+            elif c in ')]':
+                brackets.pop()
+            elif c == '>' and brackets:
+                # Comparisons are only expected inside parentheses
+                if brackets[-1] == '<':
+                    brackets.pop()
+            elif c == '>':
+                args.append(line[arg_start:i])
+                break
+            elif c == ',' and not brackets:
+                args.append(line[arg_start:i])
+                arg_start = i + 1
+        if len(args) == 2:
+            targets.append(args[1].replace(' ', ''))
+        start = line.find(key, start + len(key))
+    return targets
+
+
+def conversion_category(type_):
+    """
+    Categorize a parameter type by the Python type it is matched with.
+    :param binder.core.TypeBinder type_: The parameter type.
+    :return: The category.
+    :rtype: str
+    """
+    if type_.is_pointer_like:
+        type_ = type_.get_pointee()
+    canonical = type_.get_canonical()
+    if canonical.kind == TypeKind.BOOL:
+        return 'bool'
+    if canonical.kind in [TypeKind.FLOAT, TypeKind.DOUBLE, TypeKind.LONGDOUBLE]:
+        return 'float'
+    if type_.is_arithmetic:
+        return 'int'
+    return canonical.spelling.replace('const ', '')
+
+
+def sort_overloads(binders):
+    """
+    Sort function binders so overloads of the same name are next to each other
+    and ordered from the most to least specific parameter types. Overloads that
+    Python cannot tell apart are logged.
+    :param list(binder.core.CursorBinder) binders: The binders.
+    :return: The sorted binders.
+    :rtype: list(binder.core.CursorBinder)
+    """
+    groups = OrderedDict()
+    for binder in binders:
+        key = binder.spelling, binder.is_static_method
+        if key in groups:
+            groups[key].append(binder)
+        else:
+            groups[key] = [binder]
+
+    sorted_binders = []
+    for group in groups.values():
+        ranks = []
+        for binder in group:
+            rank = [conversion_rank(p.type) for p in binder.parameters]
+            ranks.append((max(rank + [0]), sum(rank) / max(len(rank), 1)))
+        indices = sorted(range(len(group)), key=lambda i: ranks[i])
+        group = [group[i] for i in indices]
+        sorted_binders += group
+
+        # Check for ambiguous overloads
+        signatures = {}
+        for binder in group:
+            if not binder.is_public:
+                continue
+            signature = tuple([conversion_category(p.type) for p in binder.parameters])
+            if signature in signatures:
+                other = signatures[signature]
+                msg = '\tAmbiguous overloads: {} <--> {}\n'.format(
+                    other.qualified_display_name, binder.qualified_display_name)
+                logger.write(msg)
+            else:
+                signatures[signature] = binder
+
+    return sorted_binders
+
+
+def bindable_defaults(binder, nargs, ndefaults):
+    """
+    Find the first parameter of the trailing parameters whose default values
+    can all be given to pybind11 instead of binding truncated signatures.
+    :param binder.core.CursorBinder binder: The binder.
+    :param int nargs: Number of arguments.
+    :param int ndefaults: Number of default values.
+    :return: Index of the first parameter or the number of arguments if none.
+    :rtype: int
+    """
+    params = binder.parameters
+    i = nargs
+    while i > nargs - ndefaults and params[i - 1].bindable_default_value:
+        i -= 1
+    return i
+
+
+def py_arguments(binder, names, first_default):
+    """
+    Generate the pybind11 argument annotations.
+    :param binder.core.CursorBinder binder: The binder.
+    :param list(str) names: The argument names.
+    :param int first_default: Index of the first argument to give a default
+        value.
+    :return: The argument annotations.
+    :rtype: str
+    """
+    params = binder.parameters
+    noconvert = match_qname(binder.qualified_name, Generator.noconvert)
+    py_args = []
+    for i, name in enumerate(names):
+        default_value = ''
+        if i >= first_default:
+            default_value = '=' + params[i].bindable_default_value
+        if noconvert and conversion_rank(params[i].type) < 3:
+            default_value = '.noconvert()' + default_value
+        py_args.append(', py::arg(\"{}\"){}'.format(name, default_value))
+    return ''.join(py_args)
+
+
 def generate_immutable_inout_method(binder, qname):
     """
     Generate binding for a function that modifies immutable types in place.
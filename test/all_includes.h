@@ -1,7 +1,20 @@
+#include <Test_Array.h>
+#include <Test_Vectorize.h>
+#include <Test_Pickle.h>
+#include <Test_Hash.h>
+#include <Test_Explorer.h>
+#include <Test_CArray.h>
+#include <Test_String.h>
+#include <Test_Geometry.h>
+#include <Test_Sequence.h>
 #include <Test_Class.h>
 #include <Test_Enum.h>
 #include <Test_Getter.h>
 #include <Test_KeepAlive.h>
+#include <Test_Default.h>
+#include <Test_Overload.h>
 #include <Test_Pname.h>
 #include <Test_Template.h>
 #include <TestSplit_Module.h>
+#include <TestMiddle_Module.h>
+#include <TestReduce_Module.h>
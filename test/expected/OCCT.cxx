@@ -0,0 +1,114 @@
+/*
+This file is part of pyOCCT which provides Python bindings to the OpenCASCADE
+geometry kernel.
+
+Copyright (C) 2016-2018  Laughlin Research, LLC
+Copyright (C) 2019-2020  Trevor Laughlin and the pyOCCT contributors
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation; either
+version 2.1 of the License, or (at your option) any later version.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+*/
+#include <pyOCCT_Common.hxx>
+#include <pyOCCT_Visibility.hxx>
+#include <pyOCCT_Strings.hxx>
+#include <pyOCCT_Downcast.hxx>
+#include <pyOCCT_Serialize.hxx>
+#include <pyOCCT_Monolithic.hxx>
+#include <pyOCCT_Profile.hxx>
+#include <pyOCCT_Calls.hxx>
+
+#include <atomic>
+#include <map>
+#include <mutex>
+#include <tuple>
+
+// Submodules of the extension and their initialization functions
+struct pyOCCT_Submodule {
+    enum State { Uninitialized, Initializing, Initialized };
+
+    py::handle mod;
+    void (*init)(py::module &);
+    std::atomic<int> state;
+
+    pyOCCT_Submodule(py::handle mod, void (*init)(py::module &)) : mod(mod), init(init), state(Uninitialized) {}
+};
+
+static std::map<std::string, pyOCCT_Submodule> &pyOCCT_Submodules() {
+    static std::map<std::string, pyOCCT_Submodule> submodules;
+    return submodules;
+}
+
+py::module pyOCCT_Import(const std::string &name) {
+    pyOCCT_Submodule &sub = pyOCCT_Submodules().at(name);
+    py::module mod = py::reinterpret_borrow<py::module>(sub.mod);
+    if (sub.state.load(std::memory_order_acquire) == pyOCCT_Submodule::Initialized)
+        return mod;
+
+    // Submodules are initialized under a lock that is waited for without
+    // holding the GIL since the thread initializing a submodule may need it
+    static std::recursive_mutex mutex;
+    std::unique_lock<std::recursive_mutex> lock(mutex, std::defer_lock);
+    if (!lock.try_lock()) {
+        py::gil_scoped_release release;
+        lock.lock();
+    }
+
+    // A circular import by the initializing thread gets the partial submodule
+    if (sub.state.load(std::memory_order_acquire) != pyOCCT_Submodule::Uninitialized)
+        return mod;
+    sub.state.store(pyOCCT_Submodule::Initializing, std::memory_order_relaxed);
+    try {
+        sub.init(mod);
+    } catch (...) {
+        sub.state.store(pyOCCT_Submodule::Uninitialized, std::memory_order_relaxed);
+        throw;
+    }
+    sub.state.store(pyOCCT_Submodule::Initialized, std::memory_order_release);
+    return mod;
+}
+
+// Add a submodule that is registered in sys.modules but only initialized on
+// the first access of one of its attributes
+static void pyOCCT_AddSubmodule(py::module &m, const char *name, void (*init)(py::module &)) {
+    py::module mod = m.def_submodule(name);
+    py::module::import("sys").attr("modules")[mod.attr("__name__")] = mod;
+    pyOCCT_Submodules().emplace(std::piecewise_construct, std::forward_as_tuple(name), std::forward_as_tuple(mod, init));
+    std::string key(name);
+    std::string qname = py::str(mod.attr("__name__"));
+    mod.def("__getattr__", [key, qname](const std::string &attr) -> py::object {
+        // Special attributes looked up by the import system don't initialize
+        bool special = attr.size() > 4 && attr.compare(0, 2, "__") == 0 && attr != "__all__";
+        if (!special) {
+            py::dict attrs = pyOCCT_Import(key).attr("__dict__");
+            if (attrs.contains(attr))
+                return attrs[attr.c_str()];
+        }
+        throw py::attribute_error("module '" + qname + "' has no attribute '" + attr + "'");
+    });
+}
+
+// Functions of the submodules
+PYOCCT_HIDDEN void init_Test(py::module &);
+PYOCCT_HIDDEN void init_TestSplit(py::module &);
+PYOCCT_HIDDEN void init_TestMiddle(py::module &);
+PYOCCT_HIDDEN void init_TestReduce(py::module &);
+
+PYBIND11_MODULE(OCCT, m, py::mod_gil_not_used()) {
+
+pyOCCT_AddSubmodule(m, "Test", &init_Test);
+pyOCCT_AddSubmodule(m, "TestSplit", &init_TestSplit);
+pyOCCT_AddSubmodule(m, "TestMiddle", &init_TestMiddle);
+pyOCCT_AddSubmodule(m, "TestReduce", &init_TestReduce);
+
+}
@@ -20,17 +20,190 @@ License along with this library; if not, write to the Free Software
 Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
 */
 #include <pyOCCT_Common.hxx>
+#include <pyOCCT_Visibility.hxx>
+#include <pyOCCT_Strings.hxx>
+#include <pyOCCT_Downcast.hxx>
+#include <pyOCCT_Serialize.hxx>
+#include <pyOCCT_Monolithic.hxx>
+#include <pyOCCT_Profile.hxx>
+#include <pyOCCT_Calls.hxx>
 #include <Test_Enum.h>
+#include <Test_Vectorize.h>
+#include <pyOCCT_Buffer.hxx>
+#include <Test_CArray.h>
+#include <Test_Array.h>
+#include <Test_Pickle.h>
+#include <pybind11/numpy.h>
+#include <Test_Hash.h>
+#include <Test_Explorer.h>
+#include <TCollection_AsciiString.hxx>
+#include <TCollection_ExtendedString.hxx>
+#include <Test_String.h>
+#include <Standard_Transient.hxx>
+#include <Test_Geometry.h>
+#include <Test_Sequence.h>
 #include <Test_Class.h>
 #include <Test_Getter.h>
 #include <Test_KeepAlive.h>
+#include <Test_Default.h>
+#include <Test_Overload.h>
 #include <Test_Pname.h>
+#include <Test_Template.h>
+#include <bind_Test_Array1.hxx>
+#include <bind_Test_Array2.hxx>
+#include <bind_Test_Sequence.hxx>
+#include <bind_Test_Map.hxx>
+#include <bind_Test_Template.hxx>
+#include <atomic>
+
+extern template void bind_Test_Array1<double>(py::module &, std::string const &, py::module_local const &);
+extern template void bind_Test_Array2<Test_Pnt>(py::module &, std::string const &, py::module_local const &);
+extern template void bind_Test_Sequence<double>(py::module &, std::string const &, py::module_local const &);
+extern template void bind_Test_Sequence<Test_Pnt>(py::module &, std::string const &, py::module_local const &);
+extern template void bind_Test_Sequence<Test_Curve>(py::module &, std::string const &, py::module_local const &);
+extern template void bind_Test_Map<int, int>(py::module &, std::string const &, py::module_local const &);
+extern template void bind_Test_Sequence<Test_Triangle>(py::module &, std::string const &, py::module_local const &);
+extern template void bind_Test_Template<double>(py::module &, std::string const &, py::module_local const &);
+
+struct ImportTestSplit{
+	ImportTestSplit() {
+		static std::atomic<bool> imported(false);
+		if (!imported.load(std::memory_order_acquire)) {
+			pyOCCT_Import("TestSplit");
+			imported.store(true, std::memory_order_release);
+		}
+	}
+};
+
+struct pyOCCT_Calls_Test;
 
 // Testing +before_module line 1
 // Testing +before_module line 2
 
-PYBIND11_MODULE(Test, mod) {
+PYOCCT_HIDDEN void init_Test(py::module &mod) {
+
+pyOCCT_Mutex();
+
+PYOCCT_PROFILE_START(mod);
+
 
+PYOCCT_PROFILE_MARK("(imports)");
+
+pyOCCT_BindCallStats<pyOCCT_Calls_Test>(mod, {
+	"Test_Curve_Span",
+	"Test_Norm",
+	"Test_XYZ::Test_XYZ",
+	"Test_Pnt::Test_Pnt",
+	"Test_Curve::Test_Curve",
+	"Test_Curve::Value",
+	"Test_Curve::Parameter",
+	"Test_Curve::Distance",
+	"Test_Curve::Evaluate",
+	"Test_Curve::IsClosed",
+	"Test_Curve::Length",
+	"Test_Vector::Test_Vector",
+	"Test_Vector::Test_Vector",
+	"Test_Vector::Test_Vector",
+	"Test_Vector::X",
+	"Test_Vector::Y",
+	"Test_Vector::pickle",
+	"Test_Range::Test_Range",
+	"Test_Range::U",
+	"Test_Aggregate::Test_Aggregate",
+	"Test_Aggregate::pickle",
+	"Test_NoPickleField::Test_NoPickleField",
+	"Test_NoPickle::Test_NoPickle",
+	"Test_Shape::Test_Shape",
+	"Test_Shape::pickle",
+	"Test_Shape::__eq__",
+	"Test_Shape::__hash__",
+	"Test_Triangle::Test_Triangle",
+	"Test_Triangle::pickle",
+	"Test_Key::Test_Key",
+	"Test_Key::HashCode",
+	"Test_Key::IsSame",
+	"Test_Key::IsEqual",
+	"Test_Key::__eq__",
+	"Test_Key::__hash__",
+	"Test_Label::Test_Label",
+	"Test_Label::operator==",
+	"Test_Label::__hash__",
+	"Test_Tolerant::Test_Tolerant",
+	"Test_Tolerant::HashCode",
+	"Test_Tolerant::IsEqual",
+	"Test_NoHash::Test_NoHash",
+	"Test_NoHash::HashCode",
+	"Test_NoHash::IsEqual",
+	"Test_Explorer::Test_Explorer",
+	"Test_Explorer::More",
+	"Test_Explorer::Next",
+	"Test_Explorer::Current",
+	"Test_Explorer::__next__",
+	"Test_Explorer::collect",
+	"Test_MapIterator::Test_MapIterator",
+	"Test_MapIterator::More",
+	"Test_MapIterator::Next",
+	"Test_MapIterator::Key",
+	"Test_MapIterator::__next__",
+	"Test_Frame::Test_Frame",
+	"Test_Frame::Test_Frame",
+	"Test_Frame::SetOrigin",
+	"Test_Frame::Origin",
+	"Test_Frame::SetMatrix",
+	"Test_Frame::SetPoints",
+	"Test_Frame::Sum",
+	"Test_Frame::SetFlags",
+	"Test_Named::Test_Named",
+	"Test_Named::Test_Named",
+	"Test_Named::Name",
+	"Test_Named::SetName",
+	"Test_Named::Comment",
+	"Test_Named::SetComment",
+	"Test_Named::Rename",
+	"Test_Geometry::Test_Geometry",
+	"Test_Geometry::get_type_descriptor",
+	"Test_Geometry::DynamicType",
+	"Test_Line::Test_Line",
+	"Test_Line::Reversed",
+	"Test_SequenceOfReal::to_list",
+	"Test_SequenceOfReal::to_numpy",
+	"Test_SequenceOfReal::Test_SequenceOfReal",
+	"Test_SequenceOfPnt::to_list",
+	"Test_SequenceOfPnt::to_numpy",
+	"Test_SequenceOfPnt::Test_SequenceOfPnt",
+	"Test_SequenceOfCurve::to_list",
+	"Test_SequenceOfCurve::Test_SequenceOfCurve",
+	"Test_MapOfInteger::to_list",
+	"Test_MapOfInteger::to_numpy",
+	"Test_SequenceOfTriangle::to_list",
+	"Test_SequenceOfTriangle::to_numpy",
+	"Test_SequenceOfTriangle::Test_SequenceOfTriangle",
+	"Test_SimpleClass::Test_SimpleClass",
+	"Test_SimpleClass::TestReturnPolicy1",
+	"Test_SimpleClass::TestReturnPolicy2",
+	"Test_SimpleClass::TestReturnPolicy3",
+	"Test_Getter::Test_Getter",
+	"Test_Getter::OtherValue",
+	"Test_Getter::Value",
+	"Test_Getter::SetValue",
+	"Test_Node::Test_Node",
+	"Test_Mesh::Test_Mesh",
+	"Test_Mesh::AddNode",
+	"Test_Default::Test_Default",
+	"Test_Default::Arithmetic",
+	"Test_Default::Mixed",
+	"Test_Default::Pointer",
+	"Test_Default::Member",
+	"Test_Overload::Test_Overload",
+	"Test_Overload::Test_Overload",
+	"Test_Overload::Set",
+	"Test_Overload::Set",
+	"Test_Overload::Set",
+	"Test_Overload::Other",
+	"Test_Overload::Exact",
+	"Test_Overload::Exact",
+	"Test_Pname::Test_Pname"
+});
 
 // ENUM: 
 py::enum_<TaggedEnum>(mod, "TaggedEnum", "None")
@@ -42,6 +215,369 @@ mod.attr("UnTaggedEnum_A") = py::cast(int(UnTaggedEnum_A));
 mod.attr("UnTaggedEnum_B") = py::cast(int(UnTaggedEnum_B));
 
 
+PYOCCT_PROFILE_MARK("(anonymous)");
+
+// FUNCTION: TEST_CURVE_SPAN
+mod.def("Test_Curve_Span", (double (*) (const double, const double)) &Test_Curve_Span, "None", py::arg("U1"), py::arg("U2"), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 0>>());
+
+mod.def("Test_Curve_Span", [](pyOCCT_Vector<double>::array_type U1, pyOCCT_Vector<double>::array_type U2) { return pyOCCT_Vectorize([&](const double &U1, const double &U2) { return Test_Curve_Span(U1, U2); }, pyOCCT_Vector<double>(U1), pyOCCT_Vector<double>(U2)); }, "None", py::arg("U1"), py::arg("U2"), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 0>>());
+
+PYOCCT_PROFILE_MARK("Test_Curve_Span");
+
+// FUNCTION: TEST_NORM
+mod.def("Test_Norm", [](pyOCCT_Array<double>::array_type a0) -> double { return Test_Norm(pyOCCT_Array<double>::data(a0, {3})); }, "Test function with a C array parameter", py::arg("theVector"), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 1>>());
+
+PYOCCT_PROFILE_MARK("Test_Norm");
+
+// CLASS: TEST_XYZ
+py::class_<Test_XYZ> cls_Test_XYZ(mod, "Test_XYZ", "Test coordinates");
+
+// Constructors
+cls_Test_XYZ.def(py::init<>(), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 2>>());
+
+PYOCCT_PROFILE_MARK("Test_XYZ");
+
+// CLASS: TEST_PNT
+py::class_<Test_Pnt> cls_Test_Pnt(mod, "Test_Pnt", "Test point");
+
+// Constructors
+cls_Test_Pnt.def(py::init<>(), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 3>>());
+
+PYOCCT_PROFILE_MARK("Test_Pnt");
+
+// TYPEDEF: TEST_ARRAY1OFREAL
+bind_Test_Array1<double>(mod, "Test_Array1OfReal", py::module_local(false));
+
+PYOCCT_PROFILE_MARK("Test_Array1OfReal");
+
+// TYPEDEF: TEST_ARRAY2OFPNT
+bind_Test_Array2<Test_Pnt>(mod, "Test_Array2OfPnt", py::module_local(false));
+
+PYOCCT_PROFILE_MARK("Test_Array2OfPnt");
+
+// CLASS: TEST_CURVE
+py::class_<Test_Curve> cls_Test_Curve(mod, "Test_Curve", "Test curve");
+
+// Constructors
+cls_Test_Curve.def(py::init<>(), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 4>>());
+
+// Methods
+cls_Test_Curve.def("Value", (Test_Pnt (Test_Curve::*)(const double) const) &Test_Curve::Value, "None", py::arg("U"), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 5>, py::gil_scoped_release>());
+cls_Test_Curve.def("Value", [](const Test_Curve &self, pyOCCT_Vector<double>::array_type U) { return pyOCCT_Vectorize<py::gil_scoped_release>([&](const double &U) { return self.Value(U); }, pyOCCT_Vector<double>(U)); }, "None", py::arg("U"), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 5>>());
+cls_Test_Curve.def("Parameter", (double (Test_Curve::*)(const Test_Pnt &) const) &Test_Curve::Parameter, "None", py::arg("P"), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 6>>());
+cls_Test_Curve.def("Parameter", [](const Test_Curve &self, pyOCCT_Vector<Test_Pnt>::array_type P) { return pyOCCT_Vectorize([&](const Test_Pnt &P) { return self.Parameter(P); }, pyOCCT_Vector<Test_Pnt>(P)); }, "None", py::arg("P"), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 6>>());
+cls_Test_Curve.def("Distance", (double (Test_Curve::*)(const double, const Test_Pnt &) const) &Test_Curve::Distance, "None", py::arg("U"), py::arg("P"), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 7>>());
+cls_Test_Curve.def("Distance", [](const Test_Curve &self, pyOCCT_Vector<double>::array_type U, const Test_Pnt & P) { return pyOCCT_Vectorize([&](const double &U) { return self.Distance(U, P); }, pyOCCT_Vector<double>(U)); }, "None", py::arg("U"), py::arg("P"), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 7>>());
+cls_Test_Curve.def("Evaluate", (void (Test_Curve::*)(const double, Test_Pnt &) const) &Test_Curve::Evaluate, "None", py::arg("U"), py::arg("P"), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 8>>());
+cls_Test_Curve.def("IsClosed", (bool (Test_Curve::*)() const) &Test_Curve::IsClosed, "None", py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 9>>());
+cls_Test_Curve.def_static("Length_", (double (*)(const double, const double)) &Test_Curve::Length, "None", py::arg("U1"), py::arg("U2"), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 10>>());
+cls_Test_Curve.def_static("Length_", [](pyOCCT_Vector<double>::array_type U1, pyOCCT_Vector<double>::array_type U2) { return pyOCCT_Vectorize([&](const double &U1, const double &U2) { return Test_Curve::Length(U1, U2); }, pyOCCT_Vector<double>(U1), pyOCCT_Vector<double>(U2)); }, "None", py::arg("U1"), py::arg("U2"), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 10>>());
+
+PYOCCT_PROFILE_MARK("Test_Curve");
+
+// CLASS: TEST_VECTOR
+py::class_<Test_Vector> cls_Test_Vector(mod, "Test_Vector", "Test class pickled by its constructor and getters");
+
+// Constructors
+cls_Test_Vector.def(py::init<>(), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 11>>());
+cls_Test_Vector.def(py::init<const double, const double>(), py::arg("theXv"), py::arg("theYv"), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 12>>());
+cls_Test_Vector.def(py::init<const double>(), py::arg("theXv"), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 13>>());
+
+// Methods
+cls_Test_Vector.def("X", (double (Test_Vector::*)() const) &Test_Vector::X, "None", py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 14>>());
+cls_Test_Vector.def("Y", (double (Test_Vector::*)() const) &Test_Vector::Y, "None", py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 15>>());
+
+// Pickle
+cls_Test_Vector.def(py::pickle([](Test_Vector const &self) { return py::make_tuple(self.X(), self.Y()); }, [](py::tuple t) { if (t.size() != 2) throw std::runtime_error("Invalid state."); return Test_Vector(t[0].cast<double>(), t[1].cast<double>()); }), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 16>>());
+
+PYOCCT_PROFILE_MARK("Test_Vector");
+
+// CLASS: TEST_RANGE
+py::class_<Test_Range> cls_Test_Range(mod, "Test_Range", "Test class not pickled since its parameters match the same getter");
+
+// Constructors
+cls_Test_Range.def(py::init<const double, const double>(), py::arg("theUf"), py::arg("theUl"), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 17>>());
+
+// Methods
+cls_Test_Range.def("U", (double (Test_Range::*)() const) &Test_Range::U, "None", py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 18>>());
+
+PYOCCT_PROFILE_MARK("Test_Range");
+
+// CLASS: TEST_AGGREGATE
+py::class_<Test_Aggregate> cls_Test_Aggregate(mod, "Test_Aggregate", "Test aggregate pickled by its fields");
+
+// Constructors
+cls_Test_Aggregate.def(py::init<>(), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 19>>());
+
+// Fields
+cls_Test_Aggregate.def_readwrite("x", &Test_Aggregate::x, "None");
+cls_Test_Aggregate.def_readwrite("n", &Test_Aggregate::n, "None");
+cls_Test_Aggregate.def_readwrite("v", &Test_Aggregate::v, "None");
+
+// Pickle
+cls_Test_Aggregate.def(py::pickle([](Test_Aggregate const &self) { return py::make_tuple(self.x, self.n, self.v); }, [](py::tuple t) { if (t.size() != 3) throw std::runtime_error("Invalid state."); Test_Aggregate obj; obj.x = t[0].cast<double>(); obj.n = t[1].cast<int>(); obj.v = t[2].cast<Test_Vector>(); return obj; }), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 20>>());
+
+PYOCCT_PROFILE_MARK("Test_Aggregate");
+
+// CLASS: TEST_NOPICKLEFIELD
+py::class_<Test_NoPickleField> cls_Test_NoPickleField(mod, "Test_NoPickleField", "Test aggregate with a field that can't be pickled");
+
+// Constructors
+cls_Test_NoPickleField.def(py::init<>(), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 21>>());
+
+// Fields
+cls_Test_NoPickleField.def_readwrite("xyz", &Test_NoPickleField::xyz, "None");
+
+PYOCCT_PROFILE_MARK("Test_NoPickleField");
+
+// CLASS: TEST_NOPICKLE
+py::class_<Test_NoPickle> cls_Test_NoPickle(mod, "Test_NoPickle", "Test aggregate without pickle support");
+
+// Constructors
+cls_Test_NoPickle.def(py::init<>(), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 22>>());
+
+// Fields
+cls_Test_NoPickle.def_readwrite("x", &Test_NoPickle::x, "None");
+
+// NumPy dtype
+PYBIND11_NUMPY_DTYPE(Test_NoPickle, x);
+
+PYOCCT_PROFILE_MARK("Test_NoPickle");
+
+// CLASS: TEST_SHAPE
+py::class_<Test_Shape> cls_Test_Shape(mod, "Test_Shape", "Test class pickled by a serializer");
+
+// Constructors
+cls_Test_Shape.def(py::init<>(), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 23>>());
+
+// Pickle
+cls_Test_Shape.def(py::pickle(&pyOCCT_WriteShape, &pyOCCT_ReadShape), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 24>>());
+
+// Hash
+cls_Test_Shape.def("__eq__", &pyOCCT_IsSameShape, py::is_operator(), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 25>>());
+cls_Test_Shape.def("__hash__", &pyOCCT_HashShape, py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 26>>());
+
+PYOCCT_PROFILE_MARK("Test_Shape");
+
+// CLASS: TEST_TRIANGLE
+py::class_<Test_Triangle> cls_Test_Triangle(mod, "Test_Triangle", "Test structured record");
+
+// Constructors
+cls_Test_Triangle.def(py::init<>(), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 27>>());
+
+// Fields
+cls_Test_Triangle.def_readwrite("n1", &Test_Triangle::n1, "None");
+cls_Test_Triangle.def_readwrite("n2", &Test_Triangle::n2, "None");
+cls_Test_Triangle.def_readwrite("n3", &Test_Triangle::n3, "None");
+cls_Test_Triangle.def_readwrite("weight", &Test_Triangle::weight, "None");
+
+// NumPy dtype
+PYBIND11_NUMPY_DTYPE(Test_Triangle, n1, n2, n3, weight);
+
+// Pickle
+cls_Test_Triangle.def(py::pickle([](Test_Triangle const &self) { return py::make_tuple(self.n1, self.n2, self.n3, self.weight); }, [](py::tuple t) { if (t.size() != 4) throw std::runtime_error("Invalid state."); Test_Triangle obj; obj.n1 = t[0].cast<int>(); obj.n2 = t[1].cast<int>(); obj.n3 = t[2].cast<int>(); obj.weight = t[3].cast<float>(); return obj; }), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 28>>());
+
+PYOCCT_PROFILE_MARK("Test_Triangle");
+
+// CLASS: TEST_KEY
+py::class_<Test_Key> cls_Test_Key(mod, "Test_Key", "Test class hashed by its hash code and compared with IsSame");
+
+// Constructors
+cls_Test_Key.def(py::init<>(), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 29>>());
+
+// Methods
+cls_Test_Key.def("HashCode", (int (Test_Key::*)(const int) const) &Test_Key::HashCode, "None", py::arg("theUpperBound"), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 30>>());
+cls_Test_Key.def("IsSame", (bool (Test_Key::*)(const Test_Key &) const) &Test_Key::IsSame, "None", py::arg("theOther"), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 31>>());
+cls_Test_Key.def("IsEqual", (bool (Test_Key::*)(const Test_Key &) const) &Test_Key::IsEqual, "None", py::arg("theOther"), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 32>>());
+
+// Hash
+cls_Test_Key.def("__eq__", [](Test_Key const &self, Test_Key const &other) { return self.IsSame(other); }, py::is_operator(), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 33>>());
+cls_Test_Key.def("__hash__", [](Test_Key const &self) { return self.HashCode(std::numeric_limits<int>::max()); }, py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 34>>());
+
+PYOCCT_PROFILE_MARK("Test_Key");
+
+// CLASS: TEST_LABEL
+py::class_<Test_Label> cls_Test_Label(mod, "Test_Label", "Test class with a std::hash specialization and an equality operator");
+
+// Constructors
+cls_Test_Label.def(py::init<>(), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 35>>());
+
+// Methods
+cls_Test_Label.def("__eq__", (bool (Test_Label::*)(const Test_Label &) const) &Test_Label::operator==, py::is_operator(), "None", py::arg("theOther"), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 36>>());
+
+// Hash
+cls_Test_Label.def("__hash__", [](Test_Label const &self) { return std::hash<Test_Label>()(self); }, py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 37>>());
+
+PYOCCT_PROFILE_MARK("Test_Label");
+
+// CLASS: TEST_TOLERANT
+py::class_<Test_Tolerant> cls_Test_Tolerant(mod, "Test_Tolerant", "Test class compared with a tolerance that can't be hashed");
+
+// Constructors
+cls_Test_Tolerant.def(py::init<>(), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 38>>());
+
+// Methods
+cls_Test_Tolerant.def("HashCode", (int (Test_Tolerant::*)(const int) const) &Test_Tolerant::HashCode, "None", py::arg("theUpperBound"), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 39>>());
+cls_Test_Tolerant.def("IsEqual", (bool (Test_Tolerant::*)(const Test_Tolerant &, const double) const) &Test_Tolerant::IsEqual, "None", py::arg("theOther"), py::arg("theTol"), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 40>>());
+
+PYOCCT_PROFILE_MARK("Test_Tolerant");
+
+// CLASS: TEST_NOHASH
+py::class_<Test_NoHash> cls_Test_NoHash(mod, "Test_NoHash", "Test class without hash support");
+
+// Constructors
+cls_Test_NoHash.def(py::init<>(), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 41>>());
+
+// Methods
+cls_Test_NoHash.def("HashCode", (std::size_t (Test_NoHash::*)() const) &Test_NoHash::HashCode, "None", py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 42>>());
+cls_Test_NoHash.def("IsEqual", (bool (Test_NoHash::*)(const Test_NoHash &) const) &Test_NoHash::IsEqual, "None", py::arg("theOther"), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 43>>());
+
+PYOCCT_PROFILE_MARK("Test_NoHash");
+
+// CLASS: TEST_EXPLORER
+py::class_<Test_Explorer> cls_Test_Explorer(mod, "Test_Explorer", "Test explorer of the current items");
+
+// Constructors
+cls_Test_Explorer.def(py::init<>(), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 44>>());
+
+// Methods
+cls_Test_Explorer.def("More", (bool (Test_Explorer::*)() const) &Test_Explorer::More, "None", py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 45>>());
+cls_Test_Explorer.def("Next", (void (Test_Explorer::*)()) &Test_Explorer::Next, "None", py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 46>>());
+cls_Test_Explorer.def("Current", (const Test_Vector & (Test_Explorer::*)() const) &Test_Explorer::Current, "None", py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 47>>());
+
+// Iterator
+cls_Test_Explorer.def("__iter__", [](py::object self) { return self; });
+cls_Test_Explorer.def("__next__", [](Test_Explorer &self) { if (!self.More()) throw py::stop_iteration(); auto item = self.Current(); self.Next(); return item; }, py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 48>>());
+cls_Test_Explorer.def("collect", [](Test_Explorer &self) { py::list items; for (; self.More(); self.Next()) items.append(self.Current()); return items; }, py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 49>>());
+
+PYOCCT_PROFILE_MARK("Test_Explorer");
+
+// CLASS: TEST_MAPITERATOR
+py::class_<Test_MapIterator> cls_Test_MapIterator(mod, "Test_MapIterator", "Test iterator of the keys of a map");
+
+// Constructors
+cls_Test_MapIterator.def(py::init<>(), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 50>>());
+
+// Methods
+cls_Test_MapIterator.def("More", (bool (Test_MapIterator::*)() const) &Test_MapIterator::More, "None", py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 51>>());
+cls_Test_MapIterator.def("Next", (void (Test_MapIterator::*)()) &Test_MapIterator::Next, "None", py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 52>>());
+cls_Test_MapIterator.def("Key", (const int & (Test_MapIterator::*)() const) &Test_MapIterator::Key, "None", py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 53>>());
+
+// Iterator
+cls_Test_MapIterator.def("__iter__", [](py::object self) { return self; });
+cls_Test_MapIterator.def("__next__", [](Test_MapIterator &self) { if (!self.More()) throw py::stop_iteration(); auto item = self.Key(); self.Next(); return item; }, py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 54>>());
+
+PYOCCT_PROFILE_MARK("Test_MapIterator");
+
+// CLASS: TEST_FRAME
+py::class_<Test_Frame> cls_Test_Frame(mod, "Test_Frame", "Test class with C array parameters and fields");
+
+// Constructors
+cls_Test_Frame.def(py::init<>(), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 55>>());
+cls_Test_Frame.def(py::init([](pyOCCT_Array<double>::array_type a0) { return new Test_Frame(pyOCCT_Array<double>::data(a0, {3})); }), py::arg("theOrigin"), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 56>>());
+
+// Fields
+cls_Test_Frame.def_property("origin", [](py::object self) { return pyOCCT_Array<double>::view(self.cast<Test_Frame &>().origin, {3}, self, true); }, [](Test_Frame &self, pyOCCT_Array<double>::array_type array) { pyOCCT_Array<double>::assign(self.origin, array, {3}); }, "None");
+cls_Test_Frame.def_property("matrix", [](py::object self) { return pyOCCT_Array<double>::view(self.cast<Test_Frame &>().matrix, {3, 3}, self, true); }, [](Test_Frame &self, pyOCCT_Array<double>::array_type array) { pyOCCT_Array<double>::assign(self.matrix, array, {3, 3}); }, "None");
+cls_Test_Frame.def_property_readonly("ids", [](py::object self) { return pyOCCT_Array<int>::view(self.cast<Test_Frame &>().ids, {2}, self, false); }, "None");
+// cls_Test_Frame.def_readwrite("vectors", &Test_Frame::vectors, "None");
+
+// Methods
+cls_Test_Frame.def("SetOrigin", [](Test_Frame &self, pyOCCT_Array<double>::array_type a0) -> void { return self.SetOrigin(pyOCCT_Array<double>::data(a0, {3})); }, "None", py::arg("theOrigin"), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 57>>());
+cls_Test_Frame.def("Origin", [](Test_Frame &self, pyOCCT_Array<double>::mutable_array_type a0) -> void { return self.Origin(pyOCCT_Array<double>::mutable_data(a0, {3})); }, "None", py::arg("theOrigin"), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 58>>());
+cls_Test_Frame.def("SetMatrix", [](Test_Frame &self, pyOCCT_Array<double>::array_type a0) -> void { return self.SetMatrix(reinterpret_cast<const double (*)[3]>(pyOCCT_Array<double>::data(a0, {3, 3}))); }, "None", py::arg("theMatrix"), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 59>>());
+cls_Test_Frame.def("SetPoints", [](Test_Frame &self, pyOCCT_Array<Test_XYZ>::array_type a0) -> void { return self.SetPoints(pyOCCT_Array<Test_XYZ>::data(a0, {2})); }, "None", py::arg("thePoints"), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 60>>());
+cls_Test_Frame.def_static("Sum_", [](const int a0, pyOCCT_Array<double>::array_type a1) -> double { return Test_Frame::Sum(a0, pyOCCT_Array<double>::data(a1, {0})); }, "None", py::arg("theCount"), py::arg("theValues"), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 61>>());
+// cls_Test_Frame.def("SetFlags", (void (Test_Frame::*)(const bool [2])) &Test_Frame::SetFlags, "None", py::arg("theFlags"), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 62>>());
+
+PYOCCT_PROFILE_MARK("Test_Frame");
+
+// CLASS: TEST_NAMED
+py::class_<Test_Named> cls_Test_Named(mod, "Test_Named", "Test class with string parameters and return types");
+
+// Constructors
+cls_Test_Named.def(py::init<>(), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 63>, py::gil_scoped_release, pyOCCT_Serialize>());
+cls_Test_Named.def(py::init<const TCollection_AsciiString &>(), py::arg("theName"), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 64>, py::gil_scoped_release, pyOCCT_Serialize>());
+
+// Methods
+cls_Test_Named.def("Name", (const TCollection_AsciiString & (Test_Named::*)() const) &Test_Named::Name, "None", py::return_value_policy::reference_internal, py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 65>, py::gil_scoped_release, pyOCCT_Serialize>());
+cls_Test_Named.def("SetName", (void (Test_Named::*)(const TCollection_AsciiString &)) &Test_Named::SetName, "None", py::arg("theName"), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 66>, py::gil_scoped_release, pyOCCT_Serialize>());
+cls_Test_Named.def("Comment", (TCollection_ExtendedString (Test_Named::*)() const) &Test_Named::Comment, "None", py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 67>, py::gil_scoped_release, pyOCCT_Serialize>());
+cls_Test_Named.def("SetComment", (void (Test_Named::*)(const TCollection_ExtendedString &)) &Test_Named::SetComment, "None", py::arg("theComment"), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 68>, py::gil_scoped_release, pyOCCT_Serialize>());
+cls_Test_Named.def("Rename", [](Test_Named &self, TCollection_AsciiString & theName){ self.Rename(theName); return theName; }, "None", py::arg("theName"), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 69>, py::gil_scoped_release, pyOCCT_Serialize>());
+
+PYOCCT_PROFILE_MARK("Test_Named");
+
+// CLASS: TEST_GEOMETRY
+py::class_<Test_Geometry, opencascade::handle<Test_Geometry>, Standard_Transient> cls_Test_Geometry(mod, "Test_Geometry", "Test transient base class with its own RTTI");
+
+// Constructors
+cls_Test_Geometry.def(py::init<>(), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 70>>());
+
+// Methods
+cls_Test_Geometry.def_static("get_type_descriptor_", (const opencascade::handle<Standard_Type> & (*)()) &Test_Geometry::get_type_descriptor, "None", py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 71>>());
+cls_Test_Geometry.def("DynamicType", (const opencascade::handle<Standard_Type> & (Test_Geometry::*)() const) &Test_Geometry::DynamicType, "None", py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 72>>());
+
+// Downcasting
+pyOCCT_RegisterTransient<Test_Geometry>();
+
+PYOCCT_PROFILE_MARK("Test_Geometry");
+
+// CLASS: TEST_LINE
+py::class_<Test_Line, opencascade::handle<Test_Line>, Test_Geometry> cls_Test_Line(mod, "Test_Line", "Test transient class with a DownCast and the RTTI of its base");
+
+// Constructors
+cls_Test_Line.def(py::init<>(), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 73>>());
+
+// Methods
+cls_Test_Line.def("Reversed", (opencascade::handle<Test_Geometry> (Test_Line::*)() const) &Test_Line::Reversed, "None", py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 74>>());
+
+// Downcasting
+cls_Test_Line.def_static("DownCast", [](const opencascade::handle<Standard_Transient> &theObject) { return opencascade::handle<Test_Line>::DownCast(theObject); }, py::arg("theObject"));
+
+PYOCCT_PROFILE_MARK("Test_Line");
+
+// TYPEDEF: TEST_SEQUENCEOFREAL
+bind_Test_Sequence<double>(mod, "Test_SequenceOfReal", py::module_local(false));
+pyOCCT_BindToList<Test_Sequence<double>, double>(mod.attr("Test_SequenceOfReal"), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 75>>());
+pyOCCT_BindToNumpy<Test_Sequence<double>, double>(mod.attr("Test_SequenceOfReal"), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 76>>());
+pyOCCT_BindFromNumpy<Test_Sequence<double>, double>(mod.attr("Test_SequenceOfReal"), [](Test_Sequence<double> &self, const double &item) { self.Append(item); }, py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 77>>());
+pyOCCT_BindFromList<Test_Sequence<double>, double>(mod.attr("Test_SequenceOfReal"), [](Test_Sequence<double> &self, const double &item) { self.Append(item); }, py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 77>>());
+
+PYOCCT_PROFILE_MARK("Test_SequenceOfReal");
+
+// TYPEDEF: TEST_SEQUENCEOFPNT
+bind_Test_Sequence<Test_Pnt>(mod, "Test_SequenceOfPnt", py::module_local(false));
+pyOCCT_BindToList<Test_Sequence<Test_Pnt>, Test_Pnt>(mod.attr("Test_SequenceOfPnt"), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 78>>());
+pyOCCT_BindToNumpy<Test_Sequence<Test_Pnt>, Test_Pnt>(mod.attr("Test_SequenceOfPnt"), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 79>>());
+pyOCCT_BindFromNumpy<Test_Sequence<Test_Pnt>, Test_Pnt>(mod.attr("Test_SequenceOfPnt"), [](Test_Sequence<Test_Pnt> &self, const Test_Pnt &item) { self.Append(item); }, py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 80>>());
+pyOCCT_BindFromList<Test_Sequence<Test_Pnt>, Test_Pnt>(mod.attr("Test_SequenceOfPnt"), [](Test_Sequence<Test_Pnt> &self, const Test_Pnt &item) { self.Append(item); }, py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 80>>());
+
+PYOCCT_PROFILE_MARK("Test_SequenceOfPnt");
+
+// TYPEDEF: TEST_SEQUENCEOFCURVE
+bind_Test_Sequence<Test_Curve>(mod, "Test_SequenceOfCurve", py::module_local(false));
+pyOCCT_BindToList<Test_Sequence<Test_Curve>, Test_Curve>(mod.attr("Test_SequenceOfCurve"), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 81>>());
+pyOCCT_BindFromList<Test_Sequence<Test_Curve>, Test_Curve>(mod.attr("Test_SequenceOfCurve"), [](Test_Sequence<Test_Curve> &self, const Test_Curve &item) { self.Append(item); }, py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 82>>());
+
+PYOCCT_PROFILE_MARK("Test_SequenceOfCurve");
+
+// TYPEDEF: TEST_MAPOFINTEGER
+bind_Test_Map<int, int>(mod, "Test_MapOfInteger", py::module_local(false));
+pyOCCT_BindToList<Test_Map<int, int>, int>(mod.attr("Test_MapOfInteger"), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 83>>());
+pyOCCT_BindToNumpy<Test_Map<int, int>, int>(mod.attr("Test_MapOfInteger"), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 84>>());
+
+PYOCCT_PROFILE_MARK("Test_MapOfInteger");
+
+// TYPEDEF: TEST_SEQUENCEOFTRIANGLE
+bind_Test_Sequence<Test_Triangle>(mod, "Test_SequenceOfTriangle", py::module_local(false));
+pyOCCT_BindToList<Test_Sequence<Test_Triangle>, Test_Triangle>(mod.attr("Test_SequenceOfTriangle"), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 85>>());
+pyOCCT_BindToNumpy<Test_Sequence<Test_Triangle>, Test_Triangle>(mod.attr("Test_SequenceOfTriangle"), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 86>>());
+pyOCCT_BindFromNumpy<Test_Sequence<Test_Triangle>, Test_Triangle>(mod.attr("Test_SequenceOfTriangle"), [](Test_Sequence<Test_Triangle> &self, const Test_Triangle &item) { self.Append(item); }, py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 87>>());
+pyOCCT_BindFromList<Test_Sequence<Test_Triangle>, Test_Triangle>(mod.attr("Test_SequenceOfTriangle"), [](Test_Sequence<Test_Triangle> &self, const Test_Triangle &item) { self.Append(item); }, py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 87>>());
+
+PYOCCT_PROFILE_MARK("Test_SequenceOfTriangle");
+
 // CLASS: TEST_SIMPLECLASS
 // Before type
 // Testing +before_type line 1
@@ -50,52 +586,107 @@ mod.attr("UnTaggedEnum_B") = py::cast(int(UnTaggedEnum_B));
 py::class_<Test_SimpleClass> cls_Test_SimpleClass(mod, "Test_SimpleClass", "Test class");
 
 // Constructors
-cls_Test_SimpleClass.def(py::init<>());
+cls_Test_SimpleClass.def(py::init<>(), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 88>>());
 
 // Methods
-cls_Test_SimpleClass.def("TestReturnPolicy1", (int (Test_SimpleClass::*)()) &Test_SimpleClass::TestReturnPolicy1, "None");
-cls_Test_SimpleClass.def("TestReturnPolicy2", (const int & (Test_SimpleClass::*)()) &Test_SimpleClass::TestReturnPolicy2, "None");
-cls_Test_SimpleClass.def("TestReturnPolicy3", (int & (Test_SimpleClass::*)()) &Test_SimpleClass::TestReturnPolicy3, "None", py::return_value_policy::reference_internal);
+cls_Test_SimpleClass.def("TestReturnPolicy1", (int (Test_SimpleClass::*)()) &Test_SimpleClass::TestReturnPolicy1, "None", py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 89>>());
+cls_Test_SimpleClass.def("TestReturnPolicy2", (const int & (Test_SimpleClass::*)()) &Test_SimpleClass::TestReturnPolicy2, "None", py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 90>>());
+cls_Test_SimpleClass.def("TestReturnPolicy3", (int & (Test_SimpleClass::*)()) &Test_SimpleClass::TestReturnPolicy3, "None", py::return_value_policy::reference_internal, py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 91>>());
 
 // After type
 // Testing +after_type line 1
 // Testing +after_type line 2
 
+PYOCCT_PROFILE_MARK("Test_SimpleClass");
+
 // TYPEDEF: TAGGEDENUM
 
+PYOCCT_PROFILE_MARK("TaggedEnum");
+
 // TYPEDEF: UNTAGGEDENUM
 
+PYOCCT_PROFILE_MARK("UnTaggedEnum");
+
 // CLASS: TEST_GETTER
 py::class_<Test_Getter> cls_Test_Getter(mod, "Test_Getter", "None");
 
 // Constructors
-cls_Test_Getter.def(py::init<>());
+cls_Test_Getter.def(py::init<>(), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 92>>());
 
 // Methods
-cls_Test_Getter.def("OtherValue", (int & (Test_Getter::*)()) &Test_Getter::OtherValue, "None");
-cls_Test_Getter.def("Value", (int & (Test_Getter::*)()) &Test_Getter::Value, "None", py::return_value_policy::reference_internal);
-cls_Test_Getter.def("SetValue", (int (Test_Getter::*)()) &Test_Getter::SetValue, "None");
+cls_Test_Getter.def("OtherValue", (int & (Test_Getter::*)()) &Test_Getter::OtherValue, "None", py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 93>>());
+cls_Test_Getter.def("Value", (int & (Test_Getter::*)()) &Test_Getter::Value, "None", py::return_value_policy::reference_internal, py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 94>>());
+cls_Test_Getter.def("SetValue", (int (Test_Getter::*)()) &Test_Getter::SetValue, "None", py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 95>>());
+
+PYOCCT_PROFILE_MARK("Test_Getter");
 
 // CLASS: TEST_NODE
 py::class_<Test_Node> cls_Test_Node(mod, "Test_Node", "None");
 
 // Constructors
-cls_Test_Node.def(py::init<>());
+cls_Test_Node.def(py::init<>(), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 96>>());
+
+PYOCCT_PROFILE_MARK("Test_Node");
 
 // CLASS: TEST_MESH
 py::class_<Test_Mesh> cls_Test_Mesh(mod, "Test_Mesh", "None");
 
 // Constructors
-cls_Test_Mesh.def(py::init<>());
+cls_Test_Mesh.def(py::init<>(), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 97>>());
 
 // Methods
-cls_Test_Mesh.def("AddNode", (void (Test_Mesh::*)(const int, Test_Node *)) &Test_Mesh::AddNode, "None", py::arg("id"), py::arg("node"), py::keep_alive<1, 2>());
+cls_Test_Mesh.def("AddNode", (void (Test_Mesh::*)(const int, Test_Node *)) &Test_Mesh::AddNode, "None", py::arg("id"), py::arg("node"), py::keep_alive<1, 2>(), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 98>>());
+
+PYOCCT_PROFILE_MARK("Test_Mesh");
+
+// CLASS: TEST_DEFAULT
+py::class_<Test_Default> cls_Test_Default(mod, "Test_Default", "None");
+
+// Constructors
+cls_Test_Default.def(py::init<int, double>(), py::arg("a"), py::arg("b")=1.0, py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 99>, py::gil_scoped_release>());
+
+// Methods
+cls_Test_Default.def("Arithmetic", (void (Test_Default::*)(int, double, bool)) &Test_Default::Arithmetic, "None", py::arg("a"), py::arg("b")=-1.0, py::arg("c")=true, py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 100>>());
+cls_Test_Default.def("Mixed", [](Test_Default &self, int a0) -> void { return self.Mixed(a0); }, py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 101>>());
+cls_Test_Default.def("Mixed", (void (Test_Default::*)(int, Test_Node, double)) &Test_Default::Mixed, "None", py::arg("a"), py::arg("node"), py::arg("b")=0.5, py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 101>>());
+cls_Test_Default.def("Pointer", (void (Test_Default::*)(int, Test_Node *)) &Test_Default::Pointer, "None", py::arg("a"), py::arg("node")=nullptr, py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 102>>());
+cls_Test_Default.def("Member", [](Test_Default &self) -> void { return self.Member(); }, py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 103>>());
+cls_Test_Default.def("Member", (void (Test_Default::*)(int)) &Test_Default::Member, "None", py::arg("a"), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 103>>());
+
+PYOCCT_PROFILE_MARK("Test_Default");
+
+// CLASS: TEST_OVERLOAD
+py::class_<Test_Overload> cls_Test_Overload(mod, "Test_Overload", "None");
+
+// Constructors
+cls_Test_Overload.def(py::init<double, double>(), py::arg("x"), py::arg("y"), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 104>>());
+cls_Test_Overload.def(py::init<const Test_Node &>(), py::arg("node"), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 105>>());
+
+// Methods
+cls_Test_Overload.def("Set", (void (Test_Overload::*)(double)) &Test_Overload::Set, "None", py::arg("x"), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 106>, ImportTestSplit, py::gil_scoped_release, pyOCCT_Serialize>());
+cls_Test_Overload.def("Set", (void (Test_Overload::*)(float)) &Test_Overload::Set, "None", py::arg("x"), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 107>, ImportTestSplit, py::gil_scoped_release, pyOCCT_Serialize>());
+cls_Test_Overload.def("Set", (void (Test_Overload::*)(const Test_Node &)) &Test_Overload::Set, "None", py::arg("node"), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 108>, ImportTestSplit, py::gil_scoped_release, pyOCCT_Serialize>());
+cls_Test_Overload.def("Other", (void (Test_Overload::*)()) &Test_Overload::Other, "None", py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 109>>());
+cls_Test_Overload.def("Exact", (void (Test_Overload::*)(bool)) &Test_Overload::Exact, "None", py::arg("x").noconvert(), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 110>>());
+cls_Test_Overload.def("Exact", (void (Test_Overload::*)(int)) &Test_Overload::Exact, "None", py::arg("x").noconvert(), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 111>>());
+
+// After type
+py::implicitly_convertible<int, Test_Node>();
+
+PYOCCT_PROFILE_MARK("Test_Overload");
 
 // CLASS: TEST_PNAME
 py::class_<Test_Pname> cls_Test_NewName(mod, "Test_NewName", "Test class");
 
 // Constructors
-cls_Test_NewName.def(py::init<>());
+cls_Test_NewName.def(py::init<>(), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 112>>());
+
+PYOCCT_PROFILE_MARK("Test_Pname");
+
+// TYPEDEF: TEST_TEMPLATEDOUBLE
+bind_Test_Template<double>(mod, "Test_TemplateDouble", py::module_local(false));
+
+PYOCCT_PROFILE_MARK("Test_TemplateDouble");
 
 
 }
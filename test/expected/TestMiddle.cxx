@@ -0,0 +1,87 @@
+/*
+This file is part of pyOCCT which provides Python bindings to the OpenCASCADE
+geometry kernel.
+
+Copyright (C) 2016-2018  Laughlin Research, LLC
+Copyright (C) 2019-2020  Trevor Laughlin and the pyOCCT contributors
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation; either
+version 2.1 of the License, or (at your option) any later version.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+*/
+#include <pyOCCT_Common.hxx>
+#include <pyOCCT_Visibility.hxx>
+#include <pyOCCT_Strings.hxx>
+#include <pyOCCT_Downcast.hxx>
+#include <pyOCCT_Serialize.hxx>
+#include <pyOCCT_Monolithic.hxx>
+#include <pyOCCT_Profile.hxx>
+#include <pyOCCT_Calls.hxx>
+#include <Test_Class.h>
+#include <TestMiddle_Module.h>
+#include <Test_Template.h>
+#include <Test_Pickle.h>
+#include <bind_Test_Template.hxx>
+
+extern template void bind_Test_Template<int>(py::module &, std::string const &, py::module_local const &);
+
+struct pyOCCT_Calls_TestMiddle;
+
+PYOCCT_HIDDEN void init_TestMiddle(py::module &mod) {
+
+pyOCCT_Mutex();
+
+PYOCCT_PROFILE_START(mod);
+
+pyOCCT_Import("Test");
+
+PYOCCT_PROFILE_MARK("(imports)");
+
+pyOCCT_BindCallStats<pyOCCT_Calls_TestMiddle>(mod, {
+	"TestMiddle_Class::TestMiddle_Class",
+	"Test_Triangle::Test_Triangle",
+	"Test_Triangle::pickle"
+});
+
+// CLASS: TESTMIDDLE_CLASS
+py::class_<TestMiddle_Class, Test_SimpleClass> cls_TestMiddle_Class(mod, "TestMiddle_Class", "Test class importing its base class module");
+
+// Constructors
+cls_TestMiddle_Class.def(py::init<>(), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_TestMiddle, 0>>());
+
+PYOCCT_PROFILE_MARK("TestMiddle_Class");
+
+// TYPEDEF: TESTMIDDLE_TEMPLATEINT
+bind_Test_Template<int>(mod, "TestMiddle_TemplateInt", py::module_local());
+
+PYOCCT_PROFILE_MARK("TestMiddle_TemplateInt");
+
+// TYPEDEF: TESTMIDDLE_TRIANGLE
+py::class_<Test_Triangle> cls_TestMiddle_Triangle(mod, "TestMiddle_Triangle", "Test structured record", py::module_local());
+
+// Constructors
+cls_TestMiddle_Triangle.def(py::init<>(), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_TestMiddle, 1>>());
+
+// Fields
+cls_TestMiddle_Triangle.def_readwrite("n1", &Test_Triangle::n1, "None");
+cls_TestMiddle_Triangle.def_readwrite("n2", &Test_Triangle::n2, "None");
+cls_TestMiddle_Triangle.def_readwrite("n3", &Test_Triangle::n3, "None");
+cls_TestMiddle_Triangle.def_readwrite("weight", &Test_Triangle::weight, "None");
+
+// Pickle
+cls_TestMiddle_Triangle.def(py::pickle([](Test_Triangle const &self) { return py::make_tuple(self.n1, self.n2, self.n3, self.weight); }, [](py::tuple t) { if (t.size() != 4) throw std::runtime_error("Invalid state."); Test_Triangle obj; obj.n1 = t[0].cast<int>(); obj.n2 = t[1].cast<int>(); obj.n3 = t[2].cast<int>(); obj.weight = t[3].cast<float>(); return obj; }), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_TestMiddle, 2>>());
+
+PYOCCT_PROFILE_MARK("TestMiddle_Triangle");
+
+
+}
@@ -0,0 +1,117 @@
+/*
+This file is part of pyOCCT which provides Python bindings to the OpenCASCADE
+geometry kernel.
+
+Copyright (C) 2016-2018  Laughlin Research, LLC
+Copyright (C) 2019-2020  Trevor Laughlin and the pyOCCT contributors
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation; either
+version 2.1 of the License, or (at your option) any later version.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+*/
+#include <pyOCCT_Common.hxx>
+#include <pyOCCT_Visibility.hxx>
+#include <pyOCCT_Strings.hxx>
+#include <pyOCCT_Downcast.hxx>
+#include <pyOCCT_Serialize.hxx>
+#include <pyOCCT_Monolithic.hxx>
+#include <pyOCCT_Profile.hxx>
+#include <pyOCCT_Calls.hxx>
+#include <TestMiddle_Module.h>
+#include <TestSplit_Module.h>
+#include <Test_KeepAlive.h>
+#include <TestReduce_Module.h>
+#include <Test_Template.h>
+#include <atomic>
+
+struct ImportTestSplit{
+	ImportTestSplit() {
+		static std::atomic<bool> imported(false);
+		if (!imported.load(std::memory_order_acquire)) {
+			pyOCCT_Import("TestSplit");
+			imported.store(true, std::memory_order_release);
+		}
+	}
+};
+
+struct pyOCCT_Calls_TestReduce;
+
+PYOCCT_HIDDEN void init_TestReduce(py::module &mod) {
+
+py::options options;
+options.disable_function_signatures();
+
+pyOCCT_Mutex();
+
+PYOCCT_PROFILE_START(mod);
+
+pyOCCT_Import("TestMiddle");
+
+PYOCCT_PROFILE_MARK("(imports)");
+
+pyOCCT_BindCallStats<pyOCCT_Calls_TestReduce>(mod, {
+	"TestReduce_Class::TestReduce_Class",
+	"TestReduce_Class::Fill",
+	"TestReduce_Class::Scale",
+	"TestReduce_Class::Mode",
+	"TestReduce_Explorer::TestReduce_Explorer",
+	"TestReduce_Explorer::More",
+	"TestReduce_Explorer::Next",
+	"TestReduce_Explorer::Current",
+	"TestReduce_Explorer::__next__",
+	"TestReduce_Explorer::collect"
+});
+
+// CLASS: TESTREDUCE_CLASS
+py::class_<TestReduce_Class, TestMiddle_Class> cls_TestReduce_Class(mod, "TestReduce_Class", "");
+
+// Constructors
+cls_TestReduce_Class.def(py::init<>(), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_TestReduce, 0>>());
+
+// Fields
+cls_TestReduce_Class.def_readwrite("node", &TestReduce_Class::node, "");
+
+// Methods
+cls_TestReduce_Class.def("Scale", (void (TestReduce_Class::*)(double)) &TestReduce_Class::Scale, "", py::arg("theFactor"), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_TestReduce, 2>>());
+cls_TestReduce_Class.def("Mode", (TestSplit_Mode (TestReduce_Class::*)() const) &TestReduce_Class::Mode, "", py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_TestReduce, 3>, ImportTestSplit>());
+
+// After type
+/* Testing +after_type line kept by lean modules */ static_assert(true, "");
+
+PYOCCT_PROFILE_MARK("TestReduce_Class");
+
+// CLASS: TESTREDUCE_EXPLORER
+py::class_<TestReduce_Explorer> cls_TestReduce_Explorer(mod, "TestReduce_Explorer", "");
+
+// Constructors
+cls_TestReduce_Explorer.def(py::init<>(), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_TestReduce, 4>>());
+
+// Methods
+cls_TestReduce_Explorer.def("More", (bool (TestReduce_Explorer::*)() const) &TestReduce_Explorer::More, "", py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_TestReduce, 5>>());
+cls_TestReduce_Explorer.def("Next", (void (TestReduce_Explorer::*)()) &TestReduce_Explorer::Next, "", py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_TestReduce, 6>>());
+cls_TestReduce_Explorer.def("Current", (const TestSplit_ClassB & (TestReduce_Explorer::*)() const) &TestReduce_Explorer::Current, "", py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_TestReduce, 7>, ImportTestSplit>());
+
+// Iterator
+cls_TestReduce_Explorer.def("__iter__", [](py::object self) { return self; });
+cls_TestReduce_Explorer.def("__next__", [](TestReduce_Explorer &self) { if (!self.More()) throw py::stop_iteration(); auto item = self.Current(); self.Next(); return item; }, py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_TestReduce, 8>, ImportTestSplit>());
+cls_TestReduce_Explorer.def("collect", [](TestReduce_Explorer &self) { py::list items; for (; self.More(); self.Next()) items.append(self.Current()); return items; }, py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_TestReduce, 9>, ImportTestSplit>());
+
+PYOCCT_PROFILE_MARK("TestReduce_Explorer");
+
+// TYPEDEF: TESTREDUCE_TEMPLATEINT
+mod.attr("TestReduce_TemplateInt") = pyOCCT_Import("TestSplit").attr("TestSplit_TemplateInt");
+
+PYOCCT_PROFILE_MARK("TestReduce_TemplateInt");
+
+
+}
@@ -20,21 +20,60 @@ License along with this library; if not, write to the Free Software
 Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
 */
 #include <pyOCCT_Common.hxx>
+#include <pyOCCT_Visibility.hxx>
+#include <pyOCCT_Strings.hxx>
+#include <pyOCCT_Downcast.hxx>
+#include <pyOCCT_Serialize.hxx>
+#include <pyOCCT_Monolithic.hxx>
+#include <pyOCCT_Profile.hxx>
+#include <pyOCCT_Calls.hxx>
 #include <TestSplit_Module.h>
+#include <Test_KeepAlive.h>
+#include <Test_Template.h>
+#include <bind_Test_Template.hxx>
+
+extern template void bind_Test_Template<int>(py::module &, std::string const &, py::module_local const &);
+
+struct pyOCCT_Calls_TestSplit;
 
 // Testing +before_module in split module
 
 // Functions for split modules
-void bind_TestSplit_2(py::module&);
+PYOCCT_HIDDEN void bind_TestSplit_2(py::module&);
+
+PYOCCT_HIDDEN void init_TestSplit(py::module &mod) {
+
+pyOCCT_Mutex();
+
+PYOCCT_PROFILE_START(mod);
 
-PYBIND11_MODULE(TestSplit, mod) {
+pyOCCT_Import("Test");
 
+PYOCCT_PROFILE_MARK("(imports)");
+
+pyOCCT_BindCallStats<pyOCCT_Calls_TestSplit>(mod, {
+	"TestSplit_ClassA::TestSplit_ClassA",
+	"TestSplit_ClassB::TestSplit_ClassB",
+	"TestSplit_ClassB::Node",
+	"TestSplit_ClassB::SetNode"
+});
+
+// ENUM: TESTSPLIT_MODE
+py::enum_<TestSplit_Mode>(mod, "TestSplit_Mode", "Test enum returned by another module")
+	.value("TestSplit_Fast", TestSplit_Mode::TestSplit_Fast)
+	.value("TestSplit_Exact", TestSplit_Mode::TestSplit_Exact)
+	.export_values();
+
+
+PYOCCT_PROFILE_MARK("TestSplit_Mode");
 
 // CLASS: TESTSPLIT_CLASSA
 py::class_<TestSplit_ClassA> cls_TestSplit_ClassA(mod, "TestSplit_ClassA", "Test content to split into different source files");
 
 // Constructors
-cls_TestSplit_ClassA.def(py::init<>());
+cls_TestSplit_ClassA.def(py::init<>(), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_TestSplit, 0>>());
+
+PYOCCT_PROFILE_MARK("TestSplit_ClassA");
 
 
 bind_TestSplit_2(mod);
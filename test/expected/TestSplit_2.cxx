@@ -20,18 +20,50 @@ License along with this library; if not, write to the Free Software
 Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
 */
 #include <pyOCCT_Common.hxx>
+#include <pyOCCT_Visibility.hxx>
+#include <pyOCCT_Strings.hxx>
+#include <pyOCCT_Downcast.hxx>
+#include <pyOCCT_Serialize.hxx>
+#include <pyOCCT_Monolithic.hxx>
+#include <pyOCCT_Profile.hxx>
+#include <pyOCCT_Calls.hxx>
 #include <TestSplit_Module.h>
+#include <Test_KeepAlive.h>
+#include <Test_Template.h>
+#include <bind_Test_Template.hxx>
+
+extern template void bind_Test_Template<int>(py::module &, std::string const &, py::module_local const &);
+
+struct pyOCCT_Calls_TestSplit;
 
 // Testing +before_module in split module
 
-void bind_TestSplit_2(py::module &mod)
+PYOCCT_HIDDEN void bind_TestSplit_2(py::module &mod)
 {
 
+PYOCCT_PROFILE_START(mod);
+
 // CLASS: TESTSPLIT_CLASSB
 py::class_<TestSplit_ClassB> cls_TestSplit_ClassB(mod, "TestSplit_ClassB", "None");
 
 // Constructors
-cls_TestSplit_ClassB.def(py::init<>());
+cls_TestSplit_ClassB.def(py::init<>(), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_TestSplit, 1>>());
+
+// Methods
+cls_TestSplit_ClassB.def("Node", (Test_Node (TestSplit_ClassB::*)() const) &TestSplit_ClassB::Node, "None", py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_TestSplit, 2>>());
+cls_TestSplit_ClassB.def("SetNode", (void (TestSplit_ClassB::*)(const Test_Node &)) &TestSplit_ClassB::SetNode, "None", py::arg("node"), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_TestSplit, 3>>());
+
+PYOCCT_PROFILE_MARK("TestSplit_ClassB");
+
+// TYPEDEF: TESTSPLIT_TEMPLATEDOUBLE
+mod.attr("TestSplit_TemplateDouble") = pyOCCT_Import("Test").attr("Test_TemplateDouble");
+
+PYOCCT_PROFILE_MARK("TestSplit_TemplateDouble");
+
+// TYPEDEF: TESTSPLIT_TEMPLATEINT
+bind_Test_Template<int>(mod, "TestSplit_TemplateInt", py::module_local(false));
+
+PYOCCT_PROFILE_MARK("TestSplit_TemplateInt");
 
 
 }
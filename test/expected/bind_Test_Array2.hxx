@@ -0,0 +1,49 @@
+/*
+This file is part of pyOCCT which provides Python bindings to the OpenCASCADE
+geometry kernel.
+
+Copyright (C) 2016-2018  Laughlin Research, LLC
+Copyright (C) 2019-2020  Trevor Laughlin and the pyOCCT contributors
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation; either
+version 2.1 of the License, or (at your option) any later version.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+*/
+#ifndef __Test_Array2__
+#define __Test_Array2__
+
+#include <pyOCCT_Visibility.hxx>
+#include <Test_Array.h>
+#include <pyOCCT_Buffer.hxx>
+
+template <typename TheItemType>
+PYOCCT_HIDDEN void bind_Test_Array2(py::module &mod, std::string const &name, py::module_local const &local){
+
+py::class_<Test_Array2<TheItemType>> cls_Test_Array2(mod, name.c_str(), "Test two dimensional array", py::buffer_protocol(), local);
+
+// Constructors
+cls_Test_Array2.def(py::init<>());
+
+// Methods
+cls_Test_Array2.def("LowerRow", (int (Test_Array2<TheItemType>::*)() const) &Test_Array2<TheItemType>::LowerRow, "None");
+cls_Test_Array2.def("LowerCol", (int (Test_Array2<TheItemType>::*)() const) &Test_Array2<TheItemType>::LowerCol, "None");
+cls_Test_Array2.def("ColLength", (int (Test_Array2<TheItemType>::*)() const) &Test_Array2<TheItemType>::ColLength, "None");
+cls_Test_Array2.def("RowLength", (int (Test_Array2<TheItemType>::*)() const) &Test_Array2<TheItemType>::RowLength, "None");
+cls_Test_Array2.def("Value", (const TheItemType & (Test_Array2<TheItemType>::*)(const int, const int) const) &Test_Array2<TheItemType>::Value, "None", py::arg("theRow"), py::arg("theCol"));
+
+// Buffer
+cls_Test_Array2.def_buffer([](Test_Array2<TheItemType> &self) -> py::buffer_info { return pyOCCT_Buffer(self.ColLength() && self.RowLength() ? &self.Value(self.LowerRow(), self.LowerCol()) : nullptr, {self.ColLength(), self.RowLength()}); });
+
+}
+
+#endif
\ No newline at end of file
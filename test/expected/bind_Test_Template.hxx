@@ -22,10 +22,11 @@ Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
 #ifndef __Test_Template__
 #define __Test_Template__
 
+#include <pyOCCT_Visibility.hxx>
 #include <Test_Template.h>
 
 template <typename T, typename K=int>
-void bind_Test_Template(py::module &mod, std::string const &name, py::module_local const &local){
+PYOCCT_HIDDEN void bind_Test_Template(py::module &mod, std::string const &name, py::module_local const &local){
 
 py::class_<Test_Template<T, K>> cls_Test_Template(mod, name.c_str(), "Test template", local);
 
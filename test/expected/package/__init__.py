@@ -0,0 +1,50 @@
+"""
+Python bindings to the OpenCASCADE geometry kernel. The extension modules are
+imported on first access so importing the package itself is cheap.
+"""
+import importlib
+
+__all__ = [
+    'Test',
+    'TestMiddle',
+    'TestReduce',
+    'TestSplit',
+]
+
+# Modules imported by each module when it is initialized
+_dependencies = {
+    'Test': [],
+    'TestMiddle': ['Test'],
+    'TestReduce': ['TestMiddle', 'TestSplit'],
+    'TestSplit': ['Test'],
+}
+
+
+def dependencies(name):
+    """
+    Get the modules imported by a module, directly or through the modules it
+    imports.
+    :param str name: The module name.
+    :return: The module names.
+    :rtype: list(str)
+    """
+    found = set()
+    stack = [name]
+    while stack:
+        for dep in _dependencies.get(stack.pop(), []):
+            if dep not in found:
+                found.add(dep)
+                stack.append(dep)
+    found.discard(name)
+    return sorted(found)
+
+
+def __getattr__(name):
+    if name in __all__:
+        return importlib.import_module('.' + name, __name__)
+    raise AttributeError(
+        'module {!r} has no attribute {!r}'.format(__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,304 @@
+/*
+This file is part of pyOCCT which provides Python bindings to the OpenCASCADE
+geometry kernel.
+
+Copyright (C) 2016-2018  Laughlin Research, LLC
+Copyright (C) 2019-2020  Trevor Laughlin and the pyOCCT contributors
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation; either
+version 2.1 of the License, or (at your option) any later version.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+*/
+#ifndef __pyOCCT_Buffer__
+#define __pyOCCT_Buffer__
+
+#include <pyOCCT_Common.hxx>
+#include <pyOCCT_Visibility.hxx>
+#include <pyOCCT_Strings.hxx>
+#include <pyOCCT_Downcast.hxx>
+#include <pyOCCT_Serialize.hxx>
+#include <pyOCCT_Monolithic.hxx>
+#include <pyOCCT_Profile.hxx>
+#include <pyOCCT_Calls.hxx>
+#include <Test_Array.h>
+#include <Test_Pickle.h>
+
+#include <cstring>
+#include <pybind11/numpy.h>
+
+// Element types that can be viewed as a block of scalars
+template <typename T, typename Enable = void>
+struct pyOCCT_BufferTraits {
+    static const bool is_bufferable = false;
+};
+
+template <typename T>
+struct pyOCCT_BufferTraits<T, typename std::enable_if<std::is_arithmetic<T>::value && !std::is_same<T, bool>::value>::type> {
+    typedef T scalar_type;
+    static const bool is_bufferable = true;
+    static const py::ssize_t size = 1;
+};
+
+template <>
+struct pyOCCT_BufferTraits<Test_XYZ> {
+    typedef double scalar_type;
+    static const bool is_bufferable = true;
+    static const py::ssize_t size = 3;
+};
+
+template <>
+struct pyOCCT_BufferTraits<Test_Pnt> {
+    typedef double scalar_type;
+    static const bool is_bufferable = true;
+    static const py::ssize_t size = 3;
+};
+
+template <>
+struct pyOCCT_BufferTraits<Test_NoPickleField> {
+    typedef double scalar_type;
+    static const bool is_bufferable = true;
+    static const py::ssize_t size = 3;
+};
+
+template <>
+struct pyOCCT_BufferTraits<Test_NoPickle> {
+    typedef double scalar_type;
+    static const bool is_bufferable = true;
+    static const py::ssize_t size = 1;
+};
+
+template <>
+struct pyOCCT_BufferTraits<Test_Triangle> {
+    typedef Test_Triangle scalar_type;
+    static const bool is_bufferable = true;
+    static const py::ssize_t size = 1;
+};
+
+template <typename T>
+py::buffer_info pyOCCT_MakeBuffer(const T *, std::vector<py::ssize_t>, std::false_type) {
+    throw py::buffer_error("Array elements do not support the buffer protocol.");
+}
+
+template <typename T>
+py::buffer_info pyOCCT_MakeBuffer(const T *data, std::vector<py::ssize_t> shape, std::true_type) {
+    typedef pyOCCT_BufferTraits<T> traits;
+    typedef typename traits::scalar_type scalar_type;
+
+    // Row-major strides of the elements
+    std::vector<py::ssize_t> strides(shape.size());
+    py::ssize_t stride = sizeof(T);
+    for (size_t i = shape.size(); i-- > 0;) {
+        strides[i] = stride;
+        stride *= shape[i];
+    }
+
+    // Scalars of each element are the last dimension
+    if (traits::size > 1) {
+        shape.push_back(py::ssize_t(traits::size));
+        strides.push_back(sizeof(scalar_type));
+    }
+
+    void *ptr = const_cast<void *>(static_cast<const void *>(data));
+    return py::buffer_info(ptr, sizeof(scalar_type), py::format_descriptor<scalar_type>::format(), static_cast<py::ssize_t>(shape.size()), shape, strides);
+}
+
+// View of contiguous array data without copying
+template <typename T>
+py::buffer_info pyOCCT_Buffer(const T *data, std::vector<py::ssize_t> shape) {
+    return pyOCCT_MakeBuffer(data, shape, std::integral_constant<bool, pyOCCT_BufferTraits<T>::is_bufferable>());
+}
+
+// Array of elements for vectorized calls with a trailing dimension for the
+// scalars of each element
+template <typename T>
+struct pyOCCT_Vector {
+    typedef pyOCCT_BufferTraits<T> traits;
+    typedef typename traits::scalar_type scalar_type;
+    typedef py::array_t<scalar_type, py::array::c_style | py::array::forcecast> array_type;
+
+    array_type array;
+    py::ssize_t n;
+
+    pyOCCT_Vector(array_type a) : array(a) {
+        static_assert(sizeof(T) == traits::size * sizeof(scalar_type), "Elements must be a contiguous block of scalars.");
+        py::ssize_t ndim = traits::size > 1 ? 2 : 1;
+        if (array.ndim() != ndim && array.ndim() != ndim - 1)
+            throw py::value_error("Array has the wrong number of dimensions.");
+        if (ndim == 2 && array.shape(array.ndim() - 1) != traits::size)
+            throw py::value_error("Array has the wrong number of scalars per element.");
+        n = array.ndim() == ndim ? array.shape(0) : 1;
+    }
+
+    explicit pyOCCT_Vector(py::ssize_t size) : n(size) {
+        std::vector<py::ssize_t> shape {size};
+        if (traits::size > 1)
+            shape.push_back(py::ssize_t(traits::size));
+        array = array_type(shape);
+    }
+
+    py::ssize_t size() const {
+        return n;
+    }
+
+    const T &operator[](py::ssize_t i) const {
+        return reinterpret_cast<const T *>(array.data())[n == 1 ? 0 : i];
+    }
+
+    void set(py::ssize_t i, const T &value) {
+        std::memcpy(array.mutable_data() + i * traits::size, &value, sizeof(T));
+    }
+};
+
+// Call a function for each element of the arrays and return the results as an
+// array. Arrays of a single element are broadcast. The guards are only
+// constructed around the loop (e.g., to release the GIL).
+template <typename... Guards, typename Func, typename... Args>
+py::array pyOCCT_Vectorize(Func f, const pyOCCT_Vector<Args> &... args) {
+    typedef typename std::decay<decltype(f(std::declval<const Args &>()...))>::type R;
+
+    py::ssize_t n = 1;
+    for (py::ssize_t size : {args.size()...}) {
+        if (size != 1 && n != 1 && size != n)
+            throw py::value_error("Arrays have different numbers of elements.");
+        if (size != 1)
+            n = size;
+    }
+
+    pyOCCT_Vector<R> result(n);
+    {
+        typename py::call_guard<Guards...>::type guard{};
+        for (py::ssize_t i = 0; i < n; ++i)
+            result.set(i, f(args[i]...));
+    }
+    return result.array;
+}
+
+// Contiguous elements of an array passed for a C array parameter or field
+template <typename T>
+struct pyOCCT_Array {
+    typedef pyOCCT_BufferTraits<T> traits;
+    typedef typename traits::scalar_type scalar_type;
+    typedef py::array_t<scalar_type, py::array::c_style | py::array::forcecast> array_type;
+    typedef py::array mutable_array_type;
+
+    // Shape of the scalars of a C array. The extent of the first dimension is
+    // unknown (0) for arrays of unknown bound, which must not be empty.
+    static std::vector<py::ssize_t> scalar_shape(std::vector<py::ssize_t> shape) {
+        static_assert(sizeof(T) == traits::size * sizeof(scalar_type), "Elements must be a contiguous block of scalars.");
+        if (traits::size > 1)
+            shape.push_back(py::ssize_t(traits::size));
+        return shape;
+    }
+
+    static void check_shape(const py::array &array, std::vector<py::ssize_t> shape) {
+        shape = scalar_shape(shape);
+        if (array.ndim() != static_cast<py::ssize_t>(shape.size()))
+            throw py::value_error("Array has the wrong number of dimensions.");
+        for (size_t i = 0; i < shape.size(); ++i) {
+            if (shape[i] && array.shape(i) != shape[i])
+                throw py::value_error("Array has the wrong shape.");
+        }
+        if (!shape[0] && !array.shape(0))
+            throw py::value_error("Array must not be empty.");
+    }
+
+    static const T *data(const array_type &array, std::vector<py::ssize_t> shape) {
+        check_shape(array, shape);
+        return reinterpret_cast<const T *>(array.data());
+    }
+
+    // Elements of an array that receives the output of a non-const parameter.
+    // It is used in place so it must already be writeable, C contiguous, and
+    // of the scalar type.
+    static T *mutable_data(mutable_array_type &array, std::vector<py::ssize_t> shape) {
+        if (!py::isinstance<py::array_t<scalar_type>>(array))
+            throw py::type_error("Array has the wrong data type.");
+        if (!(array.flags() & py::array::c_style))
+            throw py::value_error("Array must be C contiguous.");
+        if (!array.writeable())
+            throw py::value_error("Array must be writeable.");
+        check_shape(array, shape);
+        return reinterpret_cast<T *>(array.mutable_data());
+    }
+
+    // Array viewing the C array member of an object that it keeps alive
+    static array_type view(const void *ptr, std::vector<py::ssize_t> shape, py::handle base, bool writeable) {
+        array_type result(scalar_shape(shape), static_cast<const scalar_type *>(ptr), base);
+        if (!writeable)
+            result.attr("flags").attr("writeable") = false;
+        return result;
+    }
+
+    // Copy the elements of an array into a C array member
+    static void assign(void *ptr, const array_type &array, std::vector<py::ssize_t> shape) {
+        py::ssize_t n = 1;
+        for (py::ssize_t extent : shape)
+            n *= extent;
+        std::memcpy(ptr, data(array, shape), n * sizeof(T));
+    }
+};
+
+// Copy the elements of a container to a list in one call
+template <typename C, typename T, typename... Extra>
+void pyOCCT_BindToList(py::object obj, const Extra &... extra) {
+    py::class_<C> cls = obj;
+    cls.def("to_list", [](const C &self) {
+        py::list items;
+        for (const T &item : self)
+            items.append(py::cast(item));
+        return items;
+    }, "Copy the elements to a list.", extra...);
+}
+
+// Copy the elements of a container to an array in one call
+template <typename C, typename T, typename... Extra>
+void pyOCCT_BindToNumpy(py::object obj, const Extra &... extra) {
+    py::class_<C> cls = obj;
+    cls.def("to_numpy", [](const C &self) {
+        py::ssize_t n = 0;
+        for (auto it = self.begin(); it != self.end(); ++it)
+            ++n;
+        pyOCCT_Vector<T> result(n);
+        py::ssize_t i = 0;
+        for (const T &item : self)
+            result.set(i++, item);
+        return result.array;
+    }, "Copy the elements to an array.", extra...);
+}
+
+// Construct a container from the elements of an array
+template <typename C, typename T, typename Add, typename... Extra>
+void pyOCCT_BindFromNumpy(py::object obj, Add add, const Extra &... extra) {
+    py::class_<C> cls = obj;
+    cls.def(py::init([add](typename pyOCCT_Vector<T>::array_type array) {
+        pyOCCT_Vector<T> items(array);
+        C *self = new C();
+        for (py::ssize_t i = 0; i < items.size(); ++i)
+            add(*self, items[i]);
+        return self;
+    }), py::arg("items"), extra...);
+}
+
+// Construct a container from the elements of a Python sequence
+template <typename C, typename T, typename Add, typename... Extra>
+void pyOCCT_BindFromList(py::object obj, Add add, const Extra &... extra) {
+    py::class_<C> cls = obj;
+    cls.def(py::init([add](py::iterable items) {
+        C *self = new C();
+        for (py::handle item : items)
+            add(*self, item.cast<T>());
+        return self;
+    }), py::arg("items"), extra...);
+}
+
+#endif
\ No newline at end of file
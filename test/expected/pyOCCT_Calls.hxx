@@ -0,0 +1,98 @@
+/*
+This file is part of pyOCCT which provides Python bindings to the OpenCASCADE
+geometry kernel.
+
+Copyright (C) 2016-2018  Laughlin Research, LLC
+Copyright (C) 2019-2020  Trevor Laughlin and the pyOCCT contributors
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation; either
+version 2.1 of the License, or (at your option) any later version.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+*/
+#ifndef __pyOCCT_Calls__
+#define __pyOCCT_Calls__
+
+#include <pyOCCT_Common.hxx>
+
+#include <atomic>
+#include <chrono>
+#include <deque>
+#include <initializer_list>
+
+// Number of calls of a binding and, if the extensions are compiled with
+// PYOCCT_CALL_TIMER defined, the time spent in them
+struct pyOCCT_CallStat {
+    const char *name;
+    std::atomic<unsigned long long> calls;
+    std::atomic<unsigned long long> nanoseconds;
+
+    explicit pyOCCT_CallStat(const char *name) : name(name), calls(0), nanoseconds(0) {}
+};
+
+// Call statistics of the module identified by the tag type
+template <typename Tag>
+std::deque<pyOCCT_CallStat> &pyOCCT_CallTable() {
+    static std::deque<pyOCCT_CallStat> table;
+    return table;
+}
+
+// Call guard counting the calls of the binding at an index of the table
+template <typename Tag, std::size_t N>
+struct pyOCCT_CallCounter {
+    pyOCCT_CallStat &stat;
+#ifdef PYOCCT_CALL_TIMER
+    std::chrono::steady_clock::time_point start;
+#endif
+
+    pyOCCT_CallCounter() : stat(pyOCCT_CallTable<Tag>()[N]) {
+        stat.calls.fetch_add(1, std::memory_order_relaxed);
+#ifdef PYOCCT_CALL_TIMER
+        start = std::chrono::steady_clock::now();
+#endif
+    }
+
+#ifdef PYOCCT_CALL_TIMER
+    ~pyOCCT_CallCounter() {
+        auto elapsed = std::chrono::steady_clock::now() - start;
+        stat.nanoseconds.fetch_add(std::chrono::duration_cast<std::chrono::nanoseconds>(elapsed).count(), std::memory_order_relaxed);
+    }
+#endif
+};
+
+// Fill the table with the names of the bindings and add the functions that
+// query and reset it
+template <typename Tag>
+void pyOCCT_BindCallStats(py::module &mod, std::initializer_list<const char *> names) {
+    std::deque<pyOCCT_CallStat> &table = pyOCCT_CallTable<Tag>();
+    for (const char *name : names)
+        table.emplace_back(name);
+
+    mod.def("_call_stats", []() {
+        py::list stats;
+        for (pyOCCT_CallStat &stat : pyOCCT_CallTable<Tag>()) {
+            unsigned long long calls = stat.calls.load(std::memory_order_relaxed);
+            if (calls)
+                stats.append(py::make_tuple(stat.name, calls, stat.nanoseconds.load(std::memory_order_relaxed) * 1e-9));
+        }
+        return stats;
+    }, "Get the name, number of calls and time in seconds spent in each called binding.");
+
+    mod.def("_reset_call_stats", []() {
+        for (pyOCCT_CallStat &stat : pyOCCT_CallTable<Tag>()) {
+            stat.calls.store(0, std::memory_order_relaxed);
+            stat.nanoseconds.store(0, std::memory_order_relaxed);
+        }
+    }, "Reset the call statistics.");
+}
+
+#endif
\ No newline at end of file
@@ -0,0 +1,101 @@
+/*
+This file is part of pyOCCT which provides Python bindings to the OpenCASCADE
+geometry kernel.
+
+Copyright (C) 2016-2018  Laughlin Research, LLC
+Copyright (C) 2019-2020  Trevor Laughlin and the pyOCCT contributors
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation; either
+version 2.1 of the License, or (at your option) any later version.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+*/
+#ifndef __pyOCCT_Downcast__
+#define __pyOCCT_Downcast__
+
+#include <pyOCCT_Common.hxx>
+#include <Standard_Transient.hxx>
+#include <Standard_Type.hxx>
+
+#ifndef __pyOCCT_SharedData__
+#define __pyOCCT_SharedData__
+
+// Get or create data shared by all modules. The lookup and the insertion are
+// done under the lock of the pybind11 internals so concurrent initializations
+// agree on a single instance.
+template <typename T>
+T &pyOCCT_SharedData(const char *name) {
+    py::gil_scoped_acquire gil;
+    return *py::detail::with_internals([&](py::detail::internals &internals) {
+        void *&data = internals.shared_data[name];
+        if (!data)
+            data = new T();
+        return static_cast<T *>(data);
+    });
+}
+
+#endif
+
+#include <typeinfo>
+#include <unordered_map>
+
+// Bound transient types by their OCCT type descriptor shared by all modules.
+// Each has the cast of an object to the address of the bound type. The first
+// registration of a descriptor is kept.
+struct pyOCCT_TransientType {
+    const std::type_info *type;
+    const void *(*cast)(const Standard_Transient *);
+};
+
+typedef std::unordered_map<const Standard_Type *, pyOCCT_TransientType> pyOCCT_TransientTypes;
+
+inline pyOCCT_TransientTypes &pyOCCT_GetTransientTypes() {
+    static pyOCCT_TransientTypes &types = pyOCCT_SharedData<pyOCCT_TransientTypes>("pyOCCT_TransientTypes");
+    return types;
+}
+
+template <typename T>
+const void *pyOCCT_CastTransient(const Standard_Transient *src) {
+    return dynamic_cast<const T *>(src);
+}
+
+template <typename T>
+void pyOCCT_RegisterTransient() {
+    pyOCCT_GetTransientTypes().emplace(STANDARD_TYPE(T).get(), pyOCCT_TransientType{&typeid(T), &pyOCCT_CastTransient<T>});
+}
+
+namespace pybind11 {
+
+// Return transient objects as their most derived bound type
+template <typename itype>
+struct polymorphic_type_hook<itype, detail::enable_if_t<std::is_base_of<Standard_Transient, itype>::value>> {
+    static const void *get(const itype *src, const std::type_info *&type) {
+        type = nullptr;
+        if (!src)
+            return src;
+        const pyOCCT_TransientTypes &types = pyOCCT_GetTransientTypes();
+        for (opencascade::handle<Standard_Type> t = src->DynamicType(); !t.IsNull(); t = t->Parent()) {
+            auto it = types.find(t.get());
+            if (it != types.end()) {
+                const void *dst = it->second.cast(src);
+                if (dst)
+                    type = it->second.type;
+                return dst ? dst : src;
+            }
+        }
+        return src;
+    }
+};
+
+}
+
+#endif
\ No newline at end of file
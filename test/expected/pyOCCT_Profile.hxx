@@ -0,0 +1,76 @@
+/*
+This file is part of pyOCCT which provides Python bindings to the OpenCASCADE
+geometry kernel.
+
+Copyright (C) 2016-2018  Laughlin Research, LLC
+Copyright (C) 2019-2020  Trevor Laughlin and the pyOCCT contributors
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation; either
+version 2.1 of the License, or (at your option) any later version.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+*/
+#ifndef __pyOCCT_Profile__
+#define __pyOCCT_Profile__
+
+#include <pyOCCT_Common.hxx>
+
+// Registration time of each binder of the modules. It is only recorded when
+// the extensions are compiled with PYOCCT_PROFILE defined, otherwise the
+// macros expand to nothing.
+#ifdef PYOCCT_PROFILE
+
+#include <chrono>
+
+struct pyOCCT_Profile {
+    py::list entries;
+    py::object allocated_blocks;
+    py::ssize_t blocks;
+    std::chrono::steady_clock::time_point start;
+
+    // The entries are shared with the other half of a split module
+    explicit pyOCCT_Profile(py::module &mod) {
+        if (!py::hasattr(mod, "__init_profile__")) {
+            py::list table;
+            mod.attr("__init_profile__") = table;
+            mod.def("_init_profile", [table]() { return table.attr("copy")(); }, "Get the name, registration time in seconds and number of allocated memory blocks of each binder.");
+        }
+        entries = mod.attr("__init_profile__");
+        allocated_blocks = py::module::import("sys").attr("getallocatedblocks");
+        reset();
+    }
+
+    void reset() {
+        blocks = allocated_blocks().cast<py::ssize_t>();
+        start = std::chrono::steady_clock::now();
+    }
+
+    // Record the time since the previous binder and start timing the next
+    void mark(const char *name) {
+        std::chrono::duration<double> elapsed = std::chrono::steady_clock::now() - start;
+        py::ssize_t allocated = allocated_blocks().cast<py::ssize_t>() - blocks;
+        entries.append(py::make_tuple(name, elapsed.count(), allocated));
+        reset();
+    }
+};
+
+#define PYOCCT_PROFILE_START(mod) pyOCCT_Profile pyOCCT_profile(mod)
+#define PYOCCT_PROFILE_MARK(name) pyOCCT_profile.mark(name)
+
+#else
+
+#define PYOCCT_PROFILE_START(mod)
+#define PYOCCT_PROFILE_MARK(name)
+
+#endif
+
+#endif
\ No newline at end of file
@@ -0,0 +1,62 @@
+/*
+This file is part of pyOCCT which provides Python bindings to the OpenCASCADE
+geometry kernel.
+
+Copyright (C) 2016-2018  Laughlin Research, LLC
+Copyright (C) 2019-2020  Trevor Laughlin and the pyOCCT contributors
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation; either
+version 2.1 of the License, or (at your option) any later version.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+*/
+#ifndef __pyOCCT_Serialize__
+#define __pyOCCT_Serialize__
+
+#include <pyOCCT_Common.hxx>
+
+#ifndef __pyOCCT_SharedData__
+#define __pyOCCT_SharedData__
+
+// Get or create data shared by all modules. The lookup and the insertion are
+// done under the lock of the pybind11 internals so concurrent initializations
+// agree on a single instance.
+template <typename T>
+T &pyOCCT_SharedData(const char *name) {
+    py::gil_scoped_acquire gil;
+    return *py::detail::with_internals([&](py::detail::internals &internals) {
+        void *&data = internals.shared_data[name];
+        if (!data)
+            data = new T();
+        return static_cast<T *>(data);
+    });
+}
+
+#endif
+
+#include <mutex>
+
+// Mutex shared by all modules
+inline std::recursive_mutex &pyOCCT_Mutex() {
+    static std::recursive_mutex &mutex = pyOCCT_SharedData<std::recursive_mutex>("pyOCCT_Mutex");
+    return mutex;
+}
+
+// Call guard that serializes calls that are not thread safe. It always
+// follows the release of the GIL so a thread never waits for the mutex while
+// holding the GIL.
+struct pyOCCT_Serialize {
+    std::lock_guard<std::recursive_mutex> lock;
+    pyOCCT_Serialize() : lock(pyOCCT_Mutex()) {}
+};
+
+#endif
\ No newline at end of file
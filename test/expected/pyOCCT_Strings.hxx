@@ -0,0 +1,85 @@
+/*
+This file is part of pyOCCT which provides Python bindings to the OpenCASCADE
+geometry kernel.
+
+Copyright (C) 2016-2018  Laughlin Research, LLC
+Copyright (C) 2019-2020  Trevor Laughlin and the pyOCCT contributors
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation; either
+version 2.1 of the License, or (at your option) any later version.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+*/
+#ifndef __pyOCCT_Strings__
+#define __pyOCCT_Strings__
+
+#include <pyOCCT_Common.hxx>
+#include <TCollection_AsciiString.hxx>
+#include <TCollection_ExtendedString.hxx>
+
+namespace pybind11 { namespace detail {
+
+// TCollection_AsciiString to and from str encoded as UTF-8
+template <>
+struct type_caster<TCollection_AsciiString> {
+    PYBIND11_TYPE_CASTER(TCollection_AsciiString, _("str"));
+
+    bool load(handle src, bool) {
+        if (!src || !PyUnicode_Check(src.ptr()))
+            return false;
+        const char *data = PyUnicode_AsUTF8(src.ptr());
+        if (!data) {
+            PyErr_Clear();
+            return false;
+        }
+        value = TCollection_AsciiString(data);
+        return true;
+    }
+
+    static handle cast(const TCollection_AsciiString &src, return_value_policy, handle) {
+        PyObject *result = PyUnicode_DecodeUTF8(src.ToCString(), src.Length(), nullptr);
+        if (!result)
+            throw error_already_set();
+        return result;
+    }
+};
+
+// TCollection_ExtendedString to and from str encoded as UTF-16
+template <>
+struct type_caster<TCollection_ExtendedString> {
+    PYBIND11_TYPE_CASTER(TCollection_ExtendedString, _("str"));
+
+    bool load(handle src, bool) {
+        if (!src || !PyUnicode_Check(src.ptr()))
+            return false;
+        const char *data = PyUnicode_AsUTF8(src.ptr());
+        if (!data) {
+            PyErr_Clear();
+            return false;
+        }
+        value = TCollection_ExtendedString(data, Standard_True);
+        return true;
+    }
+
+    static handle cast(const TCollection_ExtendedString &src, return_value_policy, handle) {
+        // Native byte order so a leading U+FEFF is kept rather than read as a BOM
+        int byteorder = PY_LITTLE_ENDIAN ? -1 : 1;
+        PyObject *result = PyUnicode_DecodeUTF16(reinterpret_cast<const char *>(src.ToExtString()), 2 * src.Length(), nullptr, &byteorder);
+        if (!result)
+            throw error_already_set();
+        return result;
+    }
+};
+
+}}
+
+#endif
\ No newline at end of file
@@ -0,0 +1,34 @@
+/*
+This file is part of pyOCCT which provides Python bindings to the OpenCASCADE
+geometry kernel.
+
+Copyright (C) 2016-2018  Laughlin Research, LLC
+Copyright (C) 2019-2020  Trevor Laughlin and the pyOCCT contributors
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation; either
+version 2.1 of the License, or (at your option) any later version.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+*/
+#ifndef __pyOCCT_Visibility__
+#define __pyOCCT_Visibility__
+
+#include <pyOCCT_Common.hxx>
+
+// Symbols of the bindings that are not exported by the extensions
+#if defined(_WIN32) || defined(__CYGWIN__)
+#define PYOCCT_HIDDEN
+#else
+#define PYOCCT_HIDDEN __attribute__((visibility("hidden")))
+#endif
+
+#endif
\ No newline at end of file
@@ -0,0 +1,149 @@
+/*
+This file is part of pyOCCT which provides Python bindings to the OpenCASCADE
+geometry kernel.
+
+Copyright (C) 2016-2018  Laughlin Research, LLC
+Copyright (C) 2019-2020  Trevor Laughlin and the pyOCCT contributors
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation; either
+version 2.1 of the License, or (at your option) any later version.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+*/
+#include <pyOCCT_Common.hxx>
+#include <pyOCCT_Visibility.hxx>
+#include <pyOCCT_Strings.hxx>
+#include <pyOCCT_Downcast.hxx>
+#include <pyOCCT_Serialize.hxx>
+#include <pyOCCT_Monolithic.hxx>
+#include <pyOCCT_Profile.hxx>
+#include <pyOCCT_Calls.hxx>
+#include <Standard_Transient.hxx>
+#include <Test_Geometry.h>
+#include <Test_Sequence.h>
+#include <pyOCCT_Buffer.hxx>
+#include <Test_Class.h>
+#include <Test_KeepAlive.h>
+#include <bind_Test_Sequence.hxx>
+#include <atomic>
+
+extern template void bind_Test_Sequence<double>(py::module &, std::string const &, py::module_local const &);
+
+struct ImportTestSplit{
+	ImportTestSplit() {
+		static std::atomic<bool> imported(false);
+		if (!imported.load(std::memory_order_acquire)) {
+			pyOCCT_Import("TestSplit");
+			imported.store(true, std::memory_order_release);
+		}
+	}
+};
+
+struct pyOCCT_Calls_Test;
+
+// Testing +before_module line 1
+// Testing +before_module line 2
+
+PYOCCT_HIDDEN void init_Test(py::module &mod) {
+
+pyOCCT_Mutex();
+
+PYOCCT_PROFILE_START(mod);
+
+
+PYOCCT_PROFILE_MARK("(imports)");
+
+pyOCCT_BindCallStats<pyOCCT_Calls_Test>(mod, {
+	"Test_Geometry::Test_Geometry",
+	"Test_Geometry::get_type_descriptor",
+	"Test_Geometry::DynamicType",
+	"Test_Line::Test_Line",
+	"Test_Line::Reversed",
+	"Test_SequenceOfReal::to_list",
+	"Test_SequenceOfReal::to_numpy",
+	"Test_SequenceOfReal::Test_SequenceOfReal",
+	"Test_SimpleClass::Test_SimpleClass",
+	"Test_SimpleClass::TestReturnPolicy1",
+	"Test_SimpleClass::TestReturnPolicy2",
+	"Test_SimpleClass::TestReturnPolicy3",
+	"Test_Node::Test_Node"
+});
+
+// CLASS: TEST_GEOMETRY
+py::class_<Test_Geometry, opencascade::handle<Test_Geometry>, Standard_Transient> cls_Test_Geometry(mod, "Test_Geometry", "Test transient base class with its own RTTI");
+
+// Constructors
+// cls_Test_Geometry.def(py::init<>(), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 0>>());
+
+// Methods
+// excluded // cls_Test_Geometry.def_static("get_type_descriptor_", (const opencascade::handle<Standard_Type> & (*)()) &Test_Geometry::get_type_descriptor, "None", py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 1>>());
+// excluded // cls_Test_Geometry.def("DynamicType", (const opencascade::handle<Standard_Type> & (Test_Geometry::*)() const) &Test_Geometry::DynamicType, "None", py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 2>>());
+
+// Downcasting
+pyOCCT_RegisterTransient<Test_Geometry>();
+
+PYOCCT_PROFILE_MARK("Test_Geometry");
+
+// CLASS: TEST_LINE
+py::class_<Test_Line, opencascade::handle<Test_Line>, Test_Geometry> cls_Test_Line(mod, "Test_Line", "Test transient class with a DownCast and the RTTI of its base");
+
+// Constructors
+// cls_Test_Line.def(py::init<>(), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 3>>());
+
+// Methods
+cls_Test_Line.def("Reversed", (opencascade::handle<Test_Geometry> (Test_Line::*)() const) &Test_Line::Reversed, "None", py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 4>>());
+
+// Downcasting
+cls_Test_Line.def_static("DownCast", [](const opencascade::handle<Standard_Transient> &theObject) { return opencascade::handle<Test_Line>::DownCast(theObject); }, py::arg("theObject"));
+
+PYOCCT_PROFILE_MARK("Test_Line");
+
+// TYPEDEF: TEST_SEQUENCEOFREAL
+bind_Test_Sequence<double>(mod, "Test_SequenceOfReal", py::module_local(false));
+pyOCCT_BindToList<Test_Sequence<double>, double>(mod.attr("Test_SequenceOfReal"), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 5>>());
+pyOCCT_BindToNumpy<Test_Sequence<double>, double>(mod.attr("Test_SequenceOfReal"), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 6>>());
+pyOCCT_BindFromNumpy<Test_Sequence<double>, double>(mod.attr("Test_SequenceOfReal"), [](Test_Sequence<double> &self, const double &item) { self.Append(item); }, py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 7>>());
+pyOCCT_BindFromList<Test_Sequence<double>, double>(mod.attr("Test_SequenceOfReal"), [](Test_Sequence<double> &self, const double &item) { self.Append(item); }, py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 7>>());
+
+PYOCCT_PROFILE_MARK("Test_SequenceOfReal");
+
+// CLASS: TEST_SIMPLECLASS
+// Before type
+// Testing +before_type line 1
+// Testing +before_type line 2
+
+py::class_<Test_SimpleClass> cls_Test_SimpleClass(mod, "Test_SimpleClass", "Test class");
+
+// Constructors
+// cls_Test_SimpleClass.def(py::init<>(), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 8>>());
+
+// Methods
+// excluded // cls_Test_SimpleClass.def("TestReturnPolicy1", (int (Test_SimpleClass::*)()) &Test_SimpleClass::TestReturnPolicy1, "None", py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 9>>());
+// excluded // cls_Test_SimpleClass.def("TestReturnPolicy2", (const int & (Test_SimpleClass::*)()) &Test_SimpleClass::TestReturnPolicy2, "None", py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 10>>());
+// excluded // cls_Test_SimpleClass.def("TestReturnPolicy3", (int & (Test_SimpleClass::*)()) &Test_SimpleClass::TestReturnPolicy3, "None", py::return_value_policy::reference_internal, py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 11>>());
+
+// After type
+// Testing +after_type line 1
+// Testing +after_type line 2
+
+PYOCCT_PROFILE_MARK("Test_SimpleClass");
+
+// CLASS: TEST_NODE
+py::class_<Test_Node> cls_Test_Node(mod, "Test_Node", "None");
+
+// Constructors
+// cls_Test_Node.def(py::init<>(), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_Test, 12>>());
+
+PYOCCT_PROFILE_MARK("Test_Node");
+
+
+}
@@ -0,0 +1,85 @@
+/*
+This file is part of pyOCCT which provides Python bindings to the OpenCASCADE
+geometry kernel.
+
+Copyright (C) 2016-2018  Laughlin Research, LLC
+Copyright (C) 2019-2020  Trevor Laughlin and the pyOCCT contributors
+
+This library is free software; you can redistribute it and/or
+modify it under the terms of the GNU Lesser General Public
+License as published by the Free Software Foundation; either
+version 2.1 of the License, or (at your option) any later version.
+
+This library is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public
+License along with this library; if not, write to the Free Software
+Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+*/
+#include <pyOCCT_Common.hxx>
+#include <pyOCCT_Visibility.hxx>
+#include <pyOCCT_Strings.hxx>
+#include <pyOCCT_Downcast.hxx>
+#include <pyOCCT_Serialize.hxx>
+#include <pyOCCT_Monolithic.hxx>
+#include <pyOCCT_Profile.hxx>
+#include <pyOCCT_Calls.hxx>
+#include <TestMiddle_Module.h>
+#include <TestSplit_Module.h>
+#include <Test_KeepAlive.h>
+#include <TestReduce_Module.h>
+#include <atomic>
+
+struct ImportTestSplit{
+	ImportTestSplit() {
+		static std::atomic<bool> imported(false);
+		if (!imported.load(std::memory_order_acquire)) {
+			pyOCCT_Import("TestSplit");
+			imported.store(true, std::memory_order_release);
+		}
+	}
+};
+
+struct pyOCCT_Calls_TestReduce;
+
+PYOCCT_HIDDEN void init_TestReduce(py::module &mod) {
+
+py::options options;
+options.disable_function_signatures();
+
+pyOCCT_Mutex();
+
+PYOCCT_PROFILE_START(mod);
+
+pyOCCT_Import("TestMiddle");
+
+PYOCCT_PROFILE_MARK("(imports)");
+
+pyOCCT_BindCallStats<pyOCCT_Calls_TestReduce>(mod, {
+	"TestReduce_Class::TestReduce_Class",
+	"TestReduce_Class::Fill",
+	"TestReduce_Class::Scale",
+	"TestReduce_Class::Mode"
+});
+
+// CLASS: TESTREDUCE_CLASS
+py::class_<TestReduce_Class, TestMiddle_Class> cls_TestReduce_Class(mod, "TestReduce_Class", "");
+
+// Constructors
+
+// Fields
+cls_TestReduce_Class.def_readwrite("node", &TestReduce_Class::node, "");
+
+// Methods
+cls_TestReduce_Class.def("Scale", (void (TestReduce_Class::*)(double)) &TestReduce_Class::Scale, "", py::arg("theFactor"), py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_TestReduce, 2>>());
+
+// After type
+/* Testing +after_type line kept by lean modules */ static_assert(true, "");
+
+PYOCCT_PROFILE_MARK("TestReduce_Class");
+
+
+}
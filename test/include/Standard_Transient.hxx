@@ -0,0 +1,32 @@
+
+
+namespace opencascade
+{
+    /// Test handle
+    template <class T>
+    class handle
+    {
+    public:
+
+        handle();
+
+        T* get() const;
+
+    };
+}
+
+class Standard_Type;
+
+
+/// Test base of the transient classes
+class Standard_Transient
+{
+public:
+
+    Standard_Transient();
+
+    virtual ~Standard_Transient();
+
+    virtual const opencascade::handle<Standard_Type>& DynamicType() const;
+
+};
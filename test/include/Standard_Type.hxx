@@ -0,0 +1,11 @@
+#include <Standard_Transient.hxx>
+
+
+/// Test type descriptor
+class Standard_Type : public Standard_Transient
+{
+public:
+
+    const opencascade::handle<Standard_Type>& Parent() const;
+
+};
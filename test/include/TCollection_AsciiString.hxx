@@ -0,0 +1,16 @@
+
+
+/// Test ASCII string
+class TCollection_AsciiString
+{
+public:
+
+    TCollection_AsciiString();
+
+    TCollection_AsciiString(const char* theMessage);
+
+    const char* ToCString() const;
+
+    int Length() const;
+
+};
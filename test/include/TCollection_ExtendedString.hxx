@@ -0,0 +1,16 @@
+
+
+/// Test extended string
+class TCollection_ExtendedString
+{
+public:
+
+    TCollection_ExtendedString();
+
+    TCollection_ExtendedString(const char* theMessage, const bool isMultiByte);
+
+    const char16_t* ToExtString() const;
+
+    int Length() const;
+
+};
@@ -0,0 +1,15 @@
+
+/// Test class importing its base class module
+class TestMiddle_Class : public Test_SimpleClass
+{
+public:
+
+    TestMiddle_Class();
+
+};
+
+/// Specialization also bound by a module that is not related
+typedef Test_Template<int> TestMiddle_TemplateInt;
+
+/// Class of another module bound again as module local
+typedef Test_Triangle TestMiddle_Triangle;
@@ -0,0 +1,38 @@
+
+/// Test class with an import already provided by its base class module
+class TestReduce_Class : public TestMiddle_Class
+{
+public:
+
+    TestReduce_Class();
+
+    /// Fill the values
+    void Fill(bool theValues[3]);
+
+    /// Scale the values
+    void Scale(double theFactor);
+
+    /// Get the mode of another module
+    TestSplit_Mode Mode() const;
+
+    Test_Node node;
+
+};
+
+/// Test explorer of the items of a lazily imported module
+class TestReduce_Explorer
+{
+public:
+
+    TestReduce_Explorer();
+
+    bool More() const;
+
+    void Next();
+
+    const TestSplit_ClassB& Current() const;
+
+};
+
+/// Specialization owned by the module it imports
+typedef Test_Template<int> TestReduce_TemplateInt;
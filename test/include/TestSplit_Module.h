@@ -14,4 +14,19 @@ public:
 
     TestSplit_ClassB();
 
+    Test_Node Node() const;
+
+    void SetNode(const Test_Node& node);
+
+};
+
+
+typedef Test_Template<double> TestSplit_TemplateDouble;
+
+typedef Test_Template<int> TestSplit_TemplateInt;
+
+/// Test enum returned by another module
+enum TestSplit_Mode {
+    TestSplit_Fast,
+    TestSplit_Exact
 };
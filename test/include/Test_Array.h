@@ -0,0 +1,71 @@
+
+/// Test coordinates
+class Test_XYZ
+{
+public:
+
+    Test_XYZ();
+
+private:
+
+    double x;
+    double y;
+    double z;
+
+};
+
+
+/// Test point
+class Test_Pnt
+{
+public:
+
+    Test_Pnt();
+
+private:
+
+    Test_XYZ coord;
+
+};
+
+
+/// Test one dimensional array
+template<typename TheItemType>
+class Test_Array1
+{
+public:
+
+    Test_Array1<TheItemType>();
+
+    int Lower() const;
+
+    int Length() const;
+
+    const TheItemType& Value(const int theIndex) const;
+
+};
+
+
+/// Test two dimensional array
+template<typename TheItemType>
+class Test_Array2
+{
+public:
+
+    Test_Array2<TheItemType>();
+
+    int LowerRow() const;
+
+    int LowerCol() const;
+
+    int ColLength() const;
+
+    int RowLength() const;
+
+    const TheItemType& Value(const int theRow, const int theCol) const;
+
+};
+
+typedef Test_Array1<double> Test_Array1OfReal;
+
+typedef Test_Array2<Test_Pnt> Test_Array2OfPnt;
@@ -0,0 +1,39 @@
+
+
+/// Test class with C array parameters and fields
+class Test_Frame
+{
+public:
+
+    Test_Frame();
+
+    Test_Frame(const double theOrigin[3]);
+
+    void SetOrigin(const double theOrigin[3]);
+
+    void Origin(double theOrigin[3]) const;
+
+    void SetMatrix(const double theMatrix[3][3]);
+
+    void SetPoints(const Test_XYZ thePoints[2]);
+
+    static double Sum(const int theCount, const double theValues[]);
+
+    void SetFlags(const bool theFlags[2]);
+
+    double origin[3];
+
+    double matrix[3][3];
+
+    const int ids[2];
+
+    Test_Vector vectors[2];
+
+};
+
+
+/// Test function with a C array parameter
+inline double Test_Norm(const double theVector[3])
+{
+    return theVector[0];
+}
@@ -0,0 +1,23 @@
+
+class Test_Default
+{
+public:
+
+    // Should collapse into a single constructor
+    Test_Default(int a, double b = 1.0);
+
+    // Should collapse into a single binding
+    void Arithmetic(int a, double b = -1.0, bool c = true);
+
+    // Should fall back to a lambda for the class type default
+    void Mixed(int a, Test_Node node = Test_Node(), double b = 0.5);
+
+    // Should use nullptr for the null pointer
+    void Pointer(int a, Test_Node* node = 0);
+
+    // Should fall back to a lambda for the unqualified class member
+    void Member(int a = Value);
+
+    static const int Value = 1;
+
+};
@@ -0,0 +1,32 @@
+
+
+/// Test explorer of the current items
+class Test_Explorer
+{
+public:
+
+    Test_Explorer();
+
+    bool More() const;
+
+    void Next();
+
+    const Test_Vector& Current() const;
+
+};
+
+
+/// Test iterator of the keys of a map
+class Test_MapIterator
+{
+public:
+
+    Test_MapIterator();
+
+    bool More() const;
+
+    void Next();
+
+    const int& Key() const;
+
+};
@@ -0,0 +1,27 @@
+#include <Standard_Transient.hxx>
+
+
+/// Test transient base class with its own RTTI
+class Test_Geometry : public Standard_Transient
+{
+public:
+
+    Test_Geometry();
+
+    static const opencascade::handle<Standard_Type>& get_type_descriptor();
+
+    virtual const opencascade::handle<Standard_Type>& DynamicType() const;
+
+};
+
+
+/// Test transient class with a DownCast and the RTTI of its base
+class Test_Line : public Test_Geometry
+{
+public:
+
+    Test_Line();
+
+    opencascade::handle<Test_Geometry> Reversed() const;
+
+};
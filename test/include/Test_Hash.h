@@ -0,0 +1,66 @@
+#include <functional>
+
+
+/// Test class hashed by its hash code and compared with IsSame
+class Test_Key
+{
+public:
+
+    Test_Key();
+
+    int HashCode(const int theUpperBound) const;
+
+    bool IsSame(const Test_Key& theOther) const;
+
+    bool IsEqual(const Test_Key& theOther) const;
+
+};
+
+
+/// Test class with a std::hash specialization and an equality operator
+class Test_Label
+{
+public:
+
+    Test_Label();
+
+    bool operator==(const Test_Label& theOther) const;
+
+};
+
+namespace std
+{
+    template <>
+    struct hash<Test_Label>
+    {
+        size_t operator()(const Test_Label& theLabel) const;
+    };
+}
+
+
+/// Test class compared with a tolerance that can't be hashed
+class Test_Tolerant
+{
+public:
+
+    Test_Tolerant();
+
+    int HashCode(const int theUpperBound) const;
+
+    bool IsEqual(const Test_Tolerant& theOther, const double theTol) const;
+
+};
+
+
+/// Test class without hash support
+class Test_NoHash
+{
+public:
+
+    Test_NoHash();
+
+    std::size_t HashCode() const;
+
+    bool IsEqual(const Test_NoHash& theOther) const;
+
+};
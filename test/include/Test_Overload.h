@@ -0,0 +1,22 @@
+
+class Test_Overload
+{
+public:
+
+    Test_Overload(const Test_Node& node);
+
+    Test_Overload(double x, double y);
+
+    // Should be sorted as double, float, and Test_Node
+    void Set(const Test_Node& node);
+    void Set(double x);
+    void Set(float x);
+
+    // Should not be sorted
+    void Other();
+
+    // Should use noconvert and be sorted as bool and int
+    void Exact(int x);
+    void Exact(bool x);
+
+};
@@ -0,0 +1,72 @@
+
+/// Test class pickled by its constructor and getters
+class Test_Vector
+{
+public:
+
+    Test_Vector();
+
+    Test_Vector(const double theXv, const double theYv);
+
+    Test_Vector(const double theXv);
+
+    double X() const;
+
+    double Y() const;
+
+};
+
+
+/// Test class not pickled since its parameters match the same getter
+class Test_Range
+{
+public:
+
+    Test_Range(const double theUf, const double theUl);
+
+    double U() const;
+
+};
+
+
+/// Test aggregate pickled by its fields
+struct Test_Aggregate
+{
+    double x;
+    int n;
+    Test_Vector v;
+};
+
+
+/// Test aggregate with a field that can't be pickled
+struct Test_NoPickleField
+{
+    Test_XYZ xyz;
+};
+
+
+/// Test aggregate without pickle support
+struct Test_NoPickle
+{
+    double x;
+};
+
+
+/// Test class pickled by a serializer
+class Test_Shape
+{
+public:
+
+    Test_Shape();
+
+};
+
+
+/// Test structured record
+struct Test_Triangle
+{
+    int n1;
+    int n2;
+    int n3;
+    float weight;
+};
@@ -0,0 +1,48 @@
+
+/// Test sequence
+template<typename TheItemType>
+class Test_Sequence
+{
+public:
+
+    Test_Sequence<TheItemType>();
+
+    int Size() const;
+
+    void Append(Test_Sequence<TheItemType>& theOther);
+
+    void Append(const TheItemType& theItem);
+
+    const TheItemType* begin() const;
+
+    const TheItemType* end() const;
+
+};
+
+
+/// Test map
+template<typename TheKeyType, typename Hasher>
+class Test_Map
+{
+public:
+
+    Test_Map<TheKeyType, Hasher>();
+
+    // Should not be used to construct the map
+    bool Add(const TheKeyType& theKey, int theCount);
+
+    const TheKeyType* begin() const;
+
+    const TheKeyType* end() const;
+
+};
+
+typedef Test_Sequence<double> Test_SequenceOfReal;
+
+typedef Test_Sequence<Test_Pnt> Test_SequenceOfPnt;
+
+typedef Test_Sequence<Test_Curve> Test_SequenceOfCurve;
+
+typedef Test_Map<int, int> Test_MapOfInteger;
+
+typedef Test_Sequence<Test_Triangle> Test_SequenceOfTriangle;
@@ -0,0 +1,24 @@
+#include <TCollection_AsciiString.hxx>
+#include <TCollection_ExtendedString.hxx>
+
+
+/// Test class with string parameters and return types
+class Test_Named
+{
+public:
+
+    Test_Named();
+
+    Test_Named(const TCollection_AsciiString& theName);
+
+    const TCollection_AsciiString& Name() const;
+
+    void SetName(const TCollection_AsciiString& theName);
+
+    TCollection_ExtendedString Comment() const;
+
+    void SetComment(const TCollection_ExtendedString& theComment);
+
+    void Rename(TCollection_AsciiString& theName) const;
+
+};
@@ -7,3 +7,16 @@ public:
     Test_Template<T>();
 
 };
+
+typedef Test_Template<double> Test_TemplateDouble;
+
+
+/// Template not used by any typedef
+template<typename T>
+class Test_UnusedTemplate
+{
+public:
+
+    Test_UnusedTemplate<T>();
+
+};
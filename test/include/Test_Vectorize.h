@@ -0,0 +1,23 @@
+
+/// Test curve
+class Test_Curve
+{
+public:
+
+    Test_Curve();
+
+    Test_Pnt Value(const double U) const;
+
+    double Parameter(const Test_Pnt& P) const;
+
+    double Distance(const double U, const Test_Pnt& P) const;
+
+    void Evaluate(const double U, Test_Pnt& P) const;
+
+    bool IsClosed() const;
+
+    static double Length(const double U1, const double U2);
+
+};
+
+inline double Test_Curve_Span(const double U1, const double U2) { return U2 - U1; }
@@ -17,9 +17,40 @@
 # You should have received a copy of the GNU Lesser General Public
 # License along with this library; if not, write to the Free Software
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301 USA
+import gzip
+import json
+import os
+import subprocess
+import sys
 import unittest
 
-from pybinder.core import Generator
+from pybinder.core import Generator, implicit_targets, type_modules
+
+
+def generate(output_path, usage=None):
+    """
+    Generate the bindings of the test headers.
+    :param str output_path: Path to write the bindings.
+    :param str usage: The usage profile to prune the bindings to.
+    :return: The generator.
+    :rtype: pybinder.core.Generator
+    """
+    available_mods = {'Test', 'TestSplit', 'TestMiddle', 'TestReduce'}
+    inc = './include/'
+    gen = Generator(available_mods, inc)
+    gen.process_config('config.txt')
+    if usage is not None:
+        gen.process_usage(usage)
+    gen.parse('all_includes.h')
+    gen.dump_diagnostics(1)
+    gen.traverse()
+    gen.sort_binders()
+    gen.build_includes()
+    gen.build_imports()
+    gen.check_circular()
+    gen.bind_templates(output_path)
+    gen.bind(output_path)
+    return gen
 
 
 class TestBinder(unittest.TestCase):
@@ -32,23 +63,17 @@ class TestBinder(unittest.TestCase):
         """
         Set up the tests by parsing the header.
         """
-        available_mods = {'Test', 'TestSplit'}
-        inc = './include/'
-        output_path = './output'
-        gen = Generator(available_mods, inc)
-        gen.process_config('config.txt')
-        gen.parse('all_includes.h')
-        gen.dump_diagnostics(1)
-        gen.traverse()
-        gen.sort_binders()
-        gen.build_includes()
-        gen.build_imports()
-        gen.check_circular()
-        gen.bind_templates(output_path)
-        gen.bind(output_path)
+        cls.gen = generate('./output')
 
     def test_compare_output(self):
-        for filename in ('Test.cxx', 'bind_Test_Template.hxx'):
+        for filename in ('Test.cxx', 'bind_Test_Template.hxx',
+                         'bind_Test_Array1.hxx', 'bind_Test_Array2.hxx',
+                         'pyOCCT_Buffer.hxx', 'pyOCCT_Strings.hxx',
+                         'pyOCCT_Downcast.hxx', 'pyOCCT_Serialize.hxx',
+                         'OCCT.cxx', 'pyOCCT_Monolithic.hxx',
+                         'pyOCCT_Visibility.hxx', 'pyOCCT_Build.json',
+                         'exports/OCCT.map', 'pyOCCT_Profile.hxx',
+                         'pyOCCT_Calls.hxx'):
             with open(f'output/{filename}') as f1:
                 with open(f'expected/{filename}') as f2:
                     for l1, l2 in zip(f1, f2):
@@ -61,6 +86,125 @@ class TestBinder(unittest.TestCase):
                     for l1, l2 in zip(f1, f2):
                         self.assertEqual(l1, l2)
 
+    def test_compare_instances(self):
+        for filename in ('instances/bind_Test_Template.cxx',):
+            with open(f'output/{filename}') as f1:
+                with open(f'expected/{filename}') as f2:
+                    for l1, l2 in zip(f1, f2):
+                        self.assertEqual(l1, l2)
+
+    def test_compare_imports(self):
+        for filename in ('TestMiddle.cxx', 'TestReduce.cxx'):
+            with open(f'output/{filename}') as f1:
+                with open(f'expected/{filename}') as f2:
+                    for l1, l2 in zip(f1, f2):
+                        self.assertEqual(l1, l2)
+
+    def test_package_init(self):
+        # Not written with the monolithic extension of the test configuration
+        self.assertFalse(os.path.exists('output/__init__.py'))
+        self.gen.bind_package_init('./output/package')
+        with open('output/package/__init__.py') as f1:
+            with open('expected/package/__init__.py') as f2:
+                for l1, l2 in zip(f1, f2):
+                    self.assertEqual(l1, l2)
+
+    def test_usage_closure(self):
+        kept, unused = self.gen.usage_closure(['Test_Line::Reversed',
+                                               'Test_Array1OfReal'])
+        # Base classes and the template of a used typedef are kept
+        for qname in ('Test_Line', 'Test_Geometry', 'Test_Array1OfReal',
+                      'Test_Array1<TheItemType>'):
+            self.assertIn(qname, kept)
+        self.assertNotIn('Test_Curve', kept)
+        self.assertNotIn('Test_Array2OfPnt', kept)
+        # Only the used members of the classes are bound
+        self.assertIn('Test_Line::Test_Line', unused)
+        self.assertNotIn('Test_Line::Reversed', unused)
+
+    def test_template_owner(self):
+        # TestSplit owns the specialization since TestReduce depends on it.
+        # TestMiddle is not related so it binds its own module local copy.
+        with open('output/TestSplit_2.cxx') as f:
+            self.assertIn('bind_Test_Template<int>(mod, "TestSplit_TemplateInt", '
+                          'py::module_local(false));', f.read())
+        with open('output/TestMiddle.cxx') as f:
+            self.assertIn('bind_Test_Template<int>(mod, "TestMiddle_TemplateInt", '
+                          'py::module_local());', f.read())
+        with open('output/TestReduce.cxx') as f:
+            self.assertIn('mod.attr("TestReduce_TemplateInt") = '
+                          'pyOCCT_Import("TestSplit").attr("TestSplit_TemplateInt");',
+                          f.read())
+
+    def test_enum_imports(self):
+        # Enums returned from another module are imported lazily
+        with open('output/TestReduce.cxx') as f:
+            self.assertIn('&TestReduce_Class::Mode, "", '
+                          'py::call_guard<pyOCCT_CallCounter<pyOCCT_Calls_TestReduce, 3>, '
+                          'ImportTestSplit>());', f.read())
+        # Enum fields and default values use the same modules eagerly
+        cls = [b for b in self.gen.get_module('TestReduce').types
+               if b.qualified_name == 'TestReduce_Class'][0]
+        method = [b for b in cls.methods if b.spelling == 'Mode'][0]
+        self.assertEqual(type_modules(method.rtype), {'TestSplit'})
+
+    def test_explorer_imports(self):
+        # Explorers of items from a lazily imported module import it first
+        with open('output/TestReduce.cxx') as f:
+            src = f.read()
+        for name in ['__next__', 'collect']:
+            self.assertRegex(src, r'cls_TestReduce_Explorer\.def\("{}".*'
+                                  r'ImportTestSplit>\(\)\);'.format(name))
+
+    def test_dtype_owner(self):
+        # The dtype is only registered by the module binding the class globally
+        with open('output/Test.cxx') as f:
+            self.assertIn('PYBIND11_NUMPY_DTYPE(Test_Triangle,', f.read())
+        with open('output/TestMiddle.cxx') as f:
+            self.assertNotIn('PYBIND11_NUMPY_DTYPE', f.read())
+
+    def test_implicit_targets(self):
+        line = ('py::implicitly_convertible<std::pair<int, double>, '
+                'Test_Array1<std::pair<int, double> >>();')
+        self.assertEqual(implicit_targets(line),
+                         ['Test_Array1<std::pair<int,double>>'])
+        self.assertIn('Test_Node', Generator.implicit_types)
+
+    def test_docs_index(self):
+        with gzip.open('output/_docs.json.gz', 'rt') as f:
+            index = json.load(f)
+        docs = index['TestReduce']
+        self.assertEqual(docs['TestReduce_Class.Scale'], 'Scale the values')
+        self.assertNotIn('TestReduce_Class.Fill', docs)
+        self.assertNotIn('Test', index)
+
+    def test_pruned_templates(self):
+        self.assertTrue(os.path.exists('output/bind_Test_Template.hxx'))
+        self.assertFalse(os.path.exists('output/bind_Test_UnusedTemplate.hxx'))
+
+
+class TestUsage(unittest.TestCase):
+    """
+    Tests for pruning the bindings to a usage profile.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Set up the tests by generating the bindings in another process since
+        the generator state is shared.
+        """
+        subprocess.run([sys.executable, '-c',
+                        'from test_pybinder import generate; '
+                        'generate("./output/usage", "usage.txt")'],
+                       check=True)
+
+    def test_compare_output(self):
+        for filename in ('Test.cxx', 'TestReduce.cxx'):
+            with open(f'output/usage/{filename}') as f1:
+                with open(f'expected/usage/{filename}') as f2:
+                    self.assertEqual(f1.read(), f2.read())
+
 
 if __name__ == '__main__':
     unittest.main()